@@ -0,0 +1,103 @@
+from tpu import bank_bits, word_dtype, CONFIG
+import numpy as np
+
+# Backdoor access to the memory and state of a simulated tpu, the same calls as
+# pyTpu.load_bank/dump_bank/snapshot/restore:
+#   SimBackdoor     an amaranth testbench: ctx.set/ctx.get on dut.memory, mp, ...
+#   CocotbBackdoor  a cocotb tb (test/tb.v): the m_{i}, mp, ... regs of its user_project instance
+# Loading a bank replaces the SETMP and n*n WRITEs that put a tile on chip, dumping it the
+# READs that check it, a snapshot taken anywhere restores into any of the three, so a test can
+# set up once and fork from the checkpoint. The multi-cycle MATMUL engine (busy, step,
+# engine_sel, engine_acc) is part of the state. Only the RTL has these names, not a gate level netlist.
+
+ENGINE = ("busy", "step", "engine_sel", "engine_acc")
+
+def engine_regs(engine, banks):
+    # snapshot engine dict -> (busy, step, engine_sel, engine_acc), engine_sel is C, B, A from bit 0
+    if engine is None:
+        return 0, 0, 0, 0
+    w = bank_bits(banks)
+    return 1, engine["step"], engine["c"] | engine["b"] << w | engine["a"] << 2*w, int(engine["accumulate"])
+
+def engine_state(busy, step, engine_sel, engine_acc, banks):
+    if not busy:
+        return None
+    w, mask = bank_bits(banks), banks - 1
+    return {"a": engine_sel >> 2*w & mask, "b": engine_sel >> w & mask, "c": engine_sel & mask,
+            "accumulate": bool(engine_acc), "step": step}
+
+class Backdoor:
+    # subclasses provide get(name, index=None) and set(name, value, index=None) on the dut's
+    # registers, index picks a memory word
+    def __init__(self, config) -> None:
+        self.config = tuple(config)
+        self.n, self.banks, self.acc_width, self.matmul_cycles = self.config
+        self.size = self.n*self.n
+
+    def load_bank(self, bank, tile):
+        assert 0 <= bank < self.banks, f"no bank {bank}"
+        mask = (1 << self.acc_width) - 1
+        for i, value in enumerate(np.asarray(tile).reshape(self.size).tolist()):
+            self.set("memory", int(value) & mask, bank*self.size + i)
+
+    def dump_bank(self, bank):
+        assert 0 <= bank < self.banks, f"no bank {bank}"
+        words = [self.get("memory", bank*self.size + i) for i in range(self.size)]
+        return np.array(words, dtype=word_dtype(self.acc_width)).reshape(self.n, self.n)
+
+    def snapshot(self):
+        engine = None
+        if self.matmul_cycles > 1:
+            engine = engine_state(*(self.get(name) for name in ENGINE), self.banks)
+        return {"config": self.config,
+                "memory": np.array([self.get("memory", i) for i in range(self.banks*self.size)],
+                                   dtype=word_dtype(self.acc_width)),
+                "mp": self.get("mp"), "output": self.get("output"), "uio_out": self.get("uio_out"),
+                "uio_oe": self.get("uio_oe"), "engine": engine}
+
+    def restore(self, state):
+        assert tuple(state["config"]) == self.config, f"snapshot of {tuple(state['config'])} on {self.config}"
+        for i, value in enumerate(np.asarray(state["memory"]).tolist()):
+            self.set("memory", int(value), i)
+        for name in ("mp", "output", "uio_out", "uio_oe"):
+            self.set(name, int(state[name]))
+        if self.matmul_cycles > 1:
+            for name, value in zip(ENGINE, engine_regs(state["engine"], self.banks)):
+                self.set(name, value)
+        else:
+            assert state["engine"] is None, "a single cycle MATMUL has no engine state"
+
+class SimBackdoor(Backdoor):
+    # ctx: the context of an amaranth testbench driving dut (a tpu)
+    def __init__(self, ctx, dut) -> None:
+        super().__init__((dut.n, dut.banks, dut.acc_width, dut.matmul_cycles))
+        self.ctx = ctx
+        self.signals = {"memory": dut.memory, "mp": dut.mp, "output": dut.output, "uio_out": dut.uio_out,
+                        "uio_oe": dut.uio_oe, "busy": dut.busy, "step": dut.step, "engine_sel": dut.engine_sel,
+                        "engine_acc": dut.engine_acc}
+
+    def get(self, name, index=None):
+        signal = self.signals[name] if index is None else self.signals[name][index]
+        return int(self.ctx.get(signal))
+
+    def set(self, name, value, index=None):
+        self.ctx.set(self.signals[name] if index is None else self.signals[name][index], value)
+
+class CocotbBackdoor(Backdoor):
+    # dut: the cocotb handle of test/tb.v, the design is its `instance`. Values set land before
+    # the next clock edge, get() sees a clock edge's result once the clock has fallen again
+    # (FallingEdge), like CocotbBackend samples outputs
+    NAMES = {"output": "uo_out"}
+
+    def __init__(self, dut, config=CONFIG, instance="user_project") -> None:
+        super().__init__(config)
+        self.top = getattr(dut, instance)
+
+    def handle(self, name, index=None):
+        return getattr(self.top, f"m_{index}" if name == "memory" else self.NAMES.get(name, name))
+
+    def get(self, name, index=None):
+        return int(self.handle(name, index).value)
+
+    def set(self, name, value, index=None):
+        self.handle(name, index).value = value
@@ -0,0 +1,296 @@
+from tpu import op, pyTpu, tpu, dual_issue, OP_TABLE, DUAL_TABLE, CONFIG, pack_program
+from amaranth.sim import Simulator
+from collections import deque
+import argparse
+import asyncio
+import os
+import termios
+import threading
+import time
+import tty
+import numpy as np
+
+# Async host driver. Callers submit whole instruction batches and await the output bytes
+# (uo_out after every READ and SUM, uo_out then uio_out for READ2, like pyTpu.run), the same
+# code drives every backend:
+#   PyTpuBackend   the python model
+#   SimBackend     the amaranth simulation of tpu, kept running between batches
+#   CocotbBackend  a cocotb dut (test/test.py), awaited from a cocotb test
+#   SerialBackend  a dev board on a serial port streaming pairs in and outputs back,
+#                  SerialBoard stands in for it behind a local pty
+# A backend has `async send(program)` and `async receive(count)`. submit() sends a batch and
+# returns without waiting for its outputs, so later batches go out while earlier outputs are
+# still coming back, up to `depth` batches in flight. The driver only awaits backend coroutines,
+# nothing from asyncio, so it runs under asyncio and under cocotb's scheduler alike.
+# The chip only samples uo_out in the cycle after a READ, a backend reads the outputs after
+# the clock edge of the instruction, never at a fixed offset the host has to track.
+# Between batches the chip may see NOOP cycles, like a free running clock waiting for the host.
+
+def output_counts(program, config=CONFIG):
+    # output bytes of every instruction of a (cycles, 2) uint8 program
+    ops = OP_TABLE[program[:, 0]]
+    dual = DUAL_TABLE[program[:, 0]] != op.NOOP if dual_issue(*config[:2]) else np.zeros(len(program), dtype=bool)
+    # a SUM under a dual issued op is dropped with the other compute ops
+    return (np.isin(ops, [op.READ, op.READ2]) | ((ops == op.SUM) & ~dual)).astype(np.int64) + (ops == op.READ2)
+
+def as_program(program):
+    # [(op, uio_in), ...], packed bytes or a uint8 array -> (cycles, 2) uint8 array
+    if isinstance(program, (list, tuple)):
+        program = pack_program(program)
+    if isinstance(program, (bytes, bytearray, memoryview)):
+        program = np.frombuffer(program, dtype=np.uint8)
+    return np.asarray(program, dtype=np.uint8).reshape(-1, 2)
+
+class Batch:
+    def __init__(self, count) -> None:
+        self.count = count # output bytes
+        self.outputs = None # uint8 array once received
+
+    @property
+    def done(self):
+        return self.outputs is not None
+
+class TpuDriver:
+    def __init__(self, backend, depth=4) -> None:
+        self.backend = backend
+        self.config = backend.config
+        self.depth = depth
+        self.in_flight = deque() # sent batches whose outputs haven't been received, oldest first
+        self.instructions = 0
+        self.batches = 0
+
+    async def submit(self, program):
+        # sends a batch, returns its Batch handle without waiting for the outputs
+        program = as_program(program)
+        while len(self.in_flight) >= self.depth:
+            await self.collect(self.in_flight[0])
+        batch = Batch(int(output_counts(program, self.config).sum()))
+        await self.backend.send(program)
+        self.in_flight.append(batch)
+        self.instructions += len(program)
+        self.batches += 1
+        return batch
+
+    async def collect(self, batch):
+        # outputs are received in order, so everything sent before `batch` is received with it
+        while not batch.done:
+            oldest = self.in_flight.popleft()
+            oldest.outputs = await self.backend.receive(oldest.count)
+        return batch.outputs
+
+    async def run(self, program):
+        return await self.collect(await self.submit(program))
+
+    async def map(self, programs):
+        # outputs of every batch, keeping `depth` of them in flight
+        batches = [await self.submit(program) for program in programs]
+        return [await self.collect(batch) for batch in batches]
+
+    async def close(self):
+        for batch in list(self.in_flight):
+            await self.collect(batch)
+        await self.backend.close()
+
+class PyTpuBackend:
+    def __init__(self, config=CONFIG, model=None) -> None:
+        self.config = config
+        self.model = model or pyTpu(*config)
+        self.outputs = bytearray()
+
+    async def send(self, program):
+        self.outputs.extend(self.model.run(program).tobytes())
+
+    async def receive(self, count):
+        assert len(self.outputs) >= count, f"{count} outputs expected, {len(self.outputs)} produced"
+        outputs = np.frombuffer(bytes(self.outputs[:count]), dtype=np.uint8)
+        del self.outputs[:count]
+        return outputs
+
+    async def close(self):
+        pass
+
+class SimBackend(PyTpuBackend):
+    # one Simulator for the life of the backend, its testbench runs NOOPs whenever no batch is pending.
+    # send() hands the event loop back every `yield_every` simulator steps, so other coroutines (and
+    # other sends, queued behind the pending instructions) run while a long batch is simulated
+    def __init__(self, config=CONFIG, period=1e-6, yield_every=256) -> None:
+        self.config = config
+        self.yield_every = yield_every
+        self.dut = tpu(*config)
+        self.pending = deque() # (ui_in, uio_in, output bytes)
+        self.outputs = bytearray()
+        self.queued = 0 # instructions sent so far
+        self.executed = 0 # and those whose outputs are in
+        self.sim = Simulator(self.dut)
+        self.sim.add_clock(period)
+        self.sim.add_testbench(self.testbench, background=True)
+
+    async def testbench(self, ctx):
+        while True:
+            queued = bool(self.pending)
+            ui_in, uio_in, count = self.pending.popleft() if queued else (0, 0, 0)
+            ctx.set(self.dut.input, ui_in)
+            ctx.set(self.dut.input2, uio_in)
+            await ctx.tick()
+            if count:
+                self.outputs.append(ctx.get(self.dut.output))
+            if count == 2:
+                self.outputs.append(ctx.get(self.dut.uio_out))
+            self.executed += queued
+
+    async def send(self, program):
+        counts = output_counts(program, self.config)
+        self.pending.extend(zip(program[:, 0].tolist(), program[:, 1].tolist(), counts.tolist()))
+        self.queued += len(program)
+        last = self.queued
+        steps = 0
+        while self.executed < last:
+            self.sim.advance()
+            steps += 1
+            if steps % self.yield_every == 0:
+                await asyncio.sleep(0)
+
+class CocotbBackend(PyTpuBackend):
+    # test/tb.v signals, every instruction is latched by the next rising edge and its outputs are
+    # read at the falling edge after it, where the next instruction is set
+    def __init__(self, dut, config=CONFIG) -> None:
+        self.config = config
+        self.dut = dut
+        self.outputs = bytearray()
+
+    async def send(self, program):
+        from cocotb.triggers import FallingEdge, RisingEdge
+        for (ui_in, uio_in), count in zip(program.tolist(), output_counts(program, self.config).tolist()):
+            self.dut.ui_in.value = ui_in
+            self.dut.uio_in.value = uio_in
+            await RisingEdge(self.dut.clk)
+            await FallingEdge(self.dut.clk)
+            if count:
+                self.outputs.append(int(self.dut.uo_out.value))
+            if count == 2:
+                self.outputs.append(int(self.dut.uio_out.value))
+        self.dut.ui_in.value = 0
+        self.dut.uio_in.value = 0
+
+def raw_port(fd, baudrate=None):
+    # no echo, no line editing, no newline translation
+    tty.setraw(fd)
+    if baudrate:
+        attributes = termios.tcgetattr(fd)
+        attributes[4] = attributes[5] = getattr(termios, f"B{baudrate}")
+        termios.tcsetattr(fd, termios.TCSANOW, attributes)
+
+class SerialBackend:
+    # the board reads (ui_in, uio_in) pairs and writes back every output byte in order
+    def __init__(self, port, config=CONFIG, baudrate=None) -> None:
+        self.config = config
+        self.fd = os.open(port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        raw_port(self.fd, baudrate)
+        self.received = bytearray()
+
+    def drain(self):
+        # everything the board has sent so far, so it never blocks on a full buffer while we write
+        try:
+            while data := os.read(self.fd, 4096):
+                self.received.extend(data)
+        except BlockingIOError:
+            pass
+
+    async def wait(self, write=False):
+        # until the port is readable, or writable when write is set
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        wake = lambda: ready.done() or ready.set_result(None)
+        loop.add_reader(self.fd, wake)
+        if write:
+            loop.add_writer(self.fd, wake)
+        try:
+            await ready
+        finally:
+            loop.remove_reader(self.fd)
+            if write:
+                loop.remove_writer(self.fd)
+
+    async def send(self, program):
+        data = memoryview(program.tobytes())
+        while data:
+            self.drain()
+            try:
+                data = data[os.write(self.fd, data):]
+            except BlockingIOError:
+                await self.wait(write=True)
+
+    async def receive(self, count):
+        self.drain()
+        while len(self.received) < count:
+            await self.wait()
+            self.drain()
+        outputs = np.frombuffer(bytes(self.received[:count]), dtype=np.uint8)
+        del self.received[:count]
+        return outputs
+
+    async def close(self):
+        os.close(self.fd)
+
+class SerialBoard:
+    # a dev board running pyTpu behind a pty, port is the path SerialBackend opens
+    def __init__(self, config=CONFIG) -> None:
+        self.model = pyTpu(*config, strict=False)
+        self.master, slave = os.openpty()
+        raw_port(slave)
+        self.port = os.ttyname(slave)
+        self.slave = slave # kept open so the pty survives the host closing and reopening the port
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        pending = b""
+        while True:
+            try:
+                data = os.read(self.master, 4096)
+            except OSError:
+                return # closed
+            if not data:
+                return
+            pending += data
+            whole = len(pending) & ~1
+            outputs = self.model.run(pending[:whole]).tobytes()
+            pending = pending[whole:]
+            while outputs:
+                outputs = outputs[os.write(self.master, outputs):]
+
+    def close(self):
+        os.close(self.slave)
+        os.close(self.master)
+
+async def bench(batches=64, size=1024, depth=4):
+    # instructions/s of every in-process backend and the pty board, random READ/WRITE/compute batches
+    rng = np.random.default_rng(0)
+    programs = [np.stack([rng.integers(0, 16, size), rng.integers(0, 256, size)], axis=1).astype(np.uint8)
+                for _ in range(batches)]
+    board = SerialBoard()
+    # random streams break the strict rules (READ2, dual issue), the model runs them like the chip
+    backends = [("pyTpu", lambda: PyTpuBackend(model=pyTpu(*CONFIG, strict=False)), programs), ("serial pty", lambda: SerialBackend(board.port), programs),
+                ("amaranth sim", lambda: SimBackend(), programs[:2])]
+    table = []
+    for name, backend, batch in backends:
+        driver = TpuDriver(backend(), depth)
+        start = time.perf_counter()
+        await driver.map(batch)
+        await driver.close()
+        table.append((name, driver.instructions/(time.perf_counter() - start)))
+    board.close()
+    return table
+
+if __name__ == "__main__":
+    import tabulate
+    parser = argparse.ArgumentParser(description="TpuDriver throughput, or a pty board to drive by hand")
+    parser.add_argument("--serve", action="store_true", help="run a SerialBoard and print its port")
+    parser.add_argument("--depth", type=int, default=4)
+    args = parser.parse_args()
+    if args.serve:
+        board = SerialBoard()
+        print(board.port)
+        board.thread.join()
+    else:
+        print(tabulate.tabulate(asyncio.run(bench(depth=args.depth)), headers=["backend", "instructions/s"], floatfmt=".0f"))
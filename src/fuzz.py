@@ -0,0 +1,136 @@
+from tpu import op, pyTpu, tpu, OP_TABLE, DUAL_TABLE, DUAL_OPS, PROFILES
+from amaranth.sim import Simulator
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import os
+import numpy as np
+
+# Differential fuzzer: random (ui_in, uio_in) streams run in lockstep through pyTpu and the
+# Amaranth simulation of tpu, memory, mp, uo_out and uio_out/oe are compared after every clock.
+# Building a Simulator takes seconds, so every shard builds one and runs all of its
+# programs (and the shrinking of failures) in the same testbench, resetting the state in between.
+
+def random_program(rng, length, size=64):
+    # mostly valid ops, some with a compute op dual issued in the upper nibble, sometimes junk
+    # in the upper nibble or an unused opcode,
+    # SETMP mostly inside the `size` words of memory but also near the 8-bit wraparound
+    ui_in = rng.integers(0, len(op), size=length)
+    dual = rng.random(length) < 0.1
+    ui_in[dual] |= 0x80 | rng.integers(0, len(DUAL_OPS), size=dual.sum()) << 4
+    junk = rng.random(length) < 0.1
+    ui_in[junk] = rng.integers(0, 256, size=junk.sum())
+    uio_in = rng.integers(0, 256, size=length)
+    setmp = (ui_in & 0x0f) == op.SETMP
+    low = rng.random(length) < 0.8
+    uio_in[setmp & low] = rng.integers(0, size, size=(setmp & low).sum())
+    return list(zip(ui_in.tolist(), uio_in.tolist()))
+
+def compare(model, memory, mp, output, uio_out, uio_oe):
+    diff = {}
+    if model.memory != memory:
+        diff["memory"] = [(i, m, h) for i, (m, h) in enumerate(zip(model.memory, memory)) if m != h]
+    if model.mp != mp:
+        diff["mp"] = (model.mp, mp)
+    if model.output != output:
+        diff["output"] = (model.output, output)
+    if model.uio_out != uio_out:
+        diff["uio_out"] = (model.uio_out, uio_out)
+    if model.uio_oe != uio_oe:
+        diff["uio_oe"] = (model.uio_oe, uio_oe)
+    return diff
+
+async def first_mismatch(ctx, dut, program, model=pyTpu):
+    # (cycle, {field: model vs hardware}) of the first divergence, or None,
+    # the model is built with the configuration of the dut and doesn't assert the programming rules
+    for signal in [*dut.memory, dut.mp, dut.output, dut.uio_out, dut.uio_oe, dut.busy, dut.step]:
+        ctx.set(signal, 0)
+    tpu_ = model(dut.n, dut.banks, dut.acc_width, dut.matmul_cycles, strict=False, ops=dut.ops)
+    for n, (ui_in, uio_in) in enumerate(program):
+        ctx.set(dut.input, ui_in)
+        ctx.set(dut.input2, uio_in)
+        await ctx.tick()
+        tpu_.execute(op(OP_TABLE[ui_in]), uio_in, op(DUAL_TABLE[ui_in]))
+        diff = compare(tpu_, [ctx.get(m) for m in dut.memory], ctx.get(dut.mp), ctx.get(dut.output),
+                       ctx.get(dut.uio_out), ctx.get(dut.uio_oe))
+        if diff:
+            return n, diff
+    return None
+
+async def shrink(ctx, dut, program, model=pyTpu):
+    # cut everything after the failure, then ddmin style chunk removal,
+    # then simplify the remaining instructions one field at a time
+    n, _ = await first_mismatch(ctx, dut, program, model)
+    program = program[:n+1]
+    chunk = max(len(program) // 2, 1)
+    while True:
+        i = 0
+        while i < len(program):
+            candidate = program[:i] + program[i+chunk:]
+            if candidate and await first_mismatch(ctx, dut, candidate, model):
+                program = candidate
+            else:
+                i += chunk
+        if chunk == 1:
+            break
+        chunk //= 2
+    for i in range(len(program)):
+        for simplify in (lambda ui_in, uio_in: (ui_in & 0x0f, uio_in), lambda ui_in, uio_in: (ui_in, 0)):
+            simpler = simplify(*program[i])
+            candidate = program[:i] + [simpler] + program[i+1:]
+            if simpler != program[i] and await first_mismatch(ctx, dut, candidate, model):
+                program = candidate
+    n, diff = await first_mismatch(ctx, dut, program, model)
+    return program, n, diff
+
+def fuzz_shard(seed, count, length, model=pyTpu, config=(4, 4, 8, 1), ops=None):
+    # config: (n, banks, acc_width, matmul_cycles) of both the dut and the model, ops their build profile
+    dut = tpu(*config, ops=ops)
+    rng = np.random.default_rng(seed)
+    programs = [random_program(rng, length, len(dut.memory)) for _ in range(count)]
+    failures = []
+    sim = Simulator(dut)
+    sim.add_clock(1e-6)
+
+    async def test_bench(ctx):
+        for program in programs:
+            if await first_mismatch(ctx, dut, program, model):
+                shrunk, n, diff = await shrink(ctx, dut, program, model)
+                failures.append({"seed": seed, "program": program, "shrunk": shrunk, "cycle": n, "diff": diff})
+
+    sim.add_testbench(test_bench)
+    sim.run()
+    return failures
+
+def fuzz(programs=1000, length=32, seed=0, workers=None, shard_size=100, model=pyTpu, config=(4, 4, 8, 1), ops=None):
+    # shards are independent (seed + shard index), so results don't depend on the worker count
+    shards = [(seed + n, min(shard_size, programs - start), length, model, config, ops)
+              for n, start in enumerate(range(0, programs, shard_size))]
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        results = [fuzz_shard(*shard) for shard in shards]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(fuzz_shard, *zip(*shards)))
+    return [failure for result in results for failure in result]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="differential fuzzing of pyTpu against the amaranth simulation")
+    parser.add_argument("--programs", type=int, default=1000)
+    parser.add_argument("--length", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shard-size", type=int, default=100)
+    parser.add_argument("--n", type=int, default=4, help="matrix size")
+    parser.add_argument("--banks", type=int, default=4)
+    parser.add_argument("--acc-width", type=int, default=8)
+    parser.add_argument("--matmul-cycles", type=int, default=1)
+    parser.add_argument("--profile", choices=list(PROFILES), default="full", help="build profile of the dut")
+    args = parser.parse_args()
+    failures = fuzz(args.programs, args.length, args.seed, args.workers, args.shard_size,
+                    config=(args.n, args.banks, args.acc_width, args.matmul_cycles), ops=PROFILES[args.profile])
+    for failure in failures:
+        print(f"seed {failure['seed']} cycle {failure['cycle']}: {failure['diff']}")
+        for ui_in, uio_in in failure["shrunk"]:
+            print(f"    {op(OP_TABLE[ui_in]).name:<6} ui_in=0x{ui_in:02x} uio_in=0x{uio_in:02x}")
+    print(f"{len(failures)} failures in {args.programs} programs")
+    assert not failures
@@ -0,0 +1,299 @@
+from tpu import op, pyTpu, pack_banks, pack_dual, pack_program, bank_tables, dual_banks, dual_issue, op_accesses, uses_uio, OP_TABLE, DUAL_TABLE
+from bisect import bisect_right
+import numpy as np
+
+# Host side tiled GEMM for the n x n MATMUL op (4x4 by default).
+# a (M, K) @ b (K, N) is cut into n x n tiles, every (i, j, k) tile product is one MATMUL
+# on chip. The partial products are either read back and summed on the host, mod 256 like
+# the chip, or accumulated on chip with MATMUL_ACC and read back once per result tile.
+# Loading a tile costs 16 WRITEs (8 WRITE2 if it fits in 4 bits) over uio_in, so banks are treated as a 4 entry cache
+# keyed by tile content and evicted with Belady's rule (the whole schedule is known up front).
+# A candidate schedule lays the tiles out for dual issue, so a MATMUL rides on the first
+# WRITE of the next B tile instead of taking its own cycle.
+
+N = 4 # default tile size and bank count, any tpu configuration works with n= and banks=
+BANKS = 4
+LOOP_ORDERS = ["ijk", "ikj", "jik", "jki", "kij", "kji"]
+DUAL_LAYOUT = {"a": (2, 0, 3, 1), "b": (0, 1, 2, 3), "c": (3, 1, 2, 0)} # bank preference of every operand
+
+def tiles(x, n=N):
+    # pad to a multiple of n and split into a [row][col] grid of n x n uint8 tiles
+    x = np.asarray(x, dtype=np.int64) % 256
+    rows, cols = -(-x.shape[0] // n), -(-x.shape[1] // n)
+    padded = np.zeros((rows*n, cols*n), dtype=np.uint8)
+    padded[:x.shape[0], :x.shape[1]] = x
+    return padded.reshape(rows, n, cols, n).swapaxes(1, 2)
+
+def schedule(ti, tj, tk, order):
+    # all tile products in a given loop order, inner loops snake so that
+    # consecutive products share a tile across loop boundaries
+    sizes = {"i": ti, "j": tj, "k": tk}
+    steps = []
+    for outer in range(sizes[order[0]]):
+        middle = range(sizes[order[1]])
+        if outer % 2: middle = reversed(middle)
+        for n_middle, mid in enumerate(middle):
+            inner = range(sizes[order[2]])
+            if (outer*sizes[order[1]] + n_middle) % 2: inner = reversed(inner)
+            for inn in inner:
+                index = dict(zip(order, (outer, mid, inn)))
+                steps.append((index["i"], index["j"], index["k"]))
+    return steps
+
+class GemmProgram:
+    # burst: READ2 for results and WRITE2 for tiles that fit in 4 bits
+    # matmul_cycles: latency of the MATMUL engine, the program waits for it with NOOPs
+    # read_bytes: low bytes of every result word read back, byte selected READs of acc_width > 8 words
+    def __init__(self, shape, burst=True, n=N, banks=BANKS, matmul_cycles=1, read_bytes=1) -> None:
+        self.shape = shape
+        self.burst = burst and n*n % 2 == 0 # bursts move whole tiles two words at a time
+        self.n = n
+        self.banks = banks
+        self.matmul_cycles = matmul_cycles
+        self.read_bytes = read_bytes
+        self.order = None # loop order of the schedule
+        self.instructions = [] # (op, uio_in)
+        self.blocks = [] # result tile (i, j) of every n*n bytes read back, in order
+        self.bank = [None]*banks # tile key held by every bank
+        self.mp = 0
+
+    def setmp(self, address):
+        if self.mp != address:
+            self.instructions.append((op.SETMP, address))
+            self.mp = address
+
+    def load(self, bank, key, tile):
+        self.setmp(bank*self.n*self.n)
+        values = tile.flatten().tolist()
+        if self.burst and max(values) < 16:
+            for low, high in zip(values[0::2], values[1::2]):
+                self.instructions.append((op.WRITE2, low | (high << 4)))
+        else:
+            for value in values:
+                self.instructions.append((op.WRITE, value))
+        self.mp = (self.mp + self.n*self.n) % 256
+        self.bank[bank] = key
+
+    def matmul(self, a, b, c, accumulate=False):
+        self.instructions.append((op.MATMUL_ACC if accumulate else op.MATMUL, pack_banks(a, b, c, self.banks)))
+        # the next load or readback would need uio[0] or touch the banks of the engine
+        self.instructions += [(op.NOOP, 0)]*(self.matmul_cycles if self.matmul_cycles > 1 else 0)
+
+    def readback(self, c, block):
+        # READ2 has no byte select, wider reads are byte selected READs
+        burst = self.burst and self.read_bytes == 1
+        for byte in range(self.read_bytes):
+            self.setmp(c*self.n*self.n)
+            for _ in range(self.n*self.n // 2 if burst else self.n*self.n):
+                self.instructions.append((op.READ2 if burst else op.READ, byte))
+            self.mp = (self.mp + self.n*self.n) % 256
+        self.blocks.append(block)
+
+    def fuse_dual(self):
+        # fold every MATMUL into the host op right after it (past SETMPs) when that op streams
+        # the bank whose dual_banks are the MATMUL's, saving its cycle. Only SETMPs sit in
+        # between, so nothing reads C before it is written one instruction later
+        if not dual_issue(self.n, self.banks) or self.matmul_cycles != 1:
+            return
+        n, bank_A, bank_B, bank_C = self.n, *bank_tables(self.n, self.banks)
+        fused, mp = [], 0
+        pending = None # (index, op, uio_in) of a MATMUL waiting for a host op
+        for current_op, arg in self.instructions:
+            if pending and current_op in (op.WRITE, op.READ, op.WRITE2, op.READ2):
+                _, (matmul, banks_arg) = pending
+                banks = [bank_A[banks_arg], bank_B[banks_arg], bank_C[banks_arg]]
+                reads, writes = op_accesses(matmul, *banks, mp, n, self.banks)
+                host = op_accesses(current_op, 0, 0, 0, mp, n, self.banks)
+                if banks == dual_banks(mp, n, self.banks) and not set(host[0] + host[1]) & set(reads + writes):
+                    current_op, pending = pack_dual(current_op, matmul), None
+            if pending and current_op != op.SETMP:
+                fused.insert(*pending)
+                pending = None
+            if current_op in (op.MATMUL, op.MATMUL_ACC):
+                pending = (len(fused), (current_op, arg))
+                continue
+            fused.append((current_op, arg))
+            match int(OP_TABLE[int(current_op)]): # a numpy int is slow to compare with op
+                case op.SETMP: mp = arg
+                case op.WRITE | op.READ: mp = (mp + 1) % 256
+                case op.WRITE2 | op.READ2: mp = (mp + 2) % 256
+        if pending:
+            fused.insert(*pending)
+        self.instructions = fused
+
+    def end_bursts(self):
+        # the chip drives uio in the cycle after a READ2, so a burst followed by an instruction
+        # that needs uio_in (or by the end of the program) ends with a NOOP. READs count, a word
+        # wider than 8 bits is byte selected through uio_in, and so does anything that isn't an
+        # (op, uio_in) pair (the reloads of tpuarray, which expand into SETMP and WRITEs)
+        ended = []
+        for k, item in enumerate(self.instructions):
+            ended.append(item)
+            if not isinstance(item, tuple) or int(OP_TABLE[int(item[0])]) != op.READ2:
+                continue
+            following = self.instructions[k + 1] if k + 1 < len(self.instructions) else None
+            if not isinstance(following, tuple) or uses_uio(OP_TABLE[int(following[0])], DUAL_TABLE[int(following[0])], 1):
+                ended.append((op.NOOP, 0))
+        self.instructions = ended
+
+    def packed(self):
+        return pack_program(self.instructions)
+
+    def collect(self, outputs):
+        # sum the partial products read back from the chip into the (M, N) result,
+        # mod 256 (uint8) or mod 256**read_bytes (int64) with wider reads
+        n = self.n
+        outputs = np.asarray(outputs, dtype=np.int64).reshape(-1, self.read_bytes, n, n)
+        outputs = (outputs << (8*np.arange(self.read_bytes))[:, None, None]).sum(axis=1)
+        assert len(outputs) == len(self.blocks), f"expected {len(self.blocks)} tiles got {len(outputs)}"
+        rows, cols = -(-self.shape[0] // n), -(-self.shape[1] // n)
+        result = np.zeros((rows*n, cols*n), dtype=np.int64)
+        for (i, j), tile in zip(self.blocks, outputs):
+            result[i*n:(i+1)*n, j*n:(j+1)*n] += tile
+        result = result[:self.shape[0], :self.shape[1]] % 256**self.read_bytes
+        return result.astype(np.uint8) if self.read_bytes == 1 else result
+
+    def stats(self):
+        counts = {o.name: 0 for o in op}
+        dual = 0
+        for current_op, _ in self.instructions:
+            counts[op(OP_TABLE[int(current_op)]).name] += 1
+            dual += int(DUAL_TABLE[int(current_op)]) != op.NOOP
+        writes = counts["WRITE"] + counts["WRITE2"]
+        reads = counts["READ"] + counts["READ2"]
+        return {
+            "instructions": len(self.instructions),
+            "io_cycles": writes + reads,
+            "writes": writes,
+            "reads": reads,
+            "setmp": counts["SETMP"],
+            "matmul": counts["MATMUL"] + counts["MATMUL_ACC"] + dual,
+            "dual_issued": dual,
+        }
+
+def _compile(a_tiles, b_tiles, shape, order, burst, accumulate, bank_count, matmul_cycles, dual=False, read_bytes=1):
+    # dual: lay the tiles out for dual_banks (A and C in banks 2 and 3, B double buffered in
+    # 0 and 1) and load B first, so its load can carry the previous MATMUL
+    ti, tk, tj, n = a_tiles.shape[0], a_tiles.shape[1], b_tiles.shape[1], a_tiles.shape[2]
+    # identical tiles share a key, so a tile that is already resident is never written again
+    a_keys = [[a_tiles[i, k].tobytes() for k in range(tk)] for i in range(ti)]
+    b_keys = [[b_tiles[k, j].tobytes() for j in range(tj)] for k in range(tk)]
+    zero = bytes(n*n)
+    steps = [(i, j, k) for i, j, k in schedule(ti, tj, tk, order)
+             if a_keys[i][k] != zero and b_keys[k][j] != zero] # zero tiles contribute nothing
+    # with accumulate a partial result tile is a cache entry too: ("acc", i, j) stays in its
+    # bank and takes MATMUL_ACCs until it is evicted, which reads it back to the host
+    uses = {}
+    for t, (i, j, k) in enumerate(steps):
+        uses.setdefault(a_keys[i][k], []).append(t)
+        uses.setdefault(b_keys[k][j], []).append(t)
+        uses.setdefault(("acc", i, j), []).append(t)
+
+    def next_use(key, t):
+        # first step after t that needs key
+        if key is None: return -1
+        positions = uses[key]
+        n = bisect_right(positions, t)
+        return positions[n] if n < len(positions) else len(steps)
+
+    def dual_target(bank, role):
+        # tie break of a dual layout: loading bank right after a MATMUL lets that MATMUL be
+        # dual issued, then the layout preference of the operand
+        if not dual:
+            return ()
+        last = prog.instructions[-1] if prog.instructions else (op.NOOP, 0)
+        fused = last[0] in (op.MATMUL, op.MATMUL_ACC) and \
+            dual_banks(bank*n*n, n, prog.banks) == [t[last[1]] for t in bank_tables(n, prog.banks)]
+        return fused, -DUAL_LAYOUT[role].index(bank)
+
+    def victim(t, keep, role):
+        # empty banks first, then the bank whose content is needed furthest in the future
+        candidates = [b for b in range(prog.banks) if b not in keep]
+        bank = max(candidates, key=lambda b: (prog.bank[b] is None, next_use(prog.bank[b], t), *dual_target(b, role)))
+        evict(bank)
+        return bank
+
+    def evict(bank):
+        key = prog.bank[bank]
+        if isinstance(key, tuple):
+            prog.readback(bank, key[1:])
+        prog.bank[bank] = None
+
+    prog = GemmProgram(shape, burst, n, bank_count, matmul_cycles, read_bytes)
+    prog.order = order
+    for t, (i, j, k) in enumerate(steps):
+        acc = ("acc", i, j)
+        keep = [prog.bank.index(acc)] if acc in prog.bank else []
+        banks = {}
+        loads = [("a", a_keys[i][k], a_tiles[i, k]), ("b", b_keys[k][j], b_tiles[k, j])]
+        for role, key, tile in loads[::-1] if dual else loads:
+            if key in prog.bank:
+                banks[role] = prog.bank.index(key)
+            else:
+                bank = victim(t - 1, list(banks.values()) + keep, role)
+                prog.load(bank, key, tile)
+                banks[role] = bank
+        banks = [banks["a"], banks["b"]]
+        if keep:
+            prog.matmul(banks[0], banks[1], keep[0], accumulate=True)
+            continue
+        # the result may overwrite an operand, MATMUL reads its inputs before the clock edge.
+        # A multi-cycle engine reads them while it writes C: a row per cycle only still needs B,
+        # an element per cycle needs both
+        n_cycles = prog.matmul_cycles
+        c = victim(t, [] if n_cycles == 1 else banks[1:] if n_cycles == n else banks, "c")
+        prog.matmul(banks[0], banks[1], c)
+        if accumulate:
+            prog.bank[c] = acc
+        else:
+            prog.readback(c, (i, j))
+    for bank in range(prog.banks):
+        evict(bank)
+    if dual:
+        prog.fuse_dual()
+    prog.end_bursts()
+    return prog
+
+def compile_gemm(a, b, order=None, burst=True, accumulate=True, n=N, banks=BANKS, matmul_cycles=1, read_bytes=1):
+    # returns the cheapest program over the candidate loop orders (or the given one),
+    # with and without MATMUL_ACC and dual issue, accumulate=False always sums partial products on the host,
+    # so does a tpu with 2 banks, which can't hold an accumulator next to both operands.
+    # read_bytes > 1 needs words that wide (acc_width), the chip wraps every sum mod 2**acc_width
+    accumulate = accumulate and banks > 2
+    duals = {False, dual_issue(n, banks) and matmul_cycles == 1}
+    a = np.asarray(a)
+    b = np.asarray(b)
+    assert a.ndim == 2 and b.ndim == 2 and a.shape[1] == b.shape[0], f"can't multiply {a.shape} by {b.shape}"
+    a_tiles, b_tiles = tiles(a, n), tiles(b, n)
+    shape = (a.shape[0], b.shape[1])
+    programs = [_compile(a_tiles, b_tiles, shape, o, burst, acc, banks, matmul_cycles, dual, read_bytes)
+                for o in ([order] if order else LOOP_ORDERS) for acc in ({False, accumulate}) for dual in duals]
+    return min(programs, key=lambda p: len(p.instructions))
+
+def gemm(a, b, tpu_=None, burst=True, accumulate=True):
+    # compile for the configuration of tpu_ (default pyTpu()), run and return (a @ b mod 256, program)
+    tpu_ = tpu_ if tpu_ is not None else pyTpu()
+    prog = compile_gemm(a, b, burst=burst, accumulate=accumulate, n=tpu_.n, banks=tpu_.banks,
+                        matmul_cycles=tpu_.matmul_cycles)
+    return prog.collect(tpu_.run(prog.packed())), prog
+
+if __name__ == "__main__":
+    # cycle counts with and without on-chip accumulation and burst I/O
+    from profiler import profile
+    import tabulate
+    rng = np.random.default_rng(0)
+    table = []
+    for m, k, n in [(16, 16, 16), (4, 64, 4)]:
+        a = rng.integers(0, 256, size=(m, k))
+        b = rng.integers(0, 256, size=(k, n))
+        for accumulate in (False, True):
+            for burst in (False, True):
+                result, prog = gemm(a, b, burst=burst, accumulate=accumulate)
+                assert (result == (a @ b) % 256).all()
+                prof = profile(prog.instructions)
+                stats = prog.stats()
+                table.append((f"{m}x{k} @ {k}x{n}", "MATMUL_ACC" if accumulate else "host sum",
+                              "READ2/WRITE2" if burst else "READ/WRITE",
+                              stats["writes"], stats["reads"], prof.cycles, f"{prof.wall_time*1e3:.2f}"))
+    print(tabulate.tabulate(table, headers=["gemm", "partial sums", "io", "write cycles", "read cycles",
+                                            "cycles", "ms at 100 kHz"]))
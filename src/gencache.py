@@ -0,0 +1,87 @@
+from importlib import metadata
+import hashlib
+import json
+import os
+import tempfile
+
+# Content addressed cache of generated files (tpu.generate Verilog and RTLIL).
+# The key hashes the source of the design, the generator parameters and the versions of
+# amaranth and its yosys, so any change to one of them misses. Entries are plain files named by
+# their key, a hit refreshes the mtime and the directory is trimmed to max_bytes by evicting the
+# least recently used entries. Outputs are only rewritten when their content changes, so make
+# and the cocotb build don't see a new top_tpu.v after every run.
+#   TPU_CACHE_DIR   cache directory, default $XDG_CACHE_HOME/tt_micro_tpu (~/.cache/tt_micro_tpu)
+#   TPU_CACHE_SIZE  max_bytes, default 256 MiB
+
+CACHE_DIR = os.environ.get("TPU_CACHE_DIR") or \
+    os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache")), "tt_micro_tpu")
+CACHE_SIZE = int(os.environ.get("TPU_CACHE_SIZE", 256 << 20))
+TOOLS = ("amaranth", "amaranth-yosys")
+
+def tool_versions():
+    versions = {}
+    for name in TOOLS:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+def design_key(sources, params):
+    # sha256 of the source files, the json of params and the tool versions
+    digest = hashlib.sha256(json.dumps({"params": params, "tools": tool_versions()}, sort_keys=True).encode())
+    for path in sorted(sources):
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+def lookup(key, cache_dir=None):
+    path = os.path.join(cache_dir or CACHE_DIR, key)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        os.utime(path)
+    except FileNotFoundError: # or evicted by another process meanwhile
+        return None
+    return data
+
+def store(key, data, cache_dir=None, max_bytes=None):
+    # written under a temporary name and renamed, parallel sweeps may store the same key
+    cache_dir = cache_dir or CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, os.path.join(cache_dir, key))
+    evict(cache_dir, max_bytes)
+
+def evict(cache_dir=None, max_bytes=None):
+    # least recently used entries first until the rest fits in max_bytes
+    cache_dir = cache_dir or CACHE_DIR
+    max_bytes = CACHE_SIZE if max_bytes is None else max_bytes
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and not entry.name.startswith("."):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+def write_if_changed(path, data):
+    # True when path was (re)written
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
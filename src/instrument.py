@@ -0,0 +1,139 @@
+from tpu import op, pyTpu, bank_tables, dual_banks, dual_issue, op_accesses, COMPUTE_OPS, CONFIG
+from gemm import compile_gemm
+from array import array
+import argparse
+import json
+import numpy as np
+import tabulate
+
+# Counters for the pyTpu.add_hook / simtrace.SimRunner(hooks=...) instrumentation:
+#   ops        instructions per op, dual issued compute ops counted under "dual"
+#   reads      (banks, n, n) reads and writes of every word, following op_accesses, the words of a
+#   writes     multi-cycle MATMUL are counted when it is issued
+#   mp         mp after every instruction
+#   overflow   per compute op, the instructions with a result wider than acc_width and how many
+#              words were truncated (the exact result is computed before the clock edge)
+# report() is plain JSON, so a workload can be profiled without touching the model:
+#   counters = Counters().attach(tpu_) ... json.dump(counters.report(), f)
+#   python instrument.py [--m 16 --k 16 --n 16] [--out counters.json]
+
+def exact_results(tpu_, compute_op, a, b, c):
+    # the results of compute_op on the banks at a, b and c before they wrap at acc_width bits
+    n, size = tpu_.n, tpu_.n*tpu_.n
+    memory = tpu_.memory
+    A = np.array(memory[a:a+size], dtype=object).reshape(n, n) # python ints, 32 bit products don't fit int64
+    B = np.array(memory[b:b+size], dtype=object).reshape(n, n)
+    C = np.array(memory[c:c+size], dtype=object).reshape(n, n)
+    match compute_op:
+        case op.MMUL:
+            return A*B
+        case op.MMUL_ACC:
+            return C + A*B
+        case op.MATMUL:
+            return A @ B
+        case op.MATMUL_ACC:
+            return C + A @ B
+        case op.DOT:
+            return np.array([(A[0]*B[0]).sum()], dtype=object)
+        case op.MATVEC:
+            return A @ B[0]
+        case op.ROWDOT:
+            return (A*B).sum(axis=1)
+        case op.SUM:
+            return np.array([A.sum()], dtype=object)
+    return np.zeros(0, dtype=object)
+
+class Counters:
+    def __init__(self, config=CONFIG) -> None:
+        self.config = tuple(config)
+        n, banks, acc_width, _ = self.config
+        self.mask = (1 << acc_width) - 1
+        self.bank_A, self.bank_B, self.bank_C = bank_tables(n, banks)
+        self.dual_issue = dual_issue(n, banks)
+        self.ops = np.zeros(len(op), dtype=np.int64)
+        self.dual = np.zeros(len(op), dtype=np.int64)
+        self.reads = np.zeros(banks*n*n, dtype=np.int64)
+        self.writes = np.zeros(banks*n*n, dtype=np.int64)
+        self.mp = array("B")
+        self.overflow = np.zeros(len(op), dtype=np.int64)
+        self.truncated = np.zeros(len(op), dtype=np.int64)
+
+    def attach(self, tpu_):
+        # on a pyTpu of the same configuration, returns self
+        assert tpu_.config == self.config, f"counters of {self.config} on {tpu_.config}"
+        self.hook = tpu_.add_hook(self.pre, self.post)
+        return self
+
+    def pre(self, tpu_, current_op, arg, dual):
+        # decoded like pyTpu.execute: a compute op next to a dual issued one is dropped,
+        # ops the build doesn't have are NOOPs
+        n, banks, _, _ = self.config
+        dual = dual if self.dual_issue and dual in tpu_.ops else op.NOOP
+        current_op = current_op if current_op in tpu_.ops else op.NOOP
+        if dual != op.NOOP:
+            current_op = op.NOOP if current_op in COMPUTE_OPS else current_op
+            a, b, c = dual_banks(tpu_.mp, n, banks)
+            self.dual[dual] += 1
+            host = op_accesses(current_op, a, b, c, tpu_.mp, n, banks, arg)
+            compute = op_accesses(dual, a, b, c, tpu_.mp, n, banks, arg)
+            reads, writes = host[0] + compute[0], host[1] + compute[1]
+            compute_op = dual
+        else:
+            a, b, c = self.bank_A[arg], self.bank_B[arg], self.bank_C[arg]
+            reads, writes = op_accesses(current_op, a, b, c, tpu_.mp, n, banks, arg)
+            compute_op = current_op
+        self.ops[current_op] += 1
+        np.add.at(self.reads, reads, 1)
+        np.add.at(self.writes, writes, 1)
+        if compute_op in COMPUTE_OPS:
+            wide = int((exact_results(tpu_, compute_op, a, b, c) > self.mask).sum())
+            if wide:
+                self.overflow[compute_op] += 1
+                self.truncated[compute_op] += wide
+
+    def post(self, tpu_, current_op, arg, dual):
+        self.mp.append(tpu_.mp)
+
+    def report(self):
+        n, banks, _, _ = self.config
+        def per_op(counts):
+            return {o.name: int(counts[o]) for o in op if counts[o]}
+        return {"config": list(self.config), "instructions": len(self.mp),
+                "ops": per_op(self.ops), "dual": per_op(self.dual),
+                "reads": self.reads.reshape(banks, n, n).tolist(), "writes": self.writes.reshape(banks, n, n).tolist(),
+                "bank_reads": self.reads.reshape(banks, -1).sum(axis=1).tolist(),
+                "bank_writes": self.writes.reshape(banks, -1).sum(axis=1).tolist(),
+                "mp": self.mp.tolist(),
+                "overflow": {o.name: {"instructions": int(self.overflow[o]), "words": int(self.truncated[o])}
+                             for o in op if self.overflow[o]}}
+
+def profile_gemm(a, b, config=CONFIG):
+    # counters of a @ b compiled by gemm.compile_gemm and run on pyTpu
+    n, banks, acc_width, matmul_cycles = config
+    prog = compile_gemm(a, b, n=n, banks=banks, matmul_cycles=matmul_cycles)
+    tpu_ = pyTpu(*config)
+    counters = Counters(config).attach(tpu_)
+    prog.collect(tpu_.run(prog.packed()))
+    return counters
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="op counts, bank heatmaps and overflows of a GEMM on pyTpu")
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--k", type=int, default=16)
+    parser.add_argument("--n", type=int, default=16)
+    parser.add_argument("--max", type=int, default=16, help="operands are drawn from 0..max-1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="JSON report")
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    counters = profile_gemm(rng.integers(0, args.max, (args.m, args.k)), rng.integers(0, args.max, (args.k, args.n)))
+    report = counters.report()
+    print(tabulate.tabulate([(o.name, report["ops"].get(o.name, 0), report["dual"].get(o.name, 0)) for o in op
+                             if o.name in report["ops"] or o.name in report["dual"]], headers=["op", "count", "dual issued"]))
+    print(tabulate.tabulate([(bank, r, w) for bank, (r, w) in enumerate(zip(report["bank_reads"], report["bank_writes"]))],
+                            headers=["bank", "reads", "writes"]))
+    for name, events in report["overflow"].items():
+        print(f"{name}: {events['instructions']} instructions truncated {events['words']} words")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f)
@@ -0,0 +1,288 @@
+from enum import IntEnum
+from functools import lru_cache
+import argparse
+import json
+import struct
+import time
+import numpy as np
+
+# Instruction set of the tpu, shared by the amaranth design (tpu.py) and the cocotb tests (test/test.py).
+# An instruction is one clock of (ui_in, uio_in): the op in ui_in[3:0], its operand on uio_in.
+# Compute ops take the A, B and C bank fields from the top of uio_in (pack_banks), the bits
+# below them pick the output byte of wide words, or the function of BANK. With 4 banks
+# ui_in[7] = 1 dual issues DUAL_OPS[ui_in[6:4]] next to the host op, see dual_banks in tpu.py.
+#
+# Assembly, one instruction per line, `#` starts a comment, names are case insensitive:
+#   SETMP 16                host ops take a number (0x.. and 0b.. too), WRITE2 one byte or two nibbles
+#   MATMUL a=0 b=1 c=2      bank fields of compute ops, byte=N for the byte select of SUM
+#   BANK TRANSPOSE a=2 c=3  the bankfn by name
+#   WRITE 7 | MATMUL        a compute op dual issued next to a host op
+#   .raw 0x53 0x10          any (ui_in, uio_in) pair, what the disassembler falls back to
+#
+# .tpub programs are the raw (ui_in, uio_in) pairs behind a small header, so they map or
+# stream straight into pyTpu.run / SimRunner.run without building instruction tuples:
+#   magic "TPUB" | uint32 header length | json {"config": [n, banks, acc_width, matmul_cycles]} | pairs
+
+def int2list(i, width=2):
+    res= [int(x) for x in bin(i)[2:]]
+    while len(res)<width:
+        res.insert(0,0)
+    return res
+
+def list2int(l):
+    return int("".join(str(x) for x in l), 2)
+
+class op(IntEnum):
+    # CLEARMP = 1 # reset mp to 0
+    NOOP = 0 # do nothing
+    SETMP = 1 # set mp to X
+    WRITE = 2 # write to memory at mp, increment mp
+    READ = 3 # read from memory at mp, increment mp
+    MMUL = 4 # element-wise multiply of matrix at A and B, store in C
+    DOT = 5 # dot product of matrix at A and B, store in C
+    MATMUL = 6 # matrix multiplication of matrix at A and B, store in C
+    SUM = 7 # sum of matrix at A, store in C
+    READ2 = 8 # read memory at mp to uo_out and mp+1 to uio_out, mp += 2
+    WRITE2 = 9 # write the low and high nibble of the argument at mp and mp+1, mp += 2
+    MATMUL_ACC = 10 # matrix multiplication of matrix at A and B, added to C
+    MMUL_ACC = 11 # element-wise multiply of matrix at A and B, added to C
+    MATVEC = 12 # matrix at A times the vector in row 0 of B, store in row 0 of C
+    ROWDOT = 13 # dot product of every row of A with the same row of B, store in row 0 of C
+    FILL = 14 # write X to every word of the bank mp points into, mp is unchanged
+    BANK = 15 # bank function in the low 2 bits (bankfn) of bank A into C
+    # ADD = 9 # add matrix at A to scalar, store in C
+    # SUB = 10 # subtract matrix at A from scalar, store in C
+    # PROD = 12 # product of matrix at A, store in C
+    # MAX = 13 # max of matrix at A, store in C
+    # MIN = 14 # min of matrix at A, store in C
+
+class bankfn(IntEnum):
+    # low bits of the BANK operand, the bank fields are the usual A and C
+    COPY = 0 # C = A
+    TRANSPOSE = 1 # C = A transposed, A may be C
+    ZERO = 2 # C = 0
+    # 3 does nothing
+
+def bank_bits(banks):
+    return (banks - 1).bit_length()
+
+COMPUTE_OPS = (op.MMUL, op.DOT, op.MATMUL, op.SUM, op.MATMUL_ACC, op.MMUL_ACC, op.MATVEC, op.ROWDOT, op.BANK)
+DUAL_OPS = (op.MMUL, op.MATMUL, op.MATMUL_ACC, op.MMUL_ACC, op.MATVEC, op.ROWDOT)
+
+# Build profiles: the ops a tpu(ops=...) is generated with, the other opcodes do nothing on chip
+# and pyTpu(ops=...) rejects them. NOOP is always in
+HOST_OPS = (op.SETMP, op.WRITE, op.READ, op.WRITE2, op.READ2)
+PROFILES = {
+    "full": tuple(op),
+    "matmul": (op.SETMP, op.WRITE, op.READ, op.MATMUL),
+    "gemm": HOST_OPS + (op.MATMUL, op.MATMUL_ACC), # gemm.py, quant.py
+    "tpuarray": HOST_OPS + (op.MATMUL, op.MATMUL_ACC, op.MMUL, op.SUM, op.FILL, op.BANK),
+    "elementwise": HOST_OPS + (op.MMUL, op.MMUL_ACC, op.DOT, op.SUM, op.FILL),
+}
+
+def op_set(ops=None):
+    # frozenset of the enabled ops: every op by default, op members, values or names otherwise
+    if ops is None:
+        return frozenset(op)
+    return frozenset(op[o] if isinstance(o, str) else op(o) for o in ops) | {op.NOOP}
+
+# decode tables indexed by the raw ui_in / uio_in byte
+OP_TABLE = np.array([i & 0x0f if (i & 0x0f) in set(op) else op.NOOP for i in range(256)], dtype=np.uint8)
+DUAL_TABLE = np.array([DUAL_OPS[(i >> 4) & 7] if i & 0x80 and (i >> 4) & 7 < len(DUAL_OPS) else op.NOOP
+                       for i in range(256)], dtype=np.uint8)
+
+def pack_banks(a=0, b=0, c=0, banks=4):
+    # uio_in operand selecting banks A, B and C, same layout as the int2list concatenations
+    w = bank_bits(banks)
+    return (a << (8 - w)) | (b << (8 - 2*w)) | (c << (8 - 3*w))
+
+def pack_bankfn(function, a=0, c=0, banks=4):
+    # uio_in operand of BANK, function applied to bank a into bank c
+    return pack_banks(a, 0, c, banks) | function
+
+def pack_dual(host_op, compute_op):
+    # ui_in of a host op with a compute op dual issued in the upper nibble
+    return int(host_op) | 0x80 | DUAL_OPS.index(compute_op) << 4
+
+def pack_program(instructions):
+    # [(op, uio_in), ...] -> packed (ui_in, uio_in) bytes for pyTpu.run, op may be a pack_dual ui_in
+    return bytes(b for current_op, arg in instructions for b in (int(current_op), arg))
+
+def encode(line, banks=4):
+    # (ui_in, uio_in) of one line of assembly, None for blank and comment lines
+    line = line.split("#")[0].strip()
+    if not line:
+        return None
+    host, _, dual = line.partition("|")
+    tokens = host.split()
+    if tokens[0].lower() == ".raw":
+        assert len(tokens) == 3, f"{line!r}: .raw takes ui_in and uio_in"
+        ui_in, uio_in = int(tokens[1], 0), int(tokens[2], 0)
+        assert 0 <= ui_in < 256 and 0 <= uio_in < 256, f"{line!r}: .raw takes two bytes"
+        return ui_in, uio_in
+    assert tokens[0].upper() in op.__members__, f"{line!r}: unknown op {tokens[0]}"
+    current_op = op[tokens[0].upper()]
+    ui_in = int(current_op)
+    if dual.strip():
+        names = [o.name for o in DUAL_OPS]
+        assert dual.strip().upper() in names, f"{line!r}: only {', '.join(names)} are dual issued"
+        assert current_op not in COMPUTE_OPS, f"{line!r}: a compute op can't be dual issued next to {current_op.name}"
+        ui_in = pack_dual(current_op, op[dual.strip().upper()])
+
+    fields, numbers = {}, []
+    for token in tokens[1:]:
+        key, equals, value = token.partition("=")
+        if equals:
+            key = key.lower()
+            fields[key] = bankfn[value.upper()] if key == "fn" and value.upper() in bankfn.__members__ else int(value, 0)
+        elif token.upper() in bankfn.__members__:
+            fields["fn"] = bankfn[token.upper()]
+        else:
+            numbers.append(int(token, 0))
+    if current_op in COMPUTE_OPS:
+        low = "fn" if current_op == op.BANK else "byte"
+        assert not numbers and set(fields) <= {"a", "b", "c", low}, \
+            f"{line!r}: {current_op.name} takes a=, b=, c= and {low}="
+        assert all(0 <= fields.get(field, 0) < banks for field in "abc"), f"{line!r}: {banks} banks"
+        assert 0 <= fields.get(low, 0) < 1 << (8 - 3*bank_bits(banks)), f"{line!r}: {low} doesn't fit below the bank fields"
+        uio_in = pack_banks(fields.get("a", 0), fields.get("b", 0), fields.get("c", 0), banks) | fields.get(low, 0)
+    else:
+        assert not fields, f"{line!r}: {current_op.name} takes a number"
+        if current_op == op.WRITE2 and len(numbers) == 2:
+            assert all(0 <= x < 16 for x in numbers), f"{line!r}: WRITE2 takes two nibbles"
+            uio_in = numbers[0] | numbers[1] << 4
+        else:
+            assert len(numbers) <= 1, f"{line!r}: {current_op.name} takes one number"
+            uio_in = numbers[0] if numbers else 0
+        assert 0 <= uio_in < 256, f"{line!r}: {uio_in} doesn't fit in uio_in"
+    return ui_in, uio_in
+
+def assemble(text, banks=4):
+    # packed (ui_in, uio_in) bytes of a program, assertion messages carry the line number
+    program = bytearray()
+    for number, line in enumerate(text.splitlines(), 1):
+        try:
+            instruction = encode(line, banks)
+        except (AssertionError, ValueError, KeyError) as error:
+            raise AssertionError(f"line {number}: {error}") from None
+        if instruction is not None:
+            program.extend(instruction)
+    return bytes(program)
+
+@lru_cache(maxsize=1 << 17)
+def decode_line(ui_in, uio_in, banks=4):
+    # the assembly of one instruction, .raw when the text wouldn't encode back to the same bytes
+    # (junk in the upper nibble, unused codes, a compute op under a dual issued one)
+    current_op, dual = op(OP_TABLE[ui_in]), op(DUAL_TABLE[ui_in])
+    w = bank_bits(banks)
+    if current_op in COMPUTE_OPS:
+        a, b, c = (uio_in >> (8 - w)), (uio_in >> (8 - 2*w)) & (banks - 1), (uio_in >> (8 - 3*w)) & (banks - 1)
+        low = uio_in & ((1 << (8 - 3*w)) - 1)
+        if current_op == op.BANK:
+            function = bankfn(low).name if low in set(bankfn) else f"fn={low}"
+            text = f"BANK {function} a={a} c={c}" + (f" b={b}" if b else "")
+        else:
+            text = f"{current_op.name} a={a} b={b} c={c}" + (f" byte={low}" if low else "")
+    elif current_op == op.WRITE2:
+        text = f"WRITE2 {uio_in & 0x0f} {uio_in >> 4}"
+    elif uio_in or current_op in (op.SETMP, op.WRITE, op.FILL):
+        text = f"{current_op.name} {uio_in}"
+    else:
+        text = current_op.name
+    if dual != op.NOOP:
+        text += f" | {dual.name}"
+    try:
+        if encode(text, banks) == (ui_in, uio_in):
+            return text
+    except AssertionError:
+        pass
+    return f".raw 0x{ui_in:02x} 0x{uio_in:02x}"
+
+def disassemble(program, banks=4):
+    # text of packed (ui_in, uio_in) bytes, a uint8 array or a .tpub memmap, one line per instruction
+    if isinstance(program, (bytes, bytearray, memoryview)):
+        program = np.frombuffer(program, dtype=np.uint8)
+    program = np.asarray(program, dtype=np.uint8).reshape(-1, 2)
+    return "\n".join(decode_line(ui_in, uio_in, banks) for ui_in, uio_in in program.tolist()) + "\n"
+
+MAGIC = b"TPUB"
+CONFIG = (4, 4, 8, 1) # (n, banks, acc_width, matmul_cycles) of the tpu in info.yaml
+
+def write_tpub(path, program, config=CONFIG):
+    # program: [(op, uio_in), ...], packed bytes, a uint8 array, or an iterator of those chunks
+    # for programs generated on the fly
+    header = json.dumps({"config": list(config)}).encode()
+    # pad so the pairs start on an 8 byte boundary
+    header += b" "*(-(len(MAGIC) + 4 + len(header)) % 8)
+    chunks = [program] if isinstance(program, (bytes, bytearray, memoryview, np.ndarray, list, tuple)) else program
+    with open(path, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(header)) + header)
+        for chunk in chunks:
+            if isinstance(chunk, (list, tuple)):
+                chunk = pack_program(chunk)
+            f.write(np.asarray(np.frombuffer(chunk, dtype=np.uint8) if not isinstance(chunk, np.ndarray) else chunk,
+                               dtype=np.uint8).tobytes())
+
+def read_header(f):
+    # (config, offset of the first pair) of an open .tpub file
+    assert f.read(len(MAGIC)) == MAGIC, f"{f.name} is not a tpu program"
+    length, = struct.unpack("<I", f.read(4))
+    header = json.loads(f.read(length))
+    return tuple(header["config"]), len(MAGIC) + 4 + length
+
+def load_tpub(path):
+    # (config, (instructions, 2) uint8 memmap), nothing is read until it is indexed
+    with open(path, "rb") as f:
+        config, offset = read_header(f)
+    data = np.memmap(path, dtype=np.uint8, mode="r", offset=offset)
+    return config, data.reshape(-1, 2)
+
+def iter_tpub(path, chunk=1 << 16):
+    # (config, iterator of (<= chunk, 2) uint8 arrays), reading the file as it goes
+    f = open(path, "rb")
+    config, _ = read_header(f)
+
+    def chunks():
+        with f:
+            while data := f.read(2*chunk):
+                yield np.frombuffer(data, dtype=np.uint8).reshape(-1, 2)
+
+    return config, chunks()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="tpu assembler, disassembler and .tpub replay")
+    parser.add_argument("command", choices=["asm", "disasm", "run"],
+                        help="asm: text to .tpub, disasm: .tpub to text, run: replay a .tpub on pyTpu")
+    parser.add_argument("input")
+    parser.add_argument("output", nargs="?", help="output file of asm/disasm, stdout for disasm by default")
+    parser.add_argument("--n", type=int, default=CONFIG[0], help="matrix size")
+    parser.add_argument("--banks", type=int, default=CONFIG[1])
+    parser.add_argument("--acc-width", type=int, default=CONFIG[2])
+    parser.add_argument("--matmul-cycles", type=int, default=CONFIG[3])
+    args = parser.parse_args()
+    if args.command == "asm":
+        with open(args.input) as f:
+            program = assemble(f.read(), args.banks)
+        write_tpub(args.output or args.input.rsplit(".", 1)[0] + ".tpub", program,
+                   (args.n, args.banks, args.acc_width, args.matmul_cycles))
+        print(f"{len(program) // 2} instructions")
+    elif args.command == "disasm":
+        config, program = load_tpub(args.input)
+        text = f"# n={config[0]} banks={config[1]} acc_width={config[2]} matmul_cycles={config[3]}\n"
+        text += disassemble(program, config[1])
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(text)
+        else:
+            print(text, end="")
+    else:
+        from tpu import pyTpu
+        config, chunks = iter_tpub(args.input)
+        model = pyTpu(*config)
+        start = time.perf_counter()
+        instructions = outputs = 0
+        for chunk in chunks:
+            outputs += len(model.run(chunk))
+            instructions += len(chunk)
+        elapsed = time.perf_counter() - start
+        print(f"{instructions} instructions, {outputs} outputs, {instructions/elapsed:.0f} instructions/s")
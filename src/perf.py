@@ -0,0 +1,211 @@
+from tpu import op, tpu, pyTpu, generate_top, pack_banks, int2list, CONFIG
+from simtrace import SimRunner
+from synth import synth_report, find_yosys, op_cells, PROFILES
+from simbench import available
+from instrument import Counters
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import tabulate
+
+# Performance benchmarks of the model, the simulator and the generator, saved as JSON and
+# compared between runs:
+#   model     pyTpu.step instructions/s per op, pyTpu.run instructions/s of a mixed program,
+#             without and with instrument.Counters hooked in
+#   sim       amaranth Simulator cycles/s without and with a VCD dump (simtrace.SimRunner)
+#   generate  wall time of tpu.elaborate and verilog.convert in tpu.generate, and of a cache hit
+#   cocotb    simulated cycles/s of test/test.py under icarus and verilator (SIM= of test/Makefile),
+#             simbench.py compares the engines on one workload
+#   synth     yosys cells, flip-flops and longest path of the generated top level, cells of every
+#             build profile and of every op (the full build minus the build without it)
+# Every metric is {"value", "unit", "better": "higher" | "lower"}, timings keep the best of
+# `repeat` runs. A suite whose tools are missing (iverilog and verilator, yosys) is recorded under "skipped".
+#   python perf.py run [--suite model sim ...] [--out perf.json]
+#   python perf.py compare old.json new.json [--threshold 0.1]   exits 1 on a regression
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+TEST_DIR = os.path.join(SRC_DIR, "..", "test")
+CLOCK_NS = 10_000 # the 100 kHz clock of test/test.py
+
+class Skipped(Exception):
+    pass
+
+def metric(value, unit, better):
+    return {"value": value, "unit": unit, "better": better}
+
+def best(f, repeat):
+    # shortest of `repeat` timed calls of f
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def op_args(config=CONFIG):
+    # a uio_in for every op that keeps it on valid banks and addresses
+    args = {o: pack_banks(0, 1, 2, config[1]) for o in op}
+    args.update({op.SETMP: 0, op.WRITE: 0x5a, op.WRITE2: 0x5a, op.FILL: 0x5a, op.READ: 0, op.READ2: 0, op.SUM: 0})
+    return args
+
+def bench_model(repeat=3, count=2000, config=CONFIG):
+    results = {}
+    tpu_ = pyTpu(*config, strict=False)
+    for o, arg in op_args(config).items():
+        def run():
+            tpu_.input, tpu_.input2 = int2list(o, 8), int2list(arg, 8)
+            for _ in range(count):
+                tpu_.mp = 0 # keeps WRITE/READ in range
+                tpu_.step()
+        results[f"model.step.{o.name}"] = metric(count/best(run, repeat), "instructions/s", "higher")
+    rng = np.random.default_rng(0)
+    program = np.stack([rng.integers(0, len(op), 20*count), rng.integers(0, 256, 20*count)], axis=1).astype(np.uint8)
+    results["model.run"] = metric(len(program)/best(lambda: pyTpu(*config, strict=False).run(program), repeat),
+                                  "instructions/s", "higher")
+    def counted():
+        tpu_ = pyTpu(*config, strict=False)
+        Counters(config).attach(tpu_)
+        tpu_.run(program[:count])
+    results["model.run.counters"] = metric(count/best(counted, repeat), "instructions/s", "higher")
+    return results
+
+def bench_sim(repeat=1, cycles=2000):
+    rng = np.random.default_rng(0)
+    program = [(op(o), int(a)) for o, a in zip(rng.integers(0, 8, cycles), rng.integers(0, 256, cycles))]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, kwargs in [("no_vcd", {}), ("vcd", {"vcd": os.path.join(tmp, "perf.vcd")})]:
+            elapsed = []
+            for _ in range(repeat):
+                runner = SimRunner(**kwargs)
+                runner.run(program)
+                elapsed.append(runner.elapsed)
+            results[f"sim.{name}"] = metric(cycles/min(elapsed), "cycles/s", "higher")
+    return results
+
+def bench_generate(repeat=3, config=CONFIG):
+    # tpu.generate is elaborate + verilog.convert, convert is timed on a fresh elaboration
+    # because generate adds the clock domain to the module it elaborates. cached is a gencache hit
+    # of generate_top, which doesn't build the design
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "top_tpu.v")
+        elaborate = best(lambda: tpu(*config).elaborate(None), repeat)
+        generate = best(lambda: tpu(*config).generate(path, cache=False), repeat)
+        generate_top(path, config)
+        cached = best(lambda: generate_top(path, config), repeat)
+    return {"generate.elaborate": metric(elaborate, "s", "lower"),
+            "generate.convert": metric(generate - elaborate, "s", "lower"),
+            "generate.total": metric(generate, "s", "lower"),
+            "generate.cached": metric(cached, "s", "lower")}
+
+def bench_cocotb(repeat=1):
+    # sum of sim_time_ns over the tests in results.xml, divided by the wall time of the run,
+    # under every simulator found
+    sims = [sim for sim in ("icarus", "verilator") if available(sim)]
+    if not sims:
+        raise Skipped("neither iverilog nor verilator found")
+    generate_top(os.path.join(SRC_DIR, "top_tpu.v")) # PROJECT_SOURCES of test/Makefile
+    results = {}
+    for sim in sims:
+        rates = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run(["make", "-B", f"SIM={sim}"], cwd=TEST_DIR, check=True, capture_output=True)
+            elapsed = time.perf_counter() - start
+            with open(os.path.join(TEST_DIR, "results.xml")) as f:
+                sim_ns = sum(float(t) for t in re.findall(r'sim_time_ns="([\d.]+)"', f.read()))
+            rates.append(sim_ns / CLOCK_NS / elapsed)
+        results[f"cocotb.{sim}"] = metric(max(rates), "cycles/s", "higher")
+    return results
+
+def bench_synth(repeat=1, config=CONFIG):
+    try:
+        find_yosys()
+    except FileNotFoundError as e:
+        raise Skipped(str(e))
+    report = synth_report(config=config)
+    flops = sum(count for name, count in report["cell_types"].items() if "DFF" in name)
+    results = {"synth.cells": metric(report["cells"], "cells", "lower"),
+               "synth.flip_flops": metric(flops, "cells", "lower"),
+               "synth.longest_path": metric(report["longest_path"], "cells", "lower")}
+    results.update({f"synth.cell.{name}": metric(count, "cells", "lower") for name, count in report["cell_types"].items()})
+    results.update({f"synth.profile.{name}": metric(synth_report(config=config, ops=ops)["cells"], "cells", "lower")
+                    for name, ops in PROFILES.items() if name != "full"})
+    results.update({f"synth.op.{o.name}": metric(cells, "cells", "lower") for o, cells in op_cells(config).items()})
+    return results
+
+SUITES = {"model": bench_model, "sim": bench_sim, "generate": bench_generate, "cocotb": bench_cocotb, "synth": bench_synth}
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=SRC_DIR).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(suites=SUITES, repeat=3):
+    report = {"meta": {"commit": git_commit(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                       "python": platform.python_version(), "machine": platform.machine()},
+              "results": {}, "skipped": {}}
+    for name in suites:
+        try:
+            report["results"].update(SUITES[name](repeat))
+        except Skipped as e:
+            report["skipped"][name] = str(e)
+    return report
+
+def compare(old, new, threshold=0.1):
+    # (rows, regressions): a metric regresses when it moves the wrong way by more than threshold
+    # (relative), metrics in only one of the reports are listed but never flagged
+    rows, regressions = [], []
+    for name in sorted(set(old["results"]) | set(new["results"])):
+        before, after = old["results"].get(name), new["results"].get(name)
+        if before is None or after is None:
+            rows.append((name, before and before["value"], after and after["value"], None, "added" if before is None else "removed"))
+            continue
+        change = (after["value"] - before["value"]) / before["value"] if before["value"] else 0.0
+        worse = -change if after["better"] == "higher" else change
+        status = "regression" if worse > threshold else "improvement" if worse < -threshold else "ok"
+        if status == "regression":
+            regressions.append(name)
+        rows.append((name, before["value"], after["value"], f"{change:+.1%}", status))
+    return rows, regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="benchmarks of the model, simulator and generator")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run")
+    run_parser.add_argument("--suite", nargs="+", choices=list(SUITES), default=list(SUITES))
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--out", default="perf.json")
+    compare_parser = commands.add_parser("compare")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="relative change flagged as a regression")
+    args = parser.parse_args()
+    if args.command == "run":
+        report = run(args.suite, args.repeat)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=1)
+        print(tabulate.tabulate([(name, m["value"], m["unit"]) for name, m in report["results"].items()],
+                                headers=["metric", "value", "unit"], floatfmt=".4g"))
+        for name, reason in report["skipped"].items():
+            print(f"skipped {name}: {reason}")
+    else:
+        with open(args.old) as f:
+            old = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        rows, regressions = compare(old, new, args.threshold)
+        print(tabulate.tabulate(rows, headers=["metric", old["meta"]["commit"], new["meta"]["commit"], "change", ""],
+                                floatfmt=".4g"))
+        if regressions:
+            print(f"{len(regressions)} regressions above {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
@@ -0,0 +1,173 @@
+from tpu import op, list2int, bank_tables, dual_banks, dual_issue, op_accesses, OP_TABLE, DUAL_TABLE, COMPUTE_OPS
+import numpy as np
+import tabulate
+
+# Cycle and I/O cost model for tpu instruction streams.
+# Every instruction takes one clock. uo_out only shows a READ/SUM result one clock later
+# (the `once` wait in test/test.py), so every burst of READ/SUM costs one extra cycle.
+
+CLOCK_HZ = 100_000 # clock_hz in info.yaml
+IO_OPS = (op.WRITE, op.READ, op.WRITE2, op.READ2)
+OUTPUT_OPS = (op.READ, op.SUM, op.READ2)
+
+def decode(instructions):
+    # (op, operand, dual issued op) of (op or pack_dual ui_in, operand) tuples with int or int2list
+    # operands, or of packed (ui_in, uio_in) bytes
+    if isinstance(instructions, (bytes, bytearray, memoryview, np.ndarray)):
+        program = np.frombuffer(instructions, dtype=np.uint8) if not isinstance(instructions, np.ndarray) else instructions
+        program = np.asarray(program, dtype=np.uint8).reshape(-1, 2)
+        return [(op(o), a, op(d)) for o, a, d in zip(OP_TABLE[program[:, 0]].tolist(), program[:, 1].tolist(),
+                                                    DUAL_TABLE[program[:, 0]].tolist())]
+    return [(op(OP_TABLE[int(o)]), a if isinstance(a, int) else list2int(a), op(DUAL_TABLE[int(o)])) for o, a in instructions]
+
+def accesses(current_op, arg, mp, n=4, banks=4):
+    # (addresses read, addresses written) by one instruction, following tpu.elaborate
+    bank_A, bank_B, bank_C = bank_tables(n, banks)
+    return op_accesses(current_op, bank_A[arg], bank_B[arg], bank_C[arg], mp, n, banks, arg)
+
+class Profile:
+    def __init__(self, clock_hz=CLOCK_HZ) -> None:
+        self.clock_hz = clock_hz
+        self.op_cycles = {o.name: 0 for o in op}
+        self.latency_cycles = 0 # extra clocks waiting for uo_out after READ/SUM bursts
+        self.bytes_in = 0 # data bytes over uio_in (WRITE, FILL, WRITE2 carries two nibbles)
+        self.bytes_out = 0 # result bytes over uo_out and uio_out (READ, SUM, READ2)
+        self.redundant_setmp = [] # instruction index of SETMPs that don't change mp or are never used
+        self.overwritten_writes = [] # WRITEs overwritten before anything reads them
+        self.overwritten_results = [] # compute ops whose result is overwritten before use
+        self.dual_issued = 0 # compute ops in the upper nibble, which take no cycle of their own
+
+    @property
+    def instructions(self):
+        return sum(self.op_cycles.values())
+
+    @property
+    def cycles(self):
+        return self.instructions + self.latency_cycles
+
+    @property
+    def compute_cycles(self):
+        return sum(self.op_cycles[o.name] for o in COMPUTE_OPS)
+
+    @property
+    def io_cycles(self):
+        return sum(self.op_cycles[o.name] for o in IO_OPS)
+
+    @property
+    def compute_io_ratio(self):
+        return self.compute_cycles / self.io_cycles if self.io_cycles else float("inf")
+
+    @property
+    def wall_time(self):
+        return self.cycles / self.clock_hz
+
+    @property
+    def wasted_cycles(self):
+        return len(self.redundant_setmp) + len(self.overwritten_writes) + len(self.overwritten_results)
+
+    def to_dict(self):
+        return {
+            "instructions": self.instructions,
+            "cycles": self.cycles,
+            "op_cycles": dict(self.op_cycles),
+            "latency_cycles": self.latency_cycles,
+            "compute_cycles": self.compute_cycles,
+            "io_cycles": self.io_cycles,
+            "compute_io_ratio": self.compute_io_ratio,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "clock_hz": self.clock_hz,
+            "wall_time": self.wall_time,
+            "wasted_cycles": self.wasted_cycles,
+            "dual_issued": self.dual_issued,
+            "redundant_setmp": list(self.redundant_setmp),
+            "overwritten_writes": list(self.overwritten_writes),
+            "overwritten_results": list(self.overwritten_results),
+        }
+
+    def __repr__(self) -> str:
+        table = [(name, cycles) for name, cycles in self.op_cycles.items() if cycles]
+        table.append(("READ latency", self.latency_cycles))
+        table.append(("total", self.cycles))
+        summary = [
+            ("bytes in / out", f"{self.bytes_in} / {self.bytes_out}"),
+            ("compute / io cycles", f"{self.compute_cycles} / {self.io_cycles}"),
+            ("dual issued compute ops", self.dual_issued),
+            ("wall time", f"{self.wall_time*1e3:.3f} ms at {self.clock_hz/1e3:g} kHz"),
+            ("redundant SETMP", len(self.redundant_setmp)),
+            ("overwritten WRITE", len(self.overwritten_writes)),
+            ("overwritten results", len(self.overwritten_results)),
+        ]
+        return tabulate.tabulate(table, headers=["op", "cycles"]) + "\n\n" + tabulate.tabulate(summary)
+
+def profile(instructions, clock_hz=CLOCK_HZ, n=4, banks=4):
+    # the stream is assumed to start right after reset (mp = 0), on a tpu with n x n tiles and `banks` banks
+    prof = Profile(clock_hz)
+    mp = 0
+    pending_setmp = None # last SETMP whose mp no WRITE/READ, FILL or dual issued op has used yet
+    config = (n, banks)
+    owner = [None]*(banks*n*n) # instruction that last wrote every address, while nothing read it
+    live = {} # store instruction -> [addresses not overwritten yet, read at least once]
+    prev_op = None
+    for index, (current_op, arg, dual) in enumerate(decode(instructions)):
+        dual = dual if dual_issue(*config) else op.NOOP
+        if dual != op.NOOP and current_op in COMPUTE_OPS:
+            current_op = op.NOOP # the upper nibble op replaces it
+        prof.op_cycles[current_op.name] += 1
+        if current_op in OUTPUT_OPS and prev_op not in OUTPUT_OPS:
+            prof.latency_cycles += 1
+        prev_op = current_op
+
+        # a store is wasted when all of its addresses are overwritten before any is read
+        stores = [(current_op, accesses(current_op, arg, mp, *config))]
+        if dual != op.NOOP:
+            prof.dual_issued += 1
+            stores.append((dual, op_accesses(dual, *dual_banks(mp, *config), mp, *config)))
+        # both ops of a dual issue read before either writes
+        for _, (reads, _) in stores:
+            for address in reads:
+                if owner[address] is not None:
+                    live[owner[address]][1] = True
+        for store_op, (_, writes) in stores:
+            for address in writes:
+                store = owner[address]
+                if store is not None:
+                    live[store][0] -= 1
+                    if live[store][0] == 0:
+                        if not live[store][1]:
+                            target = prof.overwritten_writes if store[1] in (op.WRITE, op.WRITE2) else prof.overwritten_results
+                            target.append(store[0])
+                        del live[store]
+                owner[address] = (index, store_op)
+            if writes:
+                live[(index, store_op)] = [len(writes), False]
+
+        if dual != op.NOOP:
+            pending_setmp = None # its banks follow from mp
+        match current_op:
+            case op.SETMP:
+                if arg == mp:
+                    prof.redundant_setmp.append(index)
+                else:
+                    if pending_setmp is not None:
+                        prof.redundant_setmp.append(pending_setmp)
+                    pending_setmp = index
+                    mp = arg
+            case op.WRITE | op.READ:
+                pending_setmp = None
+                mp = (mp + 1) % 256
+            case op.WRITE2 | op.READ2:
+                pending_setmp = None
+                mp = (mp + 2) % 256
+            case op.FILL:
+                pending_setmp = None
+            case op.DOT:
+                mp = (mp + 1) % 256
+        if current_op in (op.WRITE, op.WRITE2, op.FILL):
+            prof.bytes_in += 1
+        if current_op in OUTPUT_OPS:
+            prof.bytes_out += 2 if current_op == op.READ2 else 1
+    prof.redundant_setmp.sort()
+    prof.overwritten_writes.sort()
+    prof.overwritten_results.sort()
+    return prof
@@ -0,0 +1,256 @@
+from tpu import op, CONFIG
+from gemm import compile_gemm
+from driver import TpuDriver, PyTpuBackend
+from profiler import profile
+import argparse
+import asyncio
+import time
+import numpy as np
+
+# Quantized inference on the tpu. Activations and weights are uint8 with a per tensor scale and
+# zero point (real = scale*(q - zero_point)), a dense layer or an im2col lowered convolution is
+# one uint8 GEMM, compiled with gemm.compile_gemm and run through a TpuDriver:
+# - the chip only sums q_x*q_w, the zero point terms, the bias and the requantization of the
+#   sum to the uint8 input of the next layer are done on the host
+# - words wrap at acc_width bits, so K is cut into chunks whose largest possible sum fits in a
+#   word, every chunk reads back the low bytes its sums can reach with byte selected READs.
+#   A 4x4 tile product of 8 bit values already needs 18 bits, more than the 8 bit words of the
+#   chip (CONFIG), so both operands are split into digits (down to bit planes) whose products
+#   do fit, and the digit GEMMs are shifted and summed on the host (digit_split). QUANT_CONFIG
+#   is a 32 bit build that needs no split, no such chip has been made
+# - a batch of samples is one GEMM (a sample per row of X), every weight tile loaded is
+#   used by all samples of the batch before it is evicted
+# reference() runs the same integer pipeline with numpy, the chip has to match it exactly.
+
+QUANT_CONFIG = (4, 4, 32, 1) # (n, banks, acc_width, matmul_cycles), hypothetical
+DIGIT_BITS = (8, 4, 2, 1)
+
+def quant_params(low, high):
+    # (scale, zero_point) mapping [low, high], widened to contain 0, onto 0..255
+    low, high = min(float(low), 0.0), max(float(high), 0.0)
+    scale = (high - low) / 255 or 1.0
+    return scale, int(np.clip(round(-low / scale), 0, 255))
+
+def quantize(x, scale, zero_point):
+    return np.clip(np.round(np.asarray(x) / scale) + zero_point, 0, 255).astype(np.uint8)
+
+def dequantize(q, scale, zero_point):
+    return scale*(np.asarray(q, dtype=np.float64) - zero_point)
+
+def requantize(acc, multiplier, zero_point, relu=False):
+    # integer sums at scale s_x*s_w -> uint8 at the output scale (multiplier = s_x*s_w/s_out),
+    # relu clamps at the zero point
+    q = np.round(acc*multiplier) + zero_point
+    return np.clip(q, zero_point if relu else 0, 255).astype(np.uint8)
+
+def digit_split(acc_width, n, k):
+    # (a digit bits, b digit bits, k terms per chunk) of the split of uint8 operands with the fewest
+    # GEMMs for k terms: a digit GEMM over `terms` whole k tiles must fit in acc_width bits
+    best = None
+    for a_bits in DIGIT_BITS:
+        for b_bits in DIGIT_BITS:
+            product = (2**a_bits - 1)*(2**b_bits - 1)
+            terms = ((2**acc_width - 1) // product // n)*n
+            if not terms:
+                continue
+            gemms = (8 // a_bits)*(8 // b_bits)*-(-k // terms)
+            if best is None or gemms < best[0]:
+                best = (gemms, a_bits, b_bits, terms)
+    assert best, f"{acc_width} bit words can't hold a sum of {n} bit products"
+    return best[1:]
+
+def split_digits(x, bits):
+    # uint8 x = sum of digits[i] << i*bits
+    return [(x >> shift) & (2**bits - 1) for shift in range(0, 8, bits)]
+
+def im2col(x, kernel, stride=1, padding=0, pad_value=0):
+    # (B, C, H, W) -> ((B*H'*W', C*kh*kw) patches, (H', W')), rows in (b, y, x) order,
+    # columns in (c, ky, kx) order like a flattened (O, C, kh, kw) kernel
+    kh, kw = kernel
+    x = np.pad(x, ((0, 0), (0, 0), (padding, padding), (padding, padding)), constant_values=pad_value)
+    windows = np.lib.stride_tricks.sliding_window_view(x, (kh, kw), axis=(2, 3))[:, :, ::stride, ::stride]
+    b, c, oh, ow = windows.shape[:4]
+    return windows.transpose(0, 2, 3, 1, 4, 5).reshape(b*oh*ow, c*kh*kw), (oh, ow)
+
+class Dense:
+    # weights (K, N), bias (N,), float until quantize()
+    def __init__(self, weights, bias, relu=False) -> None:
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.bias = np.asarray(bias, dtype=np.float64)
+        self.relu = relu
+
+    def columns(self, x, pad_value=0):
+        # (rows, K) GEMM input of a batch and the function putting the (rows, N) result back in shape
+        return x.reshape(len(x), -1), lambda y: y
+
+    def forward(self, x):
+        cols, shape = self.columns(x)
+        y = shape(cols @ self.weights + self.bias)
+        return np.maximum(y, 0) if self.relu else y
+
+    def quantize(self, input_params, output_params):
+        w_scale, self.w_zero = quant_params(self.weights.min(), self.weights.max())
+        self.qweights = quantize(self.weights, w_scale, self.w_zero)
+        self.x_zero = input_params[1]
+        self.out_zero = output_params[1]
+        self.column_sums = self.qweights.sum(axis=0, dtype=np.int64)
+        self.qbias = np.round(self.bias / (input_params[0]*w_scale)).astype(np.int64)
+        self.multiplier = input_params[0]*w_scale / output_params[0]
+
+    def output(self, products, cols):
+        # uint8 output from products = cols @ qweights, exact:
+        # sum (x - zx)(w - zw) = sum x*w - zw*sum x - zx*sum w + K*zx*zw
+        k = cols.shape[1]
+        acc = products - self.w_zero*cols.sum(axis=1, keepdims=True, dtype=np.int64) - self.x_zero*self.column_sums \
+            + k*self.x_zero*self.w_zero + self.qbias
+        return requantize(acc, self.multiplier, self.out_zero, self.relu)
+
+class Conv2d(Dense):
+    # weights (O, C, kh, kw), lowered to a GEMM of im2col patches with the (C*kh*kw, O) kernel
+    def __init__(self, weights, bias, stride=1, padding=0, relu=False) -> None:
+        weights = np.asarray(weights, dtype=np.float64)
+        super().__init__(weights.reshape(len(weights), -1).T, bias, relu)
+        self.kernel = weights.shape[2:]
+        self.stride = stride
+        self.padding = padding
+
+    def columns(self, x, pad_value=0):
+        # quantized inputs are padded with their zero point, the real value 0
+        cols, (oh, ow) = im2col(x, self.kernel, self.stride, self.padding, pad_value)
+        batch = len(x)
+        return cols, lambda y: y.reshape(batch, oh, ow, -1).transpose(0, 3, 1, 2)
+
+class TpuMatmul:
+    # exact a @ b of uint8 arrays on a TpuDriver, keeps every program for the stats.
+    # The loop order search of compile_gemm runs once per GEMM shape, later batches reuse its pick
+    def __init__(self, driver, order=None) -> None:
+        self.driver = driver
+        self.order = order
+        self.orders = {} # (a shape, b shape) -> loop order
+        self.programs = []
+        self.macs = 0
+
+    async def __call__(self, a, b):
+        n, _, acc_width, _ = self.driver.config
+        a_bits, b_bits, terms = digit_split(acc_width, n, a.shape[1])
+        result = np.zeros((a.shape[0], b.shape[1]), dtype=np.int64)
+        for i, a_digit in enumerate(split_digits(a, a_bits)):
+            for j, b_digit in enumerate(split_digits(b, b_bits)):
+                if not a_digit.any() or not b_digit.any():
+                    continue
+                result += await self.chunks(a_digit, b_digit, terms) << (i*a_bits + j*b_bits)
+        self.macs += a.shape[0]*a.shape[1]*b.shape[1]
+        return result
+
+    async def chunks(self, a, b, terms):
+        # exact a @ b with `terms` k terms per GEMM
+        n, banks, _, matmul_cycles = self.driver.config
+        result = np.zeros((a.shape[0], b.shape[1]), dtype=np.int64)
+        for start in range(0, a.shape[1], terms):
+            chunk_a, chunk_b = a[:, start:start+terms], b[start:start+terms]
+            # sum_k a[i, k]*b[k, j] <= max_i sum_k a[i, k] * max b
+            largest = int(chunk_a.sum(axis=1, dtype=np.int64).max(initial=0))*int(chunk_b.max(initial=0))
+            read_bytes = max(-(-largest.bit_length() // 8), 1)
+            shapes = (chunk_a.shape, chunk_b.shape)
+            # READ2 has no byte select, wider sums are read back with single READs
+            prog = compile_gemm(chunk_a, chunk_b, self.order or self.orders.get(shapes), burst=read_bytes == 1,
+                                n=n, banks=banks, matmul_cycles=matmul_cycles, read_bytes=read_bytes)
+            self.orders[shapes] = prog.order
+            prog.instructions.insert(0, (op.SETMP, 0)) # programs assume mp = 0, the last one left it anywhere
+            self.programs.append(prog)
+            result += prog.collect(await self.driver.run(prog.packed()))
+        return result
+
+class QuantModel:
+    # layers quantized with per tensor ranges of the float activations of the calibration inputs
+    def __init__(self, layers, calibration) -> None:
+        self.layers = layers
+        x = np.asarray(calibration, dtype=np.float64)
+        self.input = quant_params(x.min(), x.max())
+        params = self.input
+        for layer in layers:
+            x = layer.forward(x)
+            output = quant_params(x.min(), x.max())
+            layer.quantize(params, output)
+            params = output
+        self.output = params
+
+    def forward(self, x):
+        for layer in self.layers:
+            x = layer.forward(x)
+        return x
+
+    async def infer(self, x, matmul):
+        # uint8 output of the last layer, `await matmul(a, b)` is the exact int a @ b of every layer
+        q = quantize(np.asarray(x, dtype=np.float64), *self.input)
+        for layer in self.layers:
+            cols, shape = layer.columns(q, layer.x_zero)
+            q = shape(layer.output(await matmul(cols, layer.qweights), cols))
+        return q
+
+    def reference(self, x):
+        async def matmul(a, b):
+            return a.astype(np.int64) @ b.astype(np.int64)
+        return asyncio.run(self.infer(x, matmul))
+
+    async def run_async(self, x, driver, batch=16, order=None):
+        # (uint8 outputs, TpuMatmul) of all samples, `batch` samples per GEMM
+        matmul = TpuMatmul(driver, order)
+        outputs = [await self.infer(x[start:start+batch], matmul) for start in range(0, len(x), batch)]
+        return np.concatenate(outputs), matmul
+
+    def run(self, x, backend=None, batch=16, order=None):
+        # on backend (driver.PyTpuBackend() of the chip by default)
+        driver = TpuDriver(backend or PyTpuBackend(CONFIG))
+        return asyncio.run(self.run_async(x, driver, batch, order))
+
+def mnist_model(rng, calibration):
+    # 28x28 -> 3x3 conv, 4 channels, stride 2 -> 676 -> 32 -> 10, random weights
+    def init(*shape):
+        return rng.normal(0, 1/np.sqrt(np.prod(shape[1:]) if len(shape) > 2 else shape[0]), size=shape)
+    layers = [Conv2d(init(4, 1, 3, 3), rng.normal(0, 0.1, 4), stride=2, relu=True),
+              Dense(init(676, 32), rng.normal(0, 0.1, 32), relu=True),
+              Dense(init(32, 10), rng.normal(0, 0.1, 10))]
+    return QuantModel(layers, calibration)
+
+def digits(rng, count):
+    # stand-in for MNIST: sparse strokes in [0, 1] on a 28x28 canvas
+    images = rng.random((count, 1, 28, 28))*(rng.random((count, 1, 28, 28)) < 0.2)
+    images[:, :, :4] = images[:, :, -4:] = images[:, :, :, :4] = images[:, :, :, -4:] = 0
+    return images
+
+def bench(samples=16, batches=(1, 4, 16), configs=(CONFIG, QUANT_CONFIG)):
+    # a row per (config, batch), CONFIG is the chip, QUANT_CONFIG the 32 bit build that doesn't exist
+    rng = np.random.default_rng(0)
+    x = digits(rng, samples)
+    model = mnist_model(rng, x)
+    reference = model.reference(x)
+    float_top = model.forward(x).argmax(axis=1)
+    table = []
+    for config in configs:
+        for batch in batches:
+            start = time.perf_counter()
+            outputs, matmul = model.run(x, PyTpuBackend(config), batch)
+            elapsed = time.perf_counter() - start
+            prof = profile([i for prog in matmul.programs for i in prog.instructions], n=config[0], banks=config[1])
+            table.append((config[2], batch, prof.instructions/samples, prof.cycles/samples, prof.bytes_in/samples,
+                          prof.bytes_out/samples, prof.wall_time/samples*1e3, matmul.macs/prof.cycles,
+                          prof.io_cycles/prof.cycles, (outputs == reference).all(),
+                          (outputs.argmax(axis=1) == float_top).mean(), elapsed))
+    return table
+
+if __name__ == "__main__":
+    import tabulate
+    parser = argparse.ArgumentParser(description="per inference cost of a quantized MNIST sized model on the tpu")
+    parser.add_argument("--samples", type=int, default=16)
+    parser.add_argument("--batch", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--acc-width", type=int, nargs="+", default=[CONFIG[2], QUANT_CONFIG[2]],
+                        help="8 is the chip, wider words are hypothetical builds")
+    parser.add_argument("--matmul-cycles", type=int, default=QUANT_CONFIG[3])
+    args = parser.parse_args()
+    configs = [(*QUANT_CONFIG[:2], acc_width, args.matmul_cycles) for acc_width in args.acc_width]
+    table = bench(args.samples, args.batch, configs)
+    print(tabulate.tabulate(table, headers=["acc bits", "batch", "instructions", "cycles", "bytes in", "bytes out",
+                                            "ms at 100 kHz", "MACs/cycle", "io share", "matches numpy", "top-1 vs float",
+                                            "host s"], floatfmt=".2f"))
+    assert all(row[9] for row in table)
@@ -0,0 +1,164 @@
+from tpu import op, pyTpu, generate_top, OP_TABLE, DUAL_TABLE, CONFIG
+from fuzz import random_program
+from concurrent.futures import ThreadPoolExecutor
+import xml.etree.ElementTree as ET
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import numpy as np
+import tabulate
+
+# Golden model scoreboard of the cocotb regression (test_full_random in test/test.py).
+# The stimulus of a shard is a (cycles, 2) uint8 array of (ui_in, uio_in):
+#   exhaustive  every one of the 65536 pairs, ui_in major, cut into `shards` contiguous runs
+#   random      fuzz.random_program streams of `cycles` instructions, seeded by (seed, shard)
+# expected() runs it through pyTpu (non strict, like fuzz) from reset up front, the test only
+# drives the array and samples uo_out, uio_out and uio_oe at every falling edge, and the whole
+# run is compared at once. Every shard starts from reset, so shards are independent and run as
+# parallel cocotb builds (one SIM_BUILD each), regress() merges their reports and results.xml:
+#   python scoreboard.py [--stimulus random --cycles 100000] [--shards 8] [--workers 4]
+# The test reads its shard from the environment (ENV), without it it runs the exhaustive stimulus
+# in one shard.
+
+PAIRS = 1 << 16
+FIELDS = ("uo_out", "uio_out", "uio_oe")
+ENV = {"stimulus": "SCOREBOARD_STIMULUS", "shard": "SCOREBOARD_SHARD", "shards": "SCOREBOARD_SHARDS",
+       "cycles": "SCOREBOARD_CYCLES", "seed": "SCOREBOARD_SEED", "report": "SCOREBOARD_REPORT"}
+DEFAULTS = {"stimulus": "exhaustive", "shard": 0, "shards": 1, "cycles": PAIRS, "seed": 0, "report": None}
+TEST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test")
+
+def stimulus(kind="exhaustive", shard=0, shards=1, cycles=PAIRS, seed=0, config=CONFIG):
+    assert 0 <= shard < shards, f"no shard {shard} of {shards}"
+    if kind == "exhaustive":
+        pairs = np.stack(np.divmod(np.arange(PAIRS), 256), axis=1).astype(np.uint8)
+        return np.array_split(pairs, shards)[shard]
+    assert kind == "random", f"unknown stimulus {kind}"
+    n, banks = config[:2]
+    return np.array(random_program(np.random.default_rng([seed, shard]), cycles, banks*n*n), dtype=np.uint8)
+
+def expected(program, config=CONFIG, ops=None):
+    # (cycles, 3) uint8 uo_out, uio_out, uio_oe after every clock edge
+    tpu_ = pyTpu(*config, strict=False, ops=ops)
+    result = np.empty((len(program), len(FIELDS)), dtype=np.uint8)
+    for n, (ui_in, uio_in) in enumerate(program.tolist()):
+        tpu_.execute(op(OP_TABLE[ui_in]), uio_in, op(DUAL_TABLE[ui_in]))
+        result[n] = tpu_.output, tpu_.uio_out, tpu_.uio_oe
+    return result
+
+def mismatches(program, want, got, limit=10):
+    # (count, the first `limit` mismatching cycles as dicts)
+    cycles = np.flatnonzero((want != got).any(axis=1))
+    first = [{"cycle": int(n), "ui_in": int(program[n, 0]), "uio_in": int(program[n, 1]),
+              "op": op(OP_TABLE[program[n, 0]]).name,
+              "expected": dict(zip(FIELDS, want[n].tolist())), "got": dict(zip(FIELDS, got[n].tolist()))}
+             for n in cycles[:limit]]
+    return len(cycles), first
+
+async def drive(dut, program):
+    # test/tb.v outputs at the falling edge after every instruction, where the next one is set,
+    # so a cycle costs a single await
+    from cocotb.triggers import FallingEdge
+    got = np.empty((len(program), len(FIELDS)), dtype=np.uint8)
+    edge = FallingEdge(dut.clk)
+    await edge
+    for n, (ui_in, uio_in) in enumerate(program.tolist()):
+        dut.ui_in.value = ui_in
+        dut.uio_in.value = uio_in
+        await edge
+        got[n] = int(dut.uo_out.value), int(dut.uio_out.value), int(dut.uio_oe.value)
+    dut.ui_in.value = 0
+    dut.uio_in.value = 0
+    return got
+
+def shard_args(environ=os.environ):
+    args = {name: environ.get(var, DEFAULTS[name]) for name, var in ENV.items()}
+    args.update({name: int(args[name]) for name in ("shard", "shards", "cycles", "seed")})
+    return args
+
+async def run_shard(dut, args, config=CONFIG):
+    # the report of one shard, also written to args["report"] when set
+    program = stimulus(args["stimulus"], args["shard"], args["shards"], args["cycles"], args["seed"], config)
+    want = expected(program, config)
+    start = time.perf_counter()
+    got = await drive(dut, program)
+    count, first = mismatches(program, want, got)
+    report = {key: args[key] for key in ("stimulus", "shard", "shards", "seed")}
+    report.update({"cycles": len(program), "mismatches": count, "first": first, "wall_time": time.perf_counter() - start})
+    if args["report"]:
+        with open(args["report"], "w") as f:
+            json.dump(report, f, indent=1)
+    return report
+
+def merge_results(paths, out):
+    # the testcases of the shards' cocotb results.xml files in one testsuite
+    merged = ET.Element("testsuites", name="results")
+    suite = ET.SubElement(merged, "testsuite", name="scoreboard")
+    for k, path in enumerate(paths):
+        if os.path.exists(path):
+            for case in ET.parse(path).getroot().iter("testcase"):
+                case.set("name", f"{case.get('name')}[shard {k}]")
+                suite.append(case)
+    ET.ElementTree(merged).write(out)
+    return sum(1 for case in suite if case.find("failure") is not None or case.find("error") is not None)
+
+def merge_reports(reports):
+    return {"shards": len(reports), "cycles": sum(r["cycles"] for r in reports),
+            "mismatches": sum(r["mismatches"] for r in reports),
+            "first": [dict(f, shard=r["shard"]) for r in reports for f in r["first"]]}
+
+def regress(stimulus="exhaustive", shards=4, cycles=PAIRS, seed=0, workers=None, sim="icarus", out="scoreboard"):
+    # runs every shard as its own make in test/, returns (merged report, shard reports, failed testcases)
+    generate_top(os.path.join(TEST_DIR, "..", "src", "top_tpu.v")) # PROJECT_SOURCES of test/Makefile
+    out = os.path.abspath(out)
+    os.makedirs(out, exist_ok=True)
+
+    def shard(k):
+        env = dict(os.environ, SCOREBOARD_STIMULUS=stimulus, SCOREBOARD_SHARD=str(k), SCOREBOARD_SHARDS=str(shards),
+                   SCOREBOARD_CYCLES=str(cycles), SCOREBOARD_SEED=str(seed),
+                   SCOREBOARD_REPORT=os.path.join(out, f"shard_{k}.json"),
+                   COCOTB_RESULTS_FILE=os.path.join(out, f"results_{k}.xml"))
+        result = subprocess.run(["make", f"SIM={sim}", f"SIM_BUILD=sim_build/{sim}_shard_{k}", "TESTCASE=test_full_random"],
+                                cwd=TEST_DIR, env=env, capture_output=True, text=True)
+        with open(os.path.join(out, f"shard_{k}.log"), "w") as f:
+            f.write(result.stdout + result.stderr)
+
+    # the simulators do the work, threads are enough to wait on them
+    with ThreadPoolExecutor(workers or os.cpu_count()) as pool:
+        list(pool.map(shard, range(shards)))
+    reports = []
+    for k in range(shards):
+        path = os.path.join(out, f"shard_{k}.json")
+        if os.path.exists(path):
+            with open(path) as f:
+                reports.append(json.load(f))
+    failed = merge_results([os.path.join(out, f"results_{k}.xml") for k in range(shards)], os.path.join(out, "results.xml"))
+    report = merge_reports(reports)
+    report["missing"] = sorted(set(range(shards)) - {r["shard"] for r in reports})
+    with open(os.path.join(out, "scoreboard.json"), "w") as f:
+        json.dump({"total": report, "shards": reports}, f, indent=1)
+    return report, reports, failed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="sharded cocotb regression of the chip against pyTpu")
+    parser.add_argument("--stimulus", choices=["exhaustive", "random"], default="exhaustive")
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--cycles", type=int, default=PAIRS, help="per shard, random stimulus only")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--sim", choices=["icarus", "verilator"], default="icarus")
+    parser.add_argument("--out", default="scoreboard", help="directory of the shard logs and merged results")
+    args = parser.parse_args()
+    total, reports, failed = regress(args.stimulus, args.shards, args.cycles, args.seed, args.workers, args.sim, args.out)
+    print(tabulate.tabulate([(r["shard"], r["cycles"], r["mismatches"], r["wall_time"]) for r in reports],
+                            headers=["shard", "cycles", "mismatches", "sim s"], floatfmt=".1f"))
+    for f in total["first"]:
+        print(f"shard {f['shard']} cycle {f['cycle']}: {f['op']} ui_in=0x{f['ui_in']:02x} uio_in=0x{f['uio_in']:02x} "
+              f"expected {f['expected']} got {f['got']}")
+    print(f"{total['mismatches']} mismatches in {total['cycles']} cycles of {len(reports)} shards")
+    if total["missing"]:
+        print(f"shards {total['missing']} didn't report, see their logs in {args.out}")
+    if total["mismatches"] or total["missing"] or failed:
+        sys.exit(1)
@@ -0,0 +1,102 @@
+from tpu import tpu, generate_top, CONFIG
+import scoreboard
+from amaranth.sim import Simulator
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import numpy as np
+import tabulate
+
+# Throughput of the simulation engines on the same workload, the scoreboard stimulus checked
+# against pyTpu every cycle:
+#   amaranth   the Python simulator of tpu, driven and sampled like the cocotb test does
+#   icarus     test_full_random of test/test.py through make SIM=icarus
+#   verilator  the same through make SIM=verilator
+# cycles/s is the driving loop alone (the shard report's wall_time for cocotb), build is everything
+# else: elaboration and Simulator setup, or make compiling a clean SIM_BUILD and starting python.
+# Long runs want the highest cycles/s, short ones the lowest build + cycles / (cycles/s).
+#   python simbench.py [--cycles 20000] [--stimulus random] [--engines amaranth verilator]
+
+ENGINES = ("amaranth", "icarus", "verilator")
+TOOLS = {"icarus": "iverilog", "verilator": "verilator"}
+
+def available(engine):
+    return engine not in TOOLS or shutil.which(TOOLS[engine]) is not None
+
+def run_amaranth(program, config=CONFIG):
+    # (build s, run s, outputs)
+    start = time.perf_counter()
+    dut = tpu(*config)
+    sim = Simulator(dut)
+    sim.add_clock(1e-6)
+    got = np.empty((len(program), len(scoreboard.FIELDS)), dtype=np.uint8)
+    times = []
+
+    async def bench(ctx):
+        times.append(time.perf_counter())
+        for n, (ui_in, uio_in) in enumerate(program.tolist()):
+            ctx.set(dut.input, ui_in)
+            ctx.set(dut.input2, uio_in)
+            await ctx.tick()
+            got[n] = ctx.get(dut.output), ctx.get(dut.uio_out), ctx.get(dut.uio_oe)
+        times.append(time.perf_counter())
+
+    sim.add_testbench(bench)
+    sim.run()
+    return times[0] - start, times[1] - times[0], got
+
+def run_cocotb(sim, args):
+    # (build s, run s, shard report) of a clean build of test/ under sim
+    with tempfile.TemporaryDirectory() as tmp:
+        report = os.path.join(tmp, "shard.json")
+        env = dict(os.environ, SCOREBOARD_STIMULUS=args["stimulus"], SCOREBOARD_SHARD="0", SCOREBOARD_SHARDS="1",
+                   SCOREBOARD_CYCLES=str(args["cycles"]), SCOREBOARD_SEED=str(args["seed"]), SCOREBOARD_REPORT=report,
+                   COCOTB_RESULTS_FILE=os.path.join(tmp, "results.xml"))
+        build = f"sim_build/bench_{sim}"
+        shutil.rmtree(os.path.join(scoreboard.TEST_DIR, build), ignore_errors=True)
+        start = time.perf_counter()
+        subprocess.run(["make", f"SIM={sim}", f"SIM_BUILD={build}", "TESTCASE=test_full_random"],
+                       cwd=scoreboard.TEST_DIR, env=env, check=True, capture_output=True)
+        elapsed = time.perf_counter() - start
+        with open(report) as f:
+            result = json.load(f)
+    return elapsed - result["wall_time"], result["wall_time"], result
+
+def bench(engines=ENGINES, stimulus="random", cycles=20000, seed=0):
+    # {engine: {"cycles", "build", "run", "rate", "mismatches"} or None when its tool is missing}
+    args = {"stimulus": stimulus, "shard": 0, "shards": 1, "cycles": cycles, "seed": seed}
+    program = scoreboard.stimulus(stimulus, 0, 1, cycles, seed)
+    if {"icarus", "verilator"} & set(engines):
+        generate_top(os.path.join(scoreboard.TEST_DIR, "..", "src", "top_tpu.v")) # PROJECT_SOURCES of test/Makefile
+    results = {}
+    for engine in engines:
+        if not available(engine):
+            results[engine] = None
+            continue
+        if engine == "amaranth":
+            build, run, got = run_amaranth(program)
+            count, _ = scoreboard.mismatches(program, scoreboard.expected(program), got)
+        else:
+            build, run, report = run_cocotb(engine, args)
+            count = report["mismatches"]
+        results[engine] = {"cycles": len(program), "build": build, "run": run, "rate": len(program)/run,
+                           "mismatches": count}
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="cycles/s of amaranth, icarus and verilator on one workload")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--stimulus", choices=["exhaustive", "random"], default="random")
+    parser.add_argument("--cycles", type=int, default=20000, help="random stimulus only, exhaustive is 65536")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    results = bench(args.engines, args.stimulus, args.cycles, args.seed)
+    table = [(engine, r["cycles"], r["build"], r["run"], r["rate"], r["mismatches"]) if r else
+             (engine, None, None, None, None, f"{TOOLS[engine]} not found") for engine, r in results.items()]
+    print(tabulate.tabulate(table, headers=["engine", "cycles", "build s", "run s", "cycles/s", "mismatches"],
+                            floatfmt=".4g"))
+    assert not any(r["mismatches"] for r in results.values() if r)
@@ -0,0 +1,166 @@
+from tpu import op, tpu, pack_program, OP_TABLE, DUAL_TABLE
+from amaranth import Cat
+from amaranth.sim import Simulator
+from fnmatch import fnmatch
+import json
+import struct
+import time
+import numpy as np
+import tabulate
+from vcd import VCDWriter
+
+# Simulation runner with optional tracing.
+# Tracing is off by default. The binary trace is columnar: one uint8 per traced signal per
+# cycle, after a small header, so a trace file maps straight into a (cycles, signals) array:
+#   magic "TPUTRACE" | uint32 header length | json {"signals": [...], "period": s} | records
+
+MAGIC = b"TPUTRACE"
+PERIOD = 1e-6 # clock period used by every simulation in this repo
+
+def trace_signals(dut, signals=None):
+    # name -> 8-bit signal, optionally filtered by a list of glob patterns ("m_1*", "mp", ...)
+    named = {"ui_in": dut.input, "uio_in": dut.input2, "uo_out": dut.output, "uio_out": dut.uio_out,
+             "uio_oe": dut.uio_oe, "mp": dut.mp}
+    named.update({f"m_{i}": m for i, m in enumerate(dut.memory)})
+    if signals is None:
+        return named
+    return {name: s for name, s in named.items() if any(fnmatch(name, pattern) for pattern in signals)}
+
+def write_header(f, names, period=PERIOD):
+    header = json.dumps({"signals": names, "period": period}).encode()
+    # pad so the records start on an 8 byte boundary
+    header += b" "*(-(len(MAGIC) + 4 + len(header)) % 8)
+    f.write(MAGIC + struct.pack("<I", len(header)) + header)
+    return len(MAGIC) + 4 + len(header)
+
+def load_trace(path):
+    # (names, period, (cycles, signals) uint8 memmap)
+    with open(path, "rb") as f:
+        assert f.read(len(MAGIC)) == MAGIC, f"{path} is not a tpu trace"
+        length, = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(length))
+    names = header["signals"]
+    offset = len(MAGIC) + 4 + length
+    data = np.memmap(path, dtype=np.uint8, mode="r", offset=offset)
+    return names, header["period"], data.reshape(-1, len(names))
+
+def trace_to_vcd(path, vcd_path):
+    names, period, records = load_trace(path)
+    with open(vcd_path, "w") as f:
+        with VCDWriter(f, timescale="1 ns") as writer:
+            variables = [writer.register_var("tpu", name, "wire", size=8) for name in names]
+            previous = None
+            for cycle, record in enumerate(records):
+                t = round(cycle*period*1e9)
+                for n, value in enumerate(record.tolist()):
+                    if previous is None or previous[n] != value:
+                        writer.change(variables[n], t, value)
+                previous = record.tolist()
+
+class SimState:
+    # read only pyTpu like view of the simulated chip for pyTpu.add_hook style hooks,
+    # every access is a ctx.get, so it only costs anything when hooks use it
+    def __init__(self, ctx, dut) -> None:
+        self.ctx = ctx
+        self.dut = dut
+        self.n, self.banks, self.acc_width, self.matmul_cycles = dut.n, dut.banks, dut.acc_width, dut.matmul_cycles
+        self.config = (self.n, self.banks, self.acc_width, self.matmul_cycles)
+        self.ops = dut.ops
+
+    @property
+    def memory(self):
+        return [self.ctx.get(m) for m in self.dut.memory]
+
+    @property
+    def mp(self):
+        return self.ctx.get(self.dut.mp)
+
+    @property
+    def output(self):
+        return self.ctx.get(self.dut.output)
+
+class SimRunner:
+    # trace: path of a binary trace of the signals matching `signals`
+    # vcd: path of a full amaranth VCD dump (every signal, slow)
+    # hooks: (pre, post) pairs called around every clock like pyTpu.add_hook ones, with a SimState
+    def __init__(self, trace=None, signals=None, vcd=None, hooks=()) -> None:
+        self.trace = trace
+        self.signals = signals
+        self.vcd = vcd
+        self.hooks = list(hooks)
+        self.elapsed = 0 # seconds spent clocking the last program, without elaboration
+
+    def run(self, program):
+        # program: [(op, uio_in), ...] or packed (ui_in, uio_in) bytes, returns uo_out after every cycle
+        if not isinstance(program, (bytes, bytearray, memoryview, np.ndarray)):
+            program = pack_program(program)
+        program = np.frombuffer(bytes(program), dtype=np.uint8).reshape(-1, 2).tolist()
+        dut = tpu()
+        sim = Simulator(dut)
+        sim.add_clock(PERIOD)
+        outputs = np.zeros(len(program), dtype=np.uint8)
+        # all traced signals are fetched as one wide value, its bytes are the record
+        traced = Cat(*trace_signals(dut, self.signals).values()) if self.trace else None
+        width = len(traced) // 8 if self.trace else 0
+
+        async def test_bench(ctx):
+            f = open(self.trace, "wb") if self.trace else None
+            if f:
+                write_header(f, list(trace_signals(dut, self.signals)))
+            state = SimState(ctx, dut) if self.hooks else None
+            chunk = bytearray()
+            start = time.perf_counter()
+            for n, (ui_in, uio_in) in enumerate(program):
+                if state:
+                    decoded = (op(OP_TABLE[ui_in]), uio_in, op(DUAL_TABLE[ui_in]))
+                    for pre, _ in self.hooks:
+                        if pre:
+                            pre(state, *decoded)
+                ctx.set(dut.input, ui_in)
+                ctx.set(dut.input2, uio_in)
+                await ctx.tick()
+                outputs[n] = ctx.get(dut.output)
+                if state:
+                    for _, post in self.hooks:
+                        if post:
+                            post(state, *decoded)
+                if f:
+                    chunk.extend(ctx.get(traced).to_bytes(width, "little"))
+                    if len(chunk) >= 1 << 16:
+                        f.write(chunk)
+                        chunk.clear()
+            if f:
+                f.write(chunk)
+                f.close()
+            self.elapsed = time.perf_counter() - start
+
+        sim.add_testbench(test_bench)
+        if self.vcd:
+            with sim.write_vcd(self.vcd):
+                sim.run()
+        else:
+            sim.run()
+        return outputs
+
+def bench(cycles=2000, path="bench"):
+    # cycles/sec of the same random program untraced, with binary traces and with a full VCD
+    rng = np.random.default_rng(0)
+    program = [(op(o), int(a)) for o, a in zip(rng.integers(0, 8, cycles), rng.integers(0, 256, cycles))]
+    runs = [
+        ("no trace", {}),
+        ("binary, uo_out+mp", {"trace": f"{path}.tpt", "signals": ["uo_out", "mp"]}),
+        ("binary, all signals", {"trace": f"{path}.tpt"}),
+        ("amaranth vcd", {"vcd": f"{path}.vcd"}),
+    ]
+    table = []
+    for name, kwargs in runs:
+        runner = SimRunner(**kwargs)
+        runner.run(program)
+        table.append((name, cycles/runner.elapsed))
+    start = time.perf_counter()
+    trace_to_vcd(f"{path}.tpt", f"{path}_converted.vcd")
+    table.append(("binary -> vcd conversion", cycles/(time.perf_counter() - start)))
+    return table
+
+if __name__ == "__main__":
+    print(tabulate.tabulate(bench(), headers=["run", "cycles/s"], floatfmt=".0f"))
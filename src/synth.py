@@ -0,0 +1,105 @@
+from tpu import pyTpu, op, op_set, generate_top, PROFILES
+from gemm import compile_gemm
+from profiler import profile
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import numpy as np
+import tabulate
+
+# Yosys area and depth report of the generated top level.
+# Cell counts come from `stat` after a generic `synth`, the longest path estimate from
+# `ltp -noff`: the number of cells on the longest combinational path between flip-flops
+# and ports, which is what limits the clock once the design is mapped to the standard cells.
+# ABC is skipped by default (it takes minutes on this design), use --abc for the mapped netlist.
+
+TOP = "tt_um_COLVERTYETY_top"
+SWEEP = [(2, 4, 8, 1), (4, 2, 8, 1), (4, 4, 8, 1), (4, 4, 8, 4), (4, 4, 8, 16), (4, 4, 16, 1),
+         (8, 4, 8, 1), (8, 4, 8, 8)] # (n, banks, acc_width, matmul_cycles)
+
+def find_yosys():
+    # $YOSYS, then yosys on the PATH, then the yowasp-yosys python package
+    for candidate in (os.environ.get("YOSYS"), "yosys", "yowasp-yosys"):
+        if candidate and shutil.which(candidate):
+            return candidate
+    raise FileNotFoundError("no yosys found, install yosys or `pip install yowasp-yosys` or set $YOSYS")
+
+def synth_report(verilog=None, abc=False, yosys=None, config=(4, 4, 8, 1), ops=None):
+    # {"cells": total, "cell_types": {type: count}, "longest_path": cells} of a verilog file,
+    # by default of a freshly generated tpu(*config, ops=ops)
+    with tempfile.TemporaryDirectory() as tmp:
+        # yosys runs inside the temporary directory, the wasm build can't see anything else
+        if verilog is None:
+            generate_top(os.path.join(tmp, "top_tpu.v"), config, ops)
+        else:
+            shutil.copy(verilog, os.path.join(tmp, "top_tpu.v"))
+        script = f"read_verilog top_tpu.v; synth -flatten {'' if abc else '-noabc '}-top {TOP}; stat; ltp -noff"
+        log = subprocess.run([yosys or find_yosys(), "-p", script], cwd=tmp,
+                             capture_output=True, text=True, check=True).stdout
+    # the last stat block is the one after synth
+    stat = log[log.rindex(f"=== {TOP} ==="):]
+    cells = int(re.search(r"^\s*(\d+) cells$", stat, re.M).group(1))
+    cell_types = {name: int(count) for count, name in re.findall(r"^\s*(\d+)\s+(\$\S+)$", stat, re.M)}
+    longest = int(re.search(r"Longest topological path in \S+ \(length=(\d+)\)", log).group(1))
+    return {"cells": cells, "cell_types": cell_types, "longest_path": longest}
+
+def sweep(configs=SWEEP, size=16, abc=False):
+    # area, depth and the cycles of a size x size gemm for every configuration
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 256, size=(size, size))
+    b = rng.integers(0, 256, size=(size, size))
+    table = []
+    for n, banks, acc_width, matmul_cycles in configs:
+        report = synth_report(abc=abc, config=(n, banks, acc_width, matmul_cycles))
+        flops = sum(count for name, count in report["cell_types"].items() if "DFF" in name)
+        prog = compile_gemm(a, b, n=n, banks=banks, matmul_cycles=matmul_cycles)
+        assert (prog.collect(pyTpu(n, banks, acc_width, matmul_cycles).run(prog.packed())) == (a @ b) % 256).all()
+        cycles = profile(prog.instructions, n=n, banks=banks).cycles
+        table.append((f"{n}x{n}", banks, acc_width, matmul_cycles, report["cells"], flops, report["longest_path"],
+                      n**3 // matmul_cycles, cycles))
+    return table
+
+def profile_sweep(profiles=PROFILES, config=(4, 4, 8, 1), abc=False):
+    # area and depth of every build profile, and the share of the full build's cells it saves
+    full = synth_report(abc=abc, config=config)["cells"]
+    table = []
+    for name, ops in profiles.items():
+        report = synth_report(abc=abc, config=config, ops=ops)
+        flops = sum(count for cell, count in report["cell_types"].items() if "DFF" in cell)
+        table.append((name, " ".join(o.name for o in op if o in op_set(ops) and o != op.NOOP), report["cells"], flops,
+                      report["longest_path"], f"{1 - report['cells']/full:.0%}"))
+    return table
+
+def op_cells(config=(4, 4, 8, 1), abc=False):
+    # {op: cells of the full build minus cells of the build without it}, what each op costs on its own
+    full = synth_report(abc=abc, config=config)["cells"]
+    return {o: full - synth_report(abc=abc, config=config, ops=op_set() - {o})["cells"] for o in op if o != op.NOOP}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="yosys cell counts and longest path of the tpu")
+    parser.add_argument("verilog", nargs="?", default=None, help="verilog to report on, default: generate it")
+    parser.add_argument("--abc", action="store_true", help="map to gates with abc (slow)")
+    parser.add_argument("--sweep", action="store_true", help="compare the tile sizes, bank counts and widths of SWEEP")
+    parser.add_argument("--profile", choices=list(PROFILES), default="full", help="report on this build profile")
+    parser.add_argument("--profiles", action="store_true", help="compare the build profiles of PROFILES")
+    parser.add_argument("--ops", action="store_true", help="cells of every op, the full build minus the build without it")
+    args = parser.parse_args()
+    if args.profiles:
+        print(tabulate.tabulate(profile_sweep(abc=args.abc), headers=["profile", "ops", "cells", "flip-flops",
+                                                                     "longest path", "saved"]))
+        raise SystemExit
+    if args.ops:
+        print(tabulate.tabulate([(o.name, cells) for o, cells in op_cells(abc=args.abc).items()], headers=["op", "cells"]))
+        raise SystemExit
+    if args.sweep:
+        print(tabulate.tabulate(sweep(abc=args.abc), headers=["tile", "banks", "acc width", "MATMUL cycles", "cells",
+                                                              "flip-flops", "longest path", "MACs", "16x16 gemm cycles"]))
+        raise SystemExit
+    report = synth_report(args.verilog, args.abc, ops=PROFILES[args.profile])
+    table = sorted(report["cell_types"].items())
+    table.append(("total cells", report["cells"]))
+    table.append(("longest path (cells)", report["longest_path"]))
+    print(tabulate.tabulate(table, headers=["cell", "count"]))
@@ -1,4 +1,22 @@
 from tpu import *
+from gemm import compile_gemm, gemm
+from profiler import profile
+from fuzz import fuzz, random_program
+from simtrace import SimRunner, load_trace, trace_to_vcd
+from driver import TpuDriver, PyTpuBackend, SimBackend, SerialBackend, SerialBoard, output_counts
+from tpuarray import TpuArray, Reload, compile_arrays, dot, evaluate
+from backdoor import SimBackdoor
+from quant import Dense, Conv2d, QuantModel, TpuMatmul, digit_split, im2col, QUANT_CONFIG
+import perf
+import scoreboard
+import simbench
+from instrument import Counters
+import gencache
+import asyncio
+import json
+import os
+import shutil
+import tempfile
 import numpy as np
 
 
@@ -63,17 +81,714 @@ def test_python_tpu_():
         print(inp[0].name,"\n", tpu_)
     return True
 
+def test_np_tpu_():
+    rng = np.random.default_rng(0)
+    n = 256
+    tpu_ = npTpu(n)
+    data = rng.integers(0, 256, size=(n, 64), dtype=np.uint8)
+    tpu_.step(op.SETMP, 0)
+    for i in range(64):
+        tpu_.step(op.WRITE, data[:, i])
+    assert (tpu_.memory.reshape(n, 64) == data).all()
+    assert (tpu_.mp == 64).all()
+    banks = data.reshape(n, 4, 4, 4).astype(np.int64)
+    # every instance runs a different op on different banks in the same step
+    ops = rng.choice([op.MMUL, op.DOT, op.MATMUL, op.SUM, op.MATVEC, op.ROWDOT, op.BANK], size=n)
+    args = rng.integers(0, 256, size=n, dtype=np.uint8)
+    tpu_.step(ops, args)
+    for i in range(n):
+        a, b, c = args[i] >> 6, (args[i] >> 4) & 3, (args[i] >> 2) & 3
+        expected = banks[i].copy()
+        match ops[i]:
+            case op.MMUL:
+                expected[c] = banks[i, a] * banks[i, b]
+            case op.DOT:
+                expected[c, 0, 0] = banks[i, a, 0] @ banks[i, b, 0]
+            case op.MATMUL:
+                expected[c] = banks[i, a] @ banks[i, b]
+            case op.SUM:
+                assert tpu_.output[i] == banks[i, a].sum() % 256
+            case op.MATVEC:
+                expected[c, 0] = banks[i, a] @ banks[i, b, 0]
+            case op.ROWDOT:
+                expected[c, 0] = (banks[i, a] * banks[i, b]).sum(axis=1)
+            case op.BANK if args[i] & 3 < 3:
+                expected[c] = [banks[i, a], banks[i, a].T, 0][args[i] & 3]
+        assert (tpu_.memory[i] == expected % 256).all(), f"{ops[i].name} mismatch at {i}"
+    # read everything back, out of range mp reads 0
+    tpu_.step(op.SETMP, 0)
+    outputs = tpu_.run([op.READ]*66, np.zeros((66, n)))
+    assert (outputs[:64].T == tpu_.memory.reshape(n, 64)).all()
+    assert (outputs[64:] == 0).all()
+    return True
+
+def test_python_tpu_run_():
+    program = [(op.SETMP, 0)]
+    for i in range(64):
+        program.append((op.WRITE, i % 5))
+    program.append((op.MMUL, pack_banks(1, 2, 3)))
+    program.append((op.DOT, pack_banks(3, 1, 2)))
+    program.append((op.SUM, pack_banks(3)))
+    program.append((op.MATMUL, pack_banks(0, 1, 2)))
+    program.append((op.SETMP, 16))
+    for i in range(48):
+        program.append((op.READ, 0))
+    stepped = pyTpu()
+    outputs = []
+    for inp in program:
+        stepped.input = int2list(int(inp[0]))
+        stepped.input2 = int2list(inp[1], 8)
+        stepped.step()
+        if inp[0] in (op.READ, op.SUM): outputs.append(stepped.output)
+    # bytes and ndarray buffers must give the same result as step()
+    for packed in (pack_program(program), np.frombuffer(pack_program(program), dtype=np.uint8)):
+        tpu_ = pyTpu()
+        result = tpu_.run(packed)
+        assert result.tolist() == outputs
+        assert tpu_.memory == stepped.memory
+        assert tpu_.mp == stepped.mp
+    return True
+
+def test_burst_io_():
+    program = [(op.SETMP, 0)] + [(op.WRITE2, (2*i + 1) % 16 | ((2*i + 2) % 16) << 4) for i in range(8)]
+    program += [(op.SETMP, 0)] + [(op.READ2, 0)]*8 + [(op.NOOP, 0)]
+    program += [(op.SETMP, 63), (op.WRITE2, 0xff), (op.SETMP, 62), (op.READ2, 0)]
+    tpu_ = pyTpu()
+    outputs = tpu_.run(pack_program(program))
+    assert outputs[:16].tolist() == [(1 + i) % 16 for i in range(16)]
+    assert tpu_.memory[63] == 0x0f # the high nibble at 64 is dropped
+    assert outputs[16:].tolist() == [0, 0x0f]
+    assert tpu_.mp == 64 and tpu_.uio_oe == 0xff
+    # strict pyTpu rejects an instruction that needs uio_in while the chip drives it
+    try:
+        pyTpu().run(pack_program([(op.READ2, 0), (op.SETMP, 0)]))
+        assert False
+    except AssertionError as e:
+        assert "after a READ2" in str(e)
+    # READ2 has no byte select, it reads the low bytes whatever uio_in holds
+    tpu_ = pyTpu(4, 4, 16)
+    tpu_.load_bank(0, (np.arange(16) | np.arange(16, 32) << 8).reshape(4, 4))
+    outputs = tpu_.run(pack_program([(op.READ2, 1), (op.NOOP, 0), (op.READ, 1), (op.READ, 0)]))
+    assert outputs.tolist() == [0, 1, 18, 3]
+    # the batched model agrees with pyTpu on random streams using every op
+    rng = np.random.default_rng(0)
+    n = 64
+    ui_in = rng.integers(0, len(op), size=(200, n))
+    uio_in = rng.integers(0, 256, size=(200, n))
+    batched = npTpu(n)
+    batched.run(ui_in, uio_in)
+    for i in range(n):
+        tpu_ = pyTpu(strict=False) # random streams break the READ2 rule
+        tpu_.run(np.stack([ui_in[:, i], uio_in[:, i]], axis=1))
+        assert tpu_.memory == batched.memory[i].flatten().tolist()
+        assert (tpu_.mp, tpu_.output, tpu_.uio_out, tpu_.uio_oe) == \
+            (batched.mp[i], batched.output[i], batched.uio_out[i], batched.uio_oe[i])
+    return True
+
+def test_gemm_():
+    rng = np.random.default_rng(0)
+    for m, k, n in [(4, 4, 4), (5, 7, 3), (16, 16, 16), (9, 13, 22), (1, 30, 2)]:
+        a = rng.integers(0, 256, size=(m, k))
+        b = rng.integers(0, 256, size=(k, n))
+        result, prog = gemm(a, b)
+        assert (result == (a @ b) % 256).all(), f"gemm mismatch for {m}x{k}x{n}"
+        stats = prog.stats()
+        assert stats["instructions"] == len(prog.instructions)
+        assert stats["io_cycles"] == stats["writes"] + stats["reads"]
+    # every tile of a 16x16 operand has to be written at least once, but not once per product
+    stats = compile_gemm(rng.integers(0, 256, size=(16, 16)), rng.integers(0, 256, size=(16, 16))).stats()
+    assert stats["matmul"] == 64
+    assert stats["writes"] < 64*2*16
+    # 4-bit tiles load with WRITE2 and results drain with READ2
+    a = rng.integers(0, 16, size=(8, 8))
+    result, prog = gemm(a, a)
+    assert (result == (a @ a) % 256).all()
+    stats, serial = prog.stats(), compile_gemm(a, a, burst=False).stats()
+    assert stats["writes"]*2 == serial["writes"] and stats["reads"]*2 == serial["reads"]
+    assert prog.instructions[-1] == (op.NOOP, 0) # the last burst ends before whatever comes next
+    # partial sums stay on chip with MATMUL_ACC, one readback per result tile
+    a = rng.integers(0, 256, size=(4, 64))
+    b = rng.integers(0, 256, size=(64, 4))
+    result, prog = gemm(a, b, burst=False)
+    assert (result == (a @ b) % 256).all()
+    assert prog.stats()["reads"] == 16
+    assert len(prog.instructions) < len(compile_gemm(a, b, burst=False, accumulate=False).instructions)
+    # identical tiles are only loaded once, zero tiles are skipped
+    a = np.kron(np.ones((4, 4), dtype=int), rng.integers(1, 256, size=(4, 4)))
+    result, prog = gemm(a, a)
+    assert (result == (a @ a) % 256).all()
+    assert prog.stats()["writes"] == 16
+    result, prog = gemm(np.zeros((8, 8)), a[:8])
+    assert (result == 0).all() and prog.stats()["instructions"] == 0
+    return True
+
+def test_profiler_():
+    inputs = [(op.SETMP, int2list(0))]
+    for i in range(64):
+        inputs.append((op.WRITE, int2list(1)))
+    inputs.append((op.SETMP, int2list(0)))
+    for i in range(16):
+        inputs.append((op.READ, int2list(0)))
+    prof = profile(inputs, clock_hz=100_000)
+    assert prof.instructions == 82
+    assert prof.latency_cycles == 1 # the `once` wait before the first READ result
+    assert prof.cycles == 83
+    assert prof.bytes_in == 64 and prof.bytes_out == 16
+    assert prof.compute_cycles == 0 and prof.io_cycles == 80
+    assert abs(prof.wall_time - 83e-5) < 1e-12
+    assert prof.redundant_setmp == [0] # mp is already 0 after reset
+    assert prof.wasted_cycles == 1
+
+    inputs = [(op.SETMP, 3), (op.SETMP, 0), (op.WRITE, 1), (op.SETMP, 0), (op.WRITE, 2)]
+    inputs += [(op.MATMUL, pack_banks(0, 1, 2)), (op.MATMUL, pack_banks(1, 1, 2)), (op.SUM, pack_banks(2))]
+    prof = profile(pack_program(inputs))
+    assert prof.redundant_setmp == [0]
+    assert prof.overwritten_writes == [2]
+    assert prof.overwritten_results == [5]
+    assert prof.compute_cycles == 3 and prof.bytes_out == 1
+    assert prof.to_dict()["op_cycles"]["MATMUL"] == 2
+    # FILL and a dual issued op use mp, the SETMP before them is not redundant
+    assert profile(assemble("SETMP 16\nFILL 3\nSETMP 32\nFILL 4\nSETMP 0\nREAD")).redundant_setmp == []
+    assert profile(pack_program([(op.SETMP, 16), (pack_dual(op.NOOP, op.MATMUL), 0), (op.SETMP, 0), (op.READ, 0)])).redundant_setmp == []
+    return True
+
+class matmulBumpsMpTpu(pyTpu):
+    # the mp increment pyTpu used to do on MATMUL, which the hardware doesn't
+    def execute(self, current_op, arg, dual=op.NOOP):
+        super().execute(current_op, arg, dual)
+        if current_op == op.MATMUL:
+            self.mp = (self.mp + 1) & 0xff
+
+def test_fuzz_():
+    assert fuzz(programs=100, length=24, seed=0, workers=1) == []
+    failures = fuzz(programs=10, length=24, seed=0, workers=1, model=matmulBumpsMpTpu)
+    assert len(failures) > 0
+    for failure in failures:
+        assert failure["shrunk"] == [(op.MATMUL, 0)], failure["shrunk"]
+        assert failure["cycle"] == 0 and "mp" in failure["diff"]
+    return True
+
+def test_simtrace_():
+    program = [(op.SETMP, 0)] + [(op.WRITE, i*7 % 256) for i in range(32)]
+    program += [(op.MATMUL, pack_banks(0, 1, 2)), (op.SUM, pack_banks(2)), (op.SETMP, 30)]
+    program += [(op.READ, 0)]*8
+    tpu_ = pyTpu()
+    expected = []
+    mp = []
+    for current_op, arg in program:
+        tpu_.execute(current_op, arg)
+        expected.append(tpu_.output)
+        mp.append(tpu_.mp)
+    # untraced by default
+    assert SimRunner().run(program).tolist() == expected
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tpu.tpt")
+        outputs = SimRunner(trace=path, signals=["uo_out", "mp", "m_3?"]).run(pack_program(program))
+        assert outputs.tolist() == expected
+        names, period, records = load_trace(path)
+        assert names == ["uo_out", "mp"] + [f"m_{i}" for i in range(30, 40)]
+        assert records.shape == (len(program), 12)
+        assert records[:, 0].tolist() == expected
+        assert records[:, 1].tolist() == mp
+        assert records[-1, 2:].tolist() == tpu_.memory[30:40]
+        trace_to_vcd(path, os.path.join(tmp, "tpu.vcd"))
+        with open(os.path.join(tmp, "tpu.vcd")) as f:
+            assert "$var wire 8 ! uo_out $end" in f.read()
+    return True
+
+def test_isa_():
+    # every (ui_in, uio_in) pair disassembles to text that assembles back to it
+    for banks in (2, 4):
+        program = np.stack(np.meshgrid(np.arange(256), np.arange(256), indexing="ij"), axis=-1).astype(np.uint8)
+        assert assemble(disassemble(program, banks), banks) == program.tobytes()
+    assert decode_line(pack_dual(op.WRITE, op.MATMUL), 7) == "WRITE 7 | MATMUL"
+    assert decode_line(op.BANK, pack_bankfn(bankfn.TRANSPOSE, 2, 3)) == "BANK TRANSPOSE a=2 c=3"
+    assert decode_line(0x17, 0) == ".raw 0x17 0x00" # junk in the upper nibble
+    source = """
+        SETMP 0
+        FILL 2          # bank 0 = 2
+        SETMP 16
+        FILL 3
+        MATMUL a=0 b=1 c=2
+        BANK TRANSPOSE a=2 c=3
+        SETMP 0x20
+        READ2
+        NOOP            # the chip drives uio after a READ2
+        SUM a=3
+    """
+    assert pyTpu().run(assemble(source)).tolist() == [24, 24, 24*16 % 256]
+    try:
+        assemble("SETMP 0\nMATMUL a=4")
+        assert False
+    except AssertionError as e:
+        assert str(e).startswith("line 2:")
+
+    # a gemm replayed from a .tpub file, mapped and streamed in chunks
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 256, size=(8, 12))
+    b = rng.integers(0, 256, size=(12, 8))
+    prog = compile_gemm(a, b)
+    expected = pyTpu().run(prog.packed())
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "gemm.tpub")
+        write_tpub(path, prog.packed())
+        config, program = load_tpub(path)
+        assert config == (4, 4, 8, 1) and program.tobytes() == prog.packed()
+        config, chunks = iter_tpub(path, chunk=100)
+        tpu_ = pyTpu(*config)
+        outputs = np.concatenate([tpu_.run(chunk) for chunk in chunks])
+        assert (outputs == expected).all()
+        assert (prog.collect(outputs) == (a @ b) % 256).all()
+        # generated chunk by chunk
+        path = os.path.join(tmp, "streamed.tpub")
+        write_tpub(path, (program[i:i+64] for i in range(0, len(program), 64)), (4, 4, 16, 4))
+        config, streamed = load_tpub(path)
+        assert config == (4, 4, 16, 4) and streamed.tobytes() == prog.packed()
+    return True
+
+def test_driver_():
+    # the outputs a backend must return for a batch are the ones pyTpu.run produces, junk included
+    rng = np.random.default_rng(0)
+    junk = rng.integers(0, 256, size=(500, 2)).astype(np.uint8)
+    for config in [(4, 4, 8, 1), (4, 2, 8, 1)]:
+        assert len(pyTpu(*config, strict=False).run(junk)) == output_counts(junk, config).sum()
+    assert len(pyTpu(strict=False).run(assemble("READ2\nSUM"))) == 3 # a SUM in the cycle after a READ2 still outputs
+    # a gemm cut into uneven batches gives the same outputs on every backend
+    a = rng.integers(0, 256, size=(8, 8))
+    b = rng.integers(0, 256, size=(8, 8))
+    program = np.frombuffer(compile_gemm(a, b).packed(), dtype=np.uint8).reshape(-1, 2)
+    expected = pyTpu().run(program)
+    cuts = [0, 1, 40, 41, 150, len(program)]
+    batches = [program[start:end] for start, end in zip(cuts, cuts[1:])]
+    board = SerialBoard()
+
+    async def drive(backend):
+        driver = TpuDriver(backend, depth=2)
+        first = await driver.submit(batches[0])
+        outputs = await driver.map(batches[1:])
+        assert first.done # collected when the third batch went out
+        await driver.close()
+        return np.concatenate([first.outputs] + outputs)
+
+    for backend in [PyTpuBackend(), SimBackend(), SerialBackend(board.port)]:
+        assert (asyncio.run(drive(backend)) == expected).all(), type(backend).__name__
+    board.close()
+    # SimBackend yields while it simulates, a short batch sent after a long one finishes first
+    finished = []
+
+    async def timed(name, program):
+        outputs = await TpuDriver(SimBackend(yield_every=16)).run(program)
+        finished.append(name)
+        return outputs
+
+    async def both():
+        return await asyncio.gather(timed("long", program), timed("short", assemble("SETMP 0\nFILL 7\nREAD")))
+
+    long, short = asyncio.run(both())
+    assert finished == ["short", "long"] and (long == expected).all() and short.tolist() == [7]
+    return True
+
+def test_tpuarray_():
+    rng = np.random.default_rng(0)
+    a, b, c = rng.integers(0, 256, size=(9, 7)), rng.integers(0, 256, size=(7, 10)), rng.integers(0, 256, size=(10, 9))
+    x, y, z = TpuArray(a), TpuArray(b), TpuArray(c)
+    ab = (a @ b) % 256
+    abc = (ab @ c) % 256
+    expr = (x @ y @ z) * (x @ y @ z).T.T
+    result, total, transposed = evaluate(expr, expr.sum(), (x @ y).T)
+    assert (result == abc*abc % 256).all() and total == (abc*abc).sum() % 256 and (transposed == ab.T).all()
+    # (a*b).sum() and dot are an MMUL and a SUM per tile, nothing is read back
+    v, w = rng.integers(0, 256, size=37), rng.integers(0, 256, size=37)
+    assert dot(v, w).numpy() == (v @ w) % 256
+    prog, _, _ = compile_arrays([dot(v, w)])
+    assert prog.stats()["reads"] == 0 and [i[0] for i in prog.instructions].count(op.SUM) == 3
+    # a resident tile is loaded once, a constant tile is one FILL
+    tile = TpuArray(rng.integers(0, 16, size=(4, 4)))
+    prog, _, _ = compile_arrays([tile @ tile @ tile, tile * TpuArray(np.full((4, 4), 3))])
+    assert prog.stats()["writes"] == 8 and [i[0] for i in prog.instructions].count(op.FILL) == 1
+    # four live 8x8 products don't fit in 4 banks, some are spilled and reloaded
+    m = [TpuArray(rng.integers(0, 256, size=(8, 8))) for _ in range(4)]
+    chain = ((m[0] @ m[1]) @ (m[2] @ m[3]) * (m[0] @ m[1])).sum()
+    prog, _, _ = compile_arrays([chain])
+    assert any(isinstance(item, Reload) for item in prog.instructions)
+    # no instruction that needs uio_in (a reload expands into SETMP and WRITEs) follows a READ2
+    for stream in [prog.instructions, compile_arrays([expr])[0].instructions, compile_gemm(a, b).instructions]:
+        for item, following in zip(stream, stream[1:] + [None]):
+            if isinstance(item, tuple) and OP_TABLE[int(item[0])] == op.READ2:
+                assert isinstance(following, tuple)
+                assert not uses_uio(OP_TABLE[int(following[0])], DUAL_TABLE[int(following[0])], 1)
+    p = [q.data.astype(np.int64) for q in m]
+    assert chain.numpy() == ((p[0] @ p[1] % 256) @ (p[2] @ p[3] % 256) % 256 * (p[0] @ p[1] % 256)).sum() % 256
+    # same program on the simulator and on other configurations
+    assert (evaluate(x @ y, backend=SimBackend())[0] == ab).all()
+    for config in [(2, 4, 8, 1), (3, 4, 16, 9), (4, 4, 8, 4)]:
+        assert (evaluate(expr, backend=PyTpuBackend(config))[0] == abc*abc % 256).all()
+    return True
+
+def test_quant_():
+    rng = np.random.default_rng(0)
+    # byte selected readback of wide words
+    a, b = rng.integers(0, 256, size=(6, 40)), rng.integers(0, 256, size=(40, 5))
+    prog = compile_gemm(a, b, read_bytes=3)
+    assert (prog.collect(pyTpu(4, 4, 24).run(prog.packed())) == a @ b).all()
+    # im2col against a direct convolution
+    x, kernel = rng.random((2, 3, 7, 7)), rng.random((4, 3, 3, 3))
+    cols, (oh, ow) = im2col(x, (3, 3), stride=2, padding=1)
+    padded = np.pad(x, ((0, 0), (0, 0), (1, 1), (1, 1)))
+    direct = np.array([[[[(padded[s, :, 2*i:2*i+3, 2*j:2*j+3]*kernel[o]).sum() for j in range(ow)] for i in range(oh)]
+                        for o in range(4)] for s in range(2)])
+    assert np.allclose((cols @ kernel.reshape(4, -1).T).reshape(2, oh, ow, 4).transpose(0, 3, 1, 2), direct)
+    # the chip matches the numpy integer pipeline, the 300 inputs of the dense layer don't fit in
+    # one 24 bit accumulation and are split
+    x = rng.random((5, 1, 10, 10))
+    model = QuantModel([Conv2d(rng.normal(size=(3, 1, 3, 3)), rng.normal(size=3), padding=1, relu=True),
+                        Dense(rng.normal(size=(300, 6))/10, rng.normal(size=6))], x)
+    reference = model.reference(x)
+    assert (np.abs(model.forward(x) - (reference.astype(float) - model.output[1])*model.output[0]) < 0.2).all()
+    for config in [QUANT_CONFIG, (4, 4, 24, 4)]:
+        outputs, matmul = model.run(x, PyTpuBackend(config), batch=2)
+        assert (outputs == reference).all()
+    assert len(matmul.programs) == 3*3 and max(prog.read_bytes for prog in matmul.programs) == 3
+    for prog in matmul.programs:
+        ops = [OP_TABLE[int(current_op)] for current_op, _ in prog.instructions]
+        assert op.READ2 not in ops if prog.read_bytes > 1 else ops[-1] != op.READ2
+    # the 8 bit chip runs digit GEMMs whose sums fit in its words
+    assert digit_split(8, 4, 300) == (2, 1, 84) and digit_split(32, 4, 300) == (8, 8, 66048)
+    outputs, matmul = model.run(x, PyTpuBackend(CONFIG), batch=5)
+    assert (outputs == reference).all() and max(prog.read_bytes for prog in matmul.programs) == 1
+    return True
+
+def test_perf_():
+    report = {"meta": {}, "results": perf.bench_model(repeat=1, count=10), "skipped": {}}
+    assert {f"model.step.{o.name}" for o in op} <= set(report["results"])
+    report["results"].update(perf.bench_generate(repeat=1))
+    slower = {"results": {name: dict(m, value=m["value"]*(0.5 if m["better"] == "higher" else 2))
+                          for name, m in report["results"].items()}}
+    rows, regressions = perf.compare(report, report)
+    assert not regressions and all(row[4] == "ok" for row in rows)
+    _, regressions = perf.compare(report, slower)
+    assert set(regressions) == set(report["results"])
+    _, regressions = perf.compare(slower, report)
+    assert not regressions
+    return True
+
+def test_gencache_():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir, gencache.CACHE_DIR = gencache.CACHE_DIR, os.path.join(tmp, "cache")
+        try:
+            path = os.path.join(tmp, "top_tpu.v")
+            assert generate_top(path, cache=False) and not os.path.exists(gencache.CACHE_DIR)
+            uncached = open(path).read()
+            # a miss stores the output, which is the same, so path is left alone
+            assert not generate_top(path) and len(os.listdir(gencache.CACHE_DIR)) == 1
+            os.remove(path)
+            assert generate_top(path) and open(path).read() == uncached
+            assert generate_top(path, (2, 4, 8, 1)) and generate_top(path) and open(path).read() == uncached
+            assert generate_top(os.path.join(tmp, "top_tpu.il")) and len(os.listdir(gencache.CACHE_DIR)) == 3
+            # tpu.generate always converts and refreshes the entry generate_top looks up
+            assert tpu(2, 4).generate(path) and len(os.listdir(gencache.CACHE_DIR)) == 3
+            assert not generate_top(path, (2, 4, 8, 1))
+            # least recently used first
+            os.utime(os.path.join(gencache.CACHE_DIR, sorted(os.listdir(gencache.CACHE_DIR))[0]), (0, 0))
+            newest = sorted(os.scandir(gencache.CACHE_DIR), key=lambda e: e.stat().st_mtime)[1:]
+            gencache.evict(max_bytes=sum(e.stat().st_size for e in newest))
+            assert sorted(os.listdir(gencache.CACHE_DIR)) == sorted(e.name for e in newest)
+        finally:
+            gencache.CACHE_DIR = cache_dir
+    return True
+
+def test_profiles_():
+    # a disabled op is rejected by a strict pyTpu and does nothing otherwise, like on the chip
+    gemm_build = pyTpu(ops=PROFILES["gemm"])
+    try:
+        gemm_build.run(pack_program([(op.WRITE, 1), (op.MMUL, pack_banks(0, 0, 1))]))
+        return False
+    except AssertionError:
+        pass
+    relaxed = pyTpu(strict=False, ops=PROFILES["gemm"])
+    outputs = relaxed.run(pack_program([(op.WRITE, 3), (op.SETMP, 0), (op.FILL, 7), (op.SUM, 0), (op.READ, 0)]))
+    assert relaxed.memory[:2] == [3, 0] and outputs.tolist() == [3]
+    # gemm programs only need the gemm build
+    rng = np.random.default_rng(0)
+    a, b = rng.integers(0, 256, size=(7, 9)), rng.integers(0, 256, size=(9, 6))
+    assert (gemm(a, b, pyTpu(ops=PROFILES["gemm"]))[0] == (a @ b) % 256).all()
+    assert not fuzz(programs=20, length=32, workers=1, ops=PROFILES["tpuarray"])
+    assert not fuzz(programs=20, length=32, workers=1, config=(4, 4, 8, 4), ops=PROFILES["elementwise"])
+    with tempfile.TemporaryDirectory() as tmp:
+        tpu(ops=PROFILES["matmul"]).generate(os.path.join(tmp, "matmul.v"), cache=False)
+        tpu().generate(os.path.join(tmp, "full.v"), cache=False)
+        assert os.path.getsize(os.path.join(tmp, "matmul.v")) < os.path.getsize(os.path.join(tmp, "full.v"))/2
+    return True
+
+def test_backdoor_():
+    # banks loaded behind the chip's back read the same as written ones
+    rng = np.random.default_rng(0)
+    tiles = rng.integers(0, 256, size=(4, 4, 4))
+    front, back = pyTpu(), pyTpu()
+    front.run(pack_program([(op.SETMP, 0)] + [(op.WRITE, int(v)) for v in tiles.reshape(-1)]))
+    for bank, tile in enumerate(tiles):
+        back.load_bank(bank, tile)
+        assert (back.dump_bank(bank) == tile).all()
+    assert back.memory == front.memory
+    # a snapshot in the middle of a multi-cycle MATMUL forks into the simulator and a fresh pyTpu
+    config = (4, 4, 8, 16)
+    start, rest = [(op.MATMUL_ACC, pack_banks(0, 1, 2)), (op.NOOP, 0), (op.READ, 0)], \
+        [(op.NOOP, 0)]*14 + [(op.SETMP, 32)] + [(op.READ, 0)]*16
+    model = pyTpu(*config)
+    model.load_bank(0, tiles[0])
+    model.load_bank(1, tiles[1])
+    model.load_bank(2, tiles[2])
+    model.run(pack_program(start))
+    state = model.snapshot()
+    assert state["engine"] == {"a": 0, "b": 1, "c": 2, "accumulate": True, "step": 2}
+    fork = pyTpu(*config)
+    fork.restore(state)
+    expected = fork.run(pack_program(rest))
+    assert (fork.dump_bank(2) == (tiles[2] + tiles[0] @ tiles[1]) % 256).all()
+    assert expected.tolist() == fork.dump_bank(2).reshape(-1).tolist()
+
+    dut = tpu(*config)
+    sim = Simulator(dut)
+    sim.add_clock(1e-6)
+    outputs, snapshots = [], []
+    async def bench(ctx):
+        backdoor = SimBackdoor(ctx, dut)
+        backdoor.restore(state)
+        snapshots.append(backdoor.snapshot())
+        for o, arg in rest:
+            ctx.set(dut.input, o.value)
+            ctx.set(dut.input2, arg)
+            await ctx.tick()
+            if o == op.READ:
+                outputs.append(ctx.get(dut.output))
+        snapshots.append(backdoor.snapshot())
+    sim.add_testbench(bench)
+    sim.run()
+    for got, want in zip(snapshots, [state, fork.snapshot()]):
+        assert (got["memory"] == want["memory"]).all()
+        assert {k: v for k, v in got.items() if k != "memory"} == {k: v for k, v in want.items() if k != "memory"}
+    assert outputs == expected.tolist()
+    return True
+
+def test_scoreboard_():
+    # exhaustive shards cover every input pair once, random shards are reproducible
+    shards = [scoreboard.stimulus("exhaustive", k, 7) for k in range(7)]
+    pairs = np.concatenate(shards).astype(np.int64)
+    assert (pairs[:, 0]*256 + pairs[:, 1] == np.arange(1 << 16)).all()
+    random = scoreboard.stimulus("random", 2, 4, 600, seed=1)
+    assert (random == scoreboard.stimulus("random", 2, 4, 600, seed=1)).all()
+    assert (random != scoreboard.stimulus("random", 3, 4, 600, seed=1)).any()
+    # the expected outputs are what the simulated chip outputs, sampled like the cocotb test does
+    for program in [shards[3][:1500], random]:
+        want = scoreboard.expected(program)
+        dut = tpu()
+        sim = Simulator(dut)
+        sim.add_clock(1e-6)
+        got = np.empty_like(want)
+        async def bench(ctx):
+            for n, (ui_in, uio_in) in enumerate(program.tolist()):
+                ctx.set(dut.input, ui_in)
+                ctx.set(dut.input2, uio_in)
+                await ctx.tick()
+                got[n] = ctx.get(dut.output), ctx.get(dut.uio_out), ctx.get(dut.uio_oe)
+        sim.add_testbench(bench)
+        sim.run()
+        assert scoreboard.mismatches(program, want, got) == (0, [])
+    got[5, 0] ^= 1
+    got[9, 2] = 7
+    count, first = scoreboard.mismatches(program, want, got, limit=1)
+    assert count == 2 and first[0]["cycle"] == 5 and first[0]["got"]["uo_out"] == want[5, 0] ^ 1
+    total = scoreboard.merge_reports([{"shard": 0, "cycles": 10, "mismatches": 0, "first": []},
+                                      {"shard": 1, "cycles": 12, "mismatches": 2, "first": first}])
+    assert total["cycles"] == 22 and total["mismatches"] == 2 and total["first"][0]["shard"] == 1
+    return True
+
+def test_simbench_():
+    results = simbench.bench(["amaranth", "verilator"], cycles=300)
+    assert results["amaranth"]["cycles"] == 300 and results["amaranth"]["mismatches"] == 0
+    assert results["amaranth"]["rate"] > 0 and results["amaranth"]["build"] > 0
+    assert (results["verilator"] is None) == (shutil.which("verilator") is None)
+    return True
+
+def test_instrument_():
+    # hooks don't change what pyTpu computes, and removing the last one restores the plain execute
+    rng = np.random.default_rng(0)
+    program = pack_program(random_program(rng, 400))
+    plain, hooked = pyTpu(strict=False), pyTpu(strict=False)
+    steps = []
+    hook = hooked.add_hook(post=lambda tpu_, current_op, arg, dual: steps.append(current_op))
+    assert (plain.run(program) == hooked.run(program)).all() and plain.memory == hooked.memory
+    assert len(steps) == 400
+    hooked.remove_hook(hook)
+    assert "execute" not in vars(hooked) and not hooked.hooks
+    # counters of the model and of the simulated chip agree
+    counters_tpu = pyTpu(strict=False)
+    counters, sim_counters = Counters().attach(counters_tpu), Counters()
+    counters_tpu.run(program)
+    SimRunner(hooks=[(sim_counters.pre, sim_counters.post)]).run(program)
+    report = counters.report()
+    assert json.loads(json.dumps(report)) == sim_counters.report()
+    assert report["instructions"] == 400 and sum(report["ops"].values()) == 400
+    # 16*16 wraps in every word of the MMUL, 8*8 doesn't
+    tpu_ = pyTpu()
+    counters = Counters().attach(tpu_)
+    tpu_.run(pack_program([(op.SETMP, 0), (op.FILL, 16), (op.SETMP, 16), (op.FILL, 8),
+                           (op.MMUL, pack_banks(0, 0, 2)), (op.MMUL, pack_banks(1, 1, 3)), (op.SUM, pack_banks(2))]))
+    report = counters.report()
+    assert report["overflow"] == {"MMUL": {"instructions": 1, "words": 16}}
+    assert report["mp"] == [0, 0, 16, 16, 16, 16, 16] and report["ops"]["MMUL"] == 2
+    assert report["bank_reads"] == [32, 32, 16, 0] and report["bank_writes"] == [16, 16, 16, 16]
+    return True
+
+def hazard(tpu_, *instruction):
+    # the message of the programming rule an instruction breaks on a strict pyTpu, or None
+    try:
+        tpu_.execute(*instruction)
+    except AssertionError as e:
+        return str(e)
+    return None
+
+def test_dual_issue_():
+    # C = sum of A @ B[t] with B double buffered in banks 0 and 1, every MATMUL_ACC rides on
+    # the first WRITE of the next B instead of taking a cycle between the loads
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 256, size=(4, 4))
+    b = rng.integers(0, 256, size=(5, 4, 4))
+    program = [(op.SETMP, 32)] + [(op.WRITE, value) for value in a.flatten().tolist()]
+    program += [(op.SETMP, 16)] + [(op.WRITE, value) for value in b[0].flatten().tolist()]
+    for t in range(1, len(b)):
+        values = b[t].flatten().tolist()
+        program += [(op.SETMP, 16*(1 - t % 2)), (pack_dual(op.WRITE, op.MATMUL_ACC), values[0])]
+        program += [(op.WRITE, value) for value in values[1:]]
+    program += [(op.MATMUL_ACC, pack_banks(2, 1 - (len(b) - 1) % 2, 3)), (op.SETMP, 48)] + [(op.READ, 0)]*16
+    expected = (a @ b.sum(axis=0) % 256).flatten().tolist()
+    assert pyTpu().run(pack_program(program)).tolist() == expected
+    assert SimRunner().run(program)[-16:].tolist() == expected
+    prof = profile(program)
+    assert prof.dual_issued == 4 and prof.compute_cycles == 1 and prof.overwritten_results == []
+
+    # a WRITE2 on the last word of bank 1 spills into A of the dual issued op
+    tpu_ = pyTpu()
+    tpu_.execute(op.SETMP, 31)
+    assert "touches the banks" in hazard(tpu_, op.WRITE2, 0x21, op.MATMUL)
+    loose = pyTpu(strict=False)
+    loose.memory[32:48] = list(range(16))
+    loose.memory[0:16] = [1]*16
+    loose.execute(op.SETMP, 31)
+    loose.execute(op.WRITE2, 0x21, op.MATMUL)
+    # the MATMUL reads A before the WRITE2 lands
+    assert loose.memory[31:33] == [1, 2]
+    assert loose.memory[48:52] == [6, 6, 6, 6]
+    # no uio_in[0], no MATMUL banks and no second MATMUL while the engine is busy
+    tpu_ = pyTpu(matmul_cycles=4)
+    tpu_.execute(op.MATMUL, pack_banks(0, 1, 2))
+    assert "uio_in[0]" in hazard(tpu_, op.WRITE, 5)
+    assert "touches the banks" in hazard(tpu_, op.MMUL, pack_banks(3, 3, 1))
+    assert "busy" in hazard(tpu_, op.MATMUL, pack_banks(3, 3, 3))
+    assert hazard(tpu_, op.MMUL, pack_banks(0, 1, 3)) is None
+    return True
+
+CONFIGS = [(2, 4, 8, 1), (4, 2, 8, 1), (4, 4, 8, 1), (4, 4, 16, 1), (8, 4, 8, 1),
+           (2, 4, 8, 4), (4, 4, 8, 16), (4, 2, 16, 4)] # (n, banks, acc_width, matmul_cycles)
+
+def parametric_suite(n, banks, acc_width, matmul_cycles):
+    # every compute op and FILL against numpy on pyTpu, the byte select of wide words,
+    # a gemm, then pyTpu against the amaranth simulation of the same configuration
+    rng = np.random.default_rng(n*banks*acc_width)
+    mask = (1 << acc_width) - 1
+    tpu_ = pyTpu(n, banks, acc_width, matmul_cycles)
+    assert len(tpu_.memory) == banks*n*n
+    for current_op, function in [(op.MMUL, 0), (op.DOT, 0), (op.MATMUL, 0), (op.SUM, 0), (op.MATMUL_ACC, 0),
+                                 (op.MMUL_ACC, 0), (op.FILL, 0), (op.BANK, bankfn.COPY), (op.BANK, bankfn.TRANSPOSE),
+                                 (op.BANK, bankfn.ZERO), (op.MATVEC, 0), (op.ROWDOT, 0)]:
+        data = rng.integers(0, 256, size=(banks, n, n))
+        tpu_.execute(op.SETMP, 0)
+        for value in data.flatten().tolist():
+            tpu_.execute(op.WRITE, value)
+        a, b, c = rng.integers(0, banks, size=3).tolist()
+        if matmul_cycles > 1 and current_op in (op.MATMUL, op.MATMUL_ACC):
+            # the engine still reads A and B while it writes C
+            a, b, c = [0, 0, 1] if banks == 2 else rng.permutation(banks)[:3].tolist()
+        if current_op == op.FILL:
+            # c is mp's bank, any word of it
+            tpu_.execute(op.SETMP, c*n*n + rng.integers(0, n*n).item())
+        tpu_.execute(current_op, pack_bankfn(function, a, c, banks) if current_op == op.BANK else pack_banks(a, b, c, banks))
+        if matmul_cycles > 1 and current_op in (op.MATMUL, op.MATMUL_ACC):
+            # busy on uio[0] from the issue cycle until the last row or element is written
+            for _ in range(matmul_cycles):
+                assert tpu_.busy and tpu_.uio_oe == 1 and tpu_.uio_out == 1
+                tpu_.execute(op.NOOP, 0)
+        assert not tpu_.busy and tpu_.uio_oe == 0
+        expected = data.copy()
+        A, B, C = data[a], data[b], data[c]
+        match current_op:
+            case op.MMUL:
+                expected[c] = A * B
+            case op.DOT:
+                expected[c, 0, 0] = A[0] @ B[0]
+            case op.MATMUL:
+                expected[c] = A @ B
+            case op.SUM:
+                assert tpu_.output == A.sum() & mask & 0xff
+            case op.MATMUL_ACC:
+                expected[c] = C + A @ B
+            case op.MMUL_ACC:
+                expected[c] = C + A * B
+            case op.MATVEC:
+                expected[c, 0] = A @ B[0]
+            case op.ROWDOT:
+                expected[c, 0] = (A * B).sum(axis=1)
+            case op.FILL:
+                expected[c] = pack_banks(a, b, c, banks)
+            case op.BANK:
+                expected[c] = [A, A.T, 0][function]
+        assert tpu_.memory == (expected & mask).flatten().tolist(), f"{current_op.name} {n}x{n} {banks} banks {acc_width} bits"
+    # the last result is still in bank c, its bytes come out one READ at a time
+    for byte in range(-(-acc_width // 8)):
+        tpu_.execute(op.SETMP, c*n*n)
+        tpu_.execute(op.READ, byte)
+        assert tpu_.output == (tpu_.memory[c*n*n] >> 8*byte) & 0xff
+    a = rng.integers(0, 256, size=(2*n + 1, 3*n))
+    b = rng.integers(0, 256, size=(3*n, n + 1))
+    result, _ = gemm(a, b, pyTpu(n, banks, acc_width, matmul_cycles))
+    assert (result == (a @ b) % 256).all()
+    assert fuzz(programs=20, length=32, seed=0, workers=1, config=(n, banks, acc_width, matmul_cycles)) == []
+
+def test_parametric_():
+    for config in CONFIGS:
+        parametric_suite(*config)
+    return True
+
 def test_tpu_():
     return test()
 
-    
+
 
 
 
 if __name__ == "__main__":
     assert test_python_tpu_()
+    assert test_np_tpu_()
+    assert test_python_tpu_run_()
+    assert test_burst_io_()
+    assert test_gemm_()
+    assert test_profiler_()
+    assert test_fuzz_()
+    assert test_simtrace_()
+    assert test_isa_()
+    assert test_driver_()
+    assert test_tpuarray_()
+    assert test_quant_()
+    assert test_perf_()
+    assert test_gencache_()
+    assert test_profiles_()
+    assert test_backdoor_()
+    assert test_scoreboard_()
+    assert test_simbench_()
+    assert test_instrument_()
+    assert test_dual_issue_()
+    assert test_parametric_()
     assert test_tpu_()
     print("test passed")
     print("generating verilog code")
-    t = tpu()
-    t.generate()
\ No newline at end of file
+    generate_top()
\ No newline at end of file
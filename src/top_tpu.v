@@ -0,0 +1,18143 @@
+/* Generated by Amaranth Yosys 0.50 (PyPI ver 0.50.0.0.post129, git sha1 b5170e139) */
+
+module tt_um_COLVERTYETY_top(uio_in, ena, clk, rst_n, uo_out, uio_out, uio_oe, ui_in);
+  reg \$auto$verilog_backend.cc:2355:dump_module$3  = 0;
+  wire \$1 ;
+  wire [7:0] \$10 ;
+  wire [15:0] \$100 ;
+  wire [17:0] \$101 ;
+  wire [15:0] \$102 ;
+  wire [18:0] \$103 ;
+  wire [15:0] \$104 ;
+  wire [19:0] \$105 ;
+  wire [7:0] \$106 ;
+  wire [15:0] \$107 ;
+  wire [16:0] \$108 ;
+  wire [15:0] \$109 ;
+  wire [15:0] \$11 ;
+  wire [17:0] \$110 ;
+  wire [15:0] \$111 ;
+  wire [18:0] \$112 ;
+  wire [15:0] \$113 ;
+  wire [19:0] \$114 ;
+  wire [7:0] \$115 ;
+  wire [15:0] \$116 ;
+  wire [16:0] \$117 ;
+  wire [15:0] \$118 ;
+  wire [17:0] \$119 ;
+  wire [16:0] \$12 ;
+  wire [15:0] \$120 ;
+  wire [18:0] \$121 ;
+  wire [15:0] \$122 ;
+  wire [19:0] \$123 ;
+  wire [7:0] \$124 ;
+  wire [15:0] \$125 ;
+  wire [16:0] \$126 ;
+  wire [15:0] \$127 ;
+  wire [17:0] \$128 ;
+  wire [15:0] \$129 ;
+  wire [7:0] \$13 ;
+  wire [18:0] \$130 ;
+  wire [15:0] \$131 ;
+  wire [19:0] \$132 ;
+  wire [7:0] \$133 ;
+  wire [15:0] \$134 ;
+  wire [16:0] \$135 ;
+  wire [15:0] \$136 ;
+  wire [17:0] \$137 ;
+  wire [15:0] \$138 ;
+  wire [18:0] \$139 ;
+  wire [15:0] \$14 ;
+  wire [15:0] \$140 ;
+  wire [19:0] \$141 ;
+  wire [7:0] \$142 ;
+  wire [15:0] \$143 ;
+  wire [16:0] \$144 ;
+  wire [15:0] \$145 ;
+  wire [17:0] \$146 ;
+  wire [15:0] \$147 ;
+  wire [18:0] \$148 ;
+  wire [15:0] \$149 ;
+  wire [16:0] \$15 ;
+  wire [19:0] \$150 ;
+  wire [7:0] \$151 ;
+  wire [15:0] \$152 ;
+  wire [16:0] \$153 ;
+  wire [15:0] \$154 ;
+  wire [17:0] \$155 ;
+  wire [15:0] \$156 ;
+  wire [18:0] \$157 ;
+  wire [15:0] \$158 ;
+  wire [19:0] \$159 ;
+  wire [7:0] \$16 ;
+  wire [7:0] \$160 ;
+  wire [15:0] \$161 ;
+  wire [16:0] \$162 ;
+  wire [15:0] \$163 ;
+  wire [17:0] \$164 ;
+  wire [15:0] \$165 ;
+  wire [18:0] \$166 ;
+  wire [15:0] \$167 ;
+  wire [19:0] \$168 ;
+  wire [7:0] \$169 ;
+  wire [15:0] \$17 ;
+  wire [15:0] \$170 ;
+  wire [16:0] \$171 ;
+  wire [15:0] \$172 ;
+  wire [17:0] \$173 ;
+  wire [15:0] \$174 ;
+  wire [18:0] \$175 ;
+  wire [15:0] \$176 ;
+  wire [19:0] \$177 ;
+  wire [7:0] \$178 ;
+  wire [15:0] \$179 ;
+  wire [16:0] \$18 ;
+  wire [16:0] \$180 ;
+  wire [15:0] \$181 ;
+  wire [17:0] \$182 ;
+  wire [15:0] \$183 ;
+  wire [18:0] \$184 ;
+  wire [15:0] \$185 ;
+  wire [19:0] \$186 ;
+  wire [7:0] \$187 ;
+  wire [15:0] \$188 ;
+  wire [16:0] \$189 ;
+  wire [7:0] \$19 ;
+  wire [15:0] \$190 ;
+  wire [17:0] \$191 ;
+  wire [15:0] \$192 ;
+  wire [18:0] \$193 ;
+  wire [15:0] \$194 ;
+  wire [19:0] \$195 ;
+  wire [7:0] \$196 ;
+  wire [15:0] \$197 ;
+  wire [16:0] \$198 ;
+  wire [15:0] \$199 ;
+  wire \$2 ;
+  wire [15:0] \$20 ;
+  wire [17:0] \$200 ;
+  wire [15:0] \$201 ;
+  wire [18:0] \$202 ;
+  wire [15:0] \$203 ;
+  wire [19:0] \$204 ;
+  wire [7:0] \$205 ;
+  wire [15:0] \$206 ;
+  wire [16:0] \$207 ;
+  wire [15:0] \$208 ;
+  wire [17:0] \$209 ;
+  wire [16:0] \$21 ;
+  wire [15:0] \$210 ;
+  wire [18:0] \$211 ;
+  wire [15:0] \$212 ;
+  wire [19:0] \$213 ;
+  wire \$214 ;
+  wire [7:0] \$215 ;
+  wire [7:0] \$216 ;
+  wire [7:0] \$217 ;
+  wire [7:0] \$218 ;
+  wire [7:0] \$219 ;
+  wire [7:0] \$22 ;
+  wire [7:0] \$220 ;
+  wire [7:0] \$221 ;
+  wire [7:0] \$222 ;
+  wire [7:0] \$223 ;
+  wire [7:0] \$224 ;
+  wire [7:0] \$225 ;
+  wire [7:0] \$226 ;
+  wire [7:0] \$227 ;
+  wire [7:0] \$228 ;
+  wire [7:0] \$229 ;
+  wire [7:0] \$23 ;
+  wire [7:0] \$230 ;
+  wire [7:0] \$231 ;
+  wire [7:0] \$232 ;
+  wire [7:0] \$233 ;
+  wire [7:0] \$234 ;
+  wire [7:0] \$235 ;
+  wire [7:0] \$236 ;
+  wire [7:0] \$237 ;
+  wire [7:0] \$238 ;
+  wire [7:0] \$239 ;
+  wire [15:0] \$24 ;
+  wire [7:0] \$240 ;
+  wire [7:0] \$241 ;
+  wire [7:0] \$242 ;
+  wire [8:0] \$243 ;
+  wire [9:0] \$244 ;
+  wire [10:0] \$245 ;
+  wire [11:0] \$246 ;
+  wire [12:0] \$247 ;
+  wire [13:0] \$248 ;
+  wire [14:0] \$249 ;
+  wire [16:0] \$25 ;
+  wire [15:0] \$250 ;
+  wire [16:0] \$251 ;
+  wire [17:0] \$252 ;
+  wire [18:0] \$253 ;
+  wire [19:0] \$254 ;
+  wire [20:0] \$255 ;
+  wire [21:0] \$256 ;
+  wire [22:0] \$257 ;
+  wire [23:0] \$258 ;
+  wire [8:0] \$259 ;
+  wire [7:0] \$26 ;
+  reg [7:0] \$260 ;
+  wire [8:0] \$261 ;
+  reg [7:0] \$262 ;
+  wire [8:0] \$263 ;
+  reg [7:0] \$264 ;
+  wire [8:0] \$265 ;
+  wire [8:0] \$266 ;
+  wire [8:0] \$267 ;
+  wire \$268 ;
+  wire \$269 ;
+  wire [7:0] \$27 ;
+  wire \$270 ;
+  wire \$271 ;
+  wire [7:0] \$272 ;
+  wire [7:0] \$273 ;
+  wire [7:0] \$274 ;
+  wire [7:0] \$275 ;
+  wire [7:0] \$276 ;
+  wire [7:0] \$277 ;
+  wire [7:0] \$278 ;
+  wire [7:0] \$279 ;
+  wire [15:0] \$28 ;
+  wire [7:0] \$280 ;
+  wire [7:0] \$281 ;
+  wire [7:0] \$282 ;
+  wire [7:0] \$283 ;
+  wire [7:0] \$284 ;
+  wire [7:0] \$285 ;
+  wire [7:0] \$286 ;
+  wire [7:0] \$287 ;
+  wire [8:0] \$288 ;
+  wire [9:0] \$289 ;
+  wire [16:0] \$29 ;
+  wire [10:0] \$290 ;
+  wire [11:0] \$291 ;
+  wire [8:0] \$292 ;
+  wire [8:0] \$293 ;
+  wire [9:0] \$294 ;
+  wire [10:0] \$295 ;
+  wire [11:0] \$296 ;
+  wire [8:0] \$297 ;
+  wire [9:0] \$298 ;
+  wire [10:0] \$299 ;
+  wire \$3 ;
+  wire [7:0] \$30 ;
+  wire [11:0] \$300 ;
+  wire [8:0] \$301 ;
+  wire [9:0] \$302 ;
+  wire [10:0] \$303 ;
+  wire [11:0] \$304 ;
+  wire [8:0] \$305 ;
+  wire [9:0] \$306 ;
+  wire [10:0] \$307 ;
+  wire [11:0] \$308 ;
+  wire [8:0] \$309 ;
+  wire [7:0] \$31 ;
+  wire [9:0] \$310 ;
+  wire [10:0] \$311 ;
+  wire [11:0] \$312 ;
+  wire [8:0] \$313 ;
+  wire [9:0] \$314 ;
+  wire [10:0] \$315 ;
+  wire [11:0] \$316 ;
+  wire [8:0] \$317 ;
+  wire [9:0] \$318 ;
+  wire [10:0] \$319 ;
+  wire [15:0] \$32 ;
+  wire [11:0] \$320 ;
+  wire [8:0] \$321 ;
+  wire [9:0] \$322 ;
+  wire [10:0] \$323 ;
+  wire [11:0] \$324 ;
+  wire \$325 ;
+  wire [7:0] \$326 ;
+  reg [7:0] \$327 ;
+  reg [7:0] \$328 ;
+  reg [7:0] \$329 ;
+  wire [16:0] \$33 ;
+  reg [7:0] \$330 ;
+  reg [7:0] \$331 ;
+  reg [7:0] \$332 ;
+  reg [7:0] \$333 ;
+  reg [7:0] \$334 ;
+  reg [7:0] \$335 ;
+  reg [7:0] \$336 ;
+  reg [7:0] \$337 ;
+  reg [7:0] \$338 ;
+  reg [7:0] \$339 ;
+  wire [7:0] \$34 ;
+  reg [7:0] \$340 ;
+  reg [7:0] \$341 ;
+  reg [7:0] \$342 ;
+  reg [7:0] \$343 ;
+  reg [7:0] \$344 ;
+  reg [7:0] \$345 ;
+  reg [7:0] \$346 ;
+  reg [7:0] \$347 ;
+  reg [7:0] \$348 ;
+  reg [7:0] \$349 ;
+  wire [7:0] \$35 ;
+  reg [7:0] \$350 ;
+  reg [7:0] \$351 ;
+  reg [7:0] \$352 ;
+  reg [7:0] \$353 ;
+  reg [7:0] \$354 ;
+  reg [7:0] \$355 ;
+  reg [7:0] \$356 ;
+  reg [7:0] \$357 ;
+  reg [7:0] \$358 ;
+  reg [7:0] \$359 ;
+  wire [15:0] \$36 ;
+  reg [7:0] \$360 ;
+  reg [7:0] \$361 ;
+  reg [7:0] \$362 ;
+  reg [7:0] \$363 ;
+  reg [7:0] \$364 ;
+  reg [7:0] \$365 ;
+  reg [7:0] \$366 ;
+  reg [7:0] \$367 ;
+  reg [7:0] \$368 ;
+  reg [7:0] \$369 ;
+  wire [16:0] \$37 ;
+  reg [7:0] \$370 ;
+  reg [7:0] \$371 ;
+  reg [7:0] \$372 ;
+  reg [7:0] \$373 ;
+  reg [7:0] \$374 ;
+  reg [7:0] \$375 ;
+  reg [7:0] \$376 ;
+  reg [7:0] \$377 ;
+  reg [7:0] \$378 ;
+  reg [7:0] \$379 ;
+  wire [7:0] \$38 ;
+  reg [7:0] \$380 ;
+  reg [7:0] \$381 ;
+  reg [7:0] \$382 ;
+  reg [7:0] \$383 ;
+  reg [7:0] \$384 ;
+  reg [7:0] \$385 ;
+  reg [7:0] \$386 ;
+  reg [7:0] \$387 ;
+  reg [7:0] \$388 ;
+  reg [7:0] \$389 ;
+  wire [7:0] \$39 ;
+  reg [7:0] \$390 ;
+  reg [7:0] \$391 ;
+  reg [7:0] \$392 ;
+  reg [7:0] \$393 ;
+  reg [7:0] \$394 ;
+  wire [1:0] \$4 ;
+  wire [15:0] \$40 ;
+  wire [16:0] \$41 ;
+  wire [7:0] \$42 ;
+  wire [7:0] \$43 ;
+  wire [15:0] \$44 ;
+  wire [16:0] \$45 ;
+  wire [7:0] \$46 ;
+  wire [7:0] \$47 ;
+  wire [15:0] \$48 ;
+  wire [16:0] \$49 ;
+  wire \$5 ;
+  wire [7:0] \$50 ;
+  wire [7:0] \$51 ;
+  wire [15:0] \$52 ;
+  wire [16:0] \$53 ;
+  wire [7:0] \$54 ;
+  wire [7:0] \$55 ;
+  wire [15:0] \$56 ;
+  wire [16:0] \$57 ;
+  wire [7:0] \$58 ;
+  wire [7:0] \$59 ;
+  reg [3:0] \$6 ;
+  wire [15:0] \$60 ;
+  wire [16:0] \$61 ;
+  wire [7:0] \$62 ;
+  wire [7:0] \$63 ;
+  wire [15:0] \$64 ;
+  wire [16:0] \$65 ;
+  wire [7:0] \$66 ;
+  wire [7:0] \$67 ;
+  wire [15:0] \$68 ;
+  wire [16:0] \$69 ;
+  wire \$7 ;
+  wire [7:0] \$70 ;
+  wire [15:0] \$71 ;
+  wire [16:0] \$72 ;
+  wire [15:0] \$73 ;
+  wire [17:0] \$74 ;
+  wire [15:0] \$75 ;
+  wire [18:0] \$76 ;
+  wire [15:0] \$77 ;
+  wire [19:0] \$78 ;
+  wire [7:0] \$79 ;
+  wire \$8 ;
+  wire [15:0] \$80 ;
+  wire [16:0] \$81 ;
+  wire [15:0] \$82 ;
+  wire [17:0] \$83 ;
+  wire [15:0] \$84 ;
+  wire [18:0] \$85 ;
+  wire [15:0] \$86 ;
+  wire [19:0] \$87 ;
+  wire [7:0] \$88 ;
+  wire [15:0] \$89 ;
+  wire \$9 ;
+  wire [16:0] \$90 ;
+  wire [15:0] \$91 ;
+  wire [17:0] \$92 ;
+  wire [15:0] \$93 ;
+  wire [18:0] \$94 ;
+  wire [15:0] \$95 ;
+  wire [19:0] \$96 ;
+  wire [7:0] \$97 ;
+  wire [15:0] \$98 ;
+  wire [16:0] \$99 ;
+  wire \$auto$rtlil.cc:2739:Not$2 ;
+  reg [7:0] a_0;
+  reg [7:0] a_1;
+  reg [7:0] a_10;
+  reg [7:0] a_11;
+  reg [7:0] a_12;
+  reg [7:0] a_13;
+  reg [7:0] a_14;
+  reg [7:0] a_15;
+  reg [7:0] a_2;
+  reg [7:0] a_3;
+  reg [7:0] a_4;
+  reg [7:0] a_5;
+  reg [7:0] a_6;
+  reg [7:0] a_7;
+  reg [7:0] a_8;
+  reg [7:0] a_9;
+  wire accumulate;
+  reg [7:0] b_0;
+  reg [7:0] b_1;
+  reg [7:0] b_10;
+  reg [7:0] b_11;
+  reg [7:0] b_12;
+  reg [7:0] b_13;
+  reg [7:0] b_14;
+  reg [7:0] b_15;
+  reg [7:0] b_2;
+  reg [7:0] b_3;
+  reg [7:0] b_4;
+  reg [7:0] b_5;
+  reg [7:0] b_6;
+  reg [7:0] b_7;
+  reg [7:0] b_8;
+  reg [7:0] b_9;
+  wire [7:0] bank_0;
+  wire [7:0] bank_1;
+  wire [7:0] bank_10;
+  wire [7:0] bank_11;
+  wire [7:0] bank_12;
+  wire [7:0] bank_13;
+  wire [7:0] bank_14;
+  wire [7:0] bank_15;
+  wire [7:0] bank_2;
+  wire [7:0] bank_3;
+  wire [7:0] bank_4;
+  wire [7:0] bank_5;
+  wire [7:0] bank_6;
+  wire [7:0] bank_7;
+  wire [7:0] bank_8;
+  wire [7:0] bank_9;
+  wire bank_op;
+  reg [7:0] c_0;
+  reg [7:0] c_1;
+  reg [7:0] c_10;
+  reg [7:0] c_11;
+  reg [7:0] c_12;
+  reg [7:0] c_13;
+  reg [7:0] c_14;
+  reg [7:0] c_15;
+  reg [7:0] c_2;
+  reg [7:0] c_3;
+  reg [7:0] c_4;
+  reg [7:0] c_5;
+  reg [7:0] c_6;
+  reg [7:0] c_7;
+  reg [7:0] c_8;
+  reg [7:0] c_9;
+  input clk;
+  wire clk;
+  wire \clk$178 ;
+  wire [3:0] compute_op;
+  wire dual;
+  input ena;
+  wire ena;
+  reg [7:0] m_0 = 8'h00;
+  reg [7:0] m_1 = 8'h00;
+  reg [7:0] m_10 = 8'h00;
+  reg [7:0] m_11 = 8'h00;
+  reg [7:0] m_12 = 8'h00;
+  reg [7:0] m_13 = 8'h00;
+  reg [7:0] m_14 = 8'h00;
+  reg [7:0] m_15 = 8'h00;
+  reg [7:0] m_16 = 8'h00;
+  reg [7:0] m_17 = 8'h00;
+  reg [7:0] m_18 = 8'h00;
+  reg [7:0] m_19 = 8'h00;
+  reg [7:0] m_2 = 8'h00;
+  reg [7:0] m_20 = 8'h00;
+  reg [7:0] m_21 = 8'h00;
+  reg [7:0] m_22 = 8'h00;
+  reg [7:0] m_23 = 8'h00;
+  reg [7:0] m_24 = 8'h00;
+  reg [7:0] m_25 = 8'h00;
+  reg [7:0] m_26 = 8'h00;
+  reg [7:0] m_27 = 8'h00;
+  reg [7:0] m_28 = 8'h00;
+  reg [7:0] m_29 = 8'h00;
+  reg [7:0] m_3 = 8'h00;
+  reg [7:0] m_30 = 8'h00;
+  reg [7:0] m_31 = 8'h00;
+  reg [7:0] m_32 = 8'h00;
+  reg [7:0] m_33 = 8'h00;
+  reg [7:0] m_34 = 8'h00;
+  reg [7:0] m_35 = 8'h00;
+  reg [7:0] m_36 = 8'h00;
+  reg [7:0] m_37 = 8'h00;
+  reg [7:0] m_38 = 8'h00;
+  reg [7:0] m_39 = 8'h00;
+  reg [7:0] m_4 = 8'h00;
+  reg [7:0] m_40 = 8'h00;
+  reg [7:0] m_41 = 8'h00;
+  reg [7:0] m_42 = 8'h00;
+  reg [7:0] m_43 = 8'h00;
+  reg [7:0] m_44 = 8'h00;
+  reg [7:0] m_45 = 8'h00;
+  reg [7:0] m_46 = 8'h00;
+  reg [7:0] m_47 = 8'h00;
+  reg [7:0] m_48 = 8'h00;
+  reg [7:0] m_49 = 8'h00;
+  reg [7:0] m_5 = 8'h00;
+  reg [7:0] m_50 = 8'h00;
+  reg [7:0] m_51 = 8'h00;
+  reg [7:0] m_52 = 8'h00;
+  reg [7:0] m_53 = 8'h00;
+  reg [7:0] m_54 = 8'h00;
+  reg [7:0] m_55 = 8'h00;
+  reg [7:0] m_56 = 8'h00;
+  reg [7:0] m_57 = 8'h00;
+  reg [7:0] m_58 = 8'h00;
+  reg [7:0] m_59 = 8'h00;
+  reg [7:0] m_6 = 8'h00;
+  reg [7:0] m_60 = 8'h00;
+  reg [7:0] m_61 = 8'h00;
+  reg [7:0] m_62 = 8'h00;
+  reg [7:0] m_63 = 8'h00;
+  reg [7:0] m_7 = 8'h00;
+  reg [7:0] m_8 = 8'h00;
+  reg [7:0] m_9 = 8'h00;
+  wire matvec;
+  wire [7:0] mm_0;
+  wire [7:0] mm_1;
+  wire [7:0] mm_10;
+  wire [7:0] mm_11;
+  wire [7:0] mm_12;
+  wire [7:0] mm_13;
+  wire [7:0] mm_14;
+  wire [7:0] mm_15;
+  wire [7:0] mm_2;
+  wire [7:0] mm_3;
+  wire [7:0] mm_4;
+  wire [7:0] mm_5;
+  wire [7:0] mm_6;
+  wire [7:0] mm_7;
+  wire [7:0] mm_8;
+  wire [7:0] mm_9;
+  reg [7:0] mp = 8'h00;
+  wire [7:0] p_0;
+  wire [7:0] p_1;
+  wire [7:0] p_10;
+  wire [7:0] p_11;
+  wire [7:0] p_12;
+  wire [7:0] p_13;
+  wire [7:0] p_14;
+  wire [7:0] p_15;
+  wire [7:0] p_2;
+  wire [7:0] p_3;
+  wire [7:0] p_4;
+  wire [7:0] p_5;
+  wire [7:0] p_6;
+  wire [7:0] p_7;
+  wire [7:0] p_8;
+  wire [7:0] p_9;
+  wire rst;
+  input rst_n;
+  wire rst_n;
+  wire [1:0] sel_A;
+  wire [1:0] sel_B;
+  wire [1:0] sel_C;
+  reg [7:0] total;
+  input [7:0] ui_in;
+  wire [7:0] ui_in;
+  input [7:0] uio_in;
+  wire [7:0] uio_in;
+  output [7:0] uio_oe;
+  reg [7:0] uio_oe = 8'h00;
+  output [7:0] uio_out;
+  reg [7:0] uio_out = 8'h00;
+  output [7:0] uo_out;
+  reg [7:0] uo_out = 8'h00;
+  assign \$1  = ui_in[6] & ui_in[5];
+  assign \$2  = ~ \$1 ;
+  assign dual = ui_in[7] & \$2 ;
+  assign \$3  = ~ mp[5];
+  assign sel_A = dual ? { \$3 , 1'h0 } : uio_in[7:6];
+  assign sel_B = dual ? \$4  : uio_in[5:4];
+  assign \$5  = ~ mp[5];
+  assign sel_C = dual ? { \$5 , 1'h1 } : uio_in[3:2];
+  assign compute_op = dual ? \$6  : ui_in[3:0];
+  assign \$7  = compute_op == 4'hc;
+  assign \$8  = compute_op == 4'ha;
+  assign \$9  = compute_op == 4'hb;
+  assign accumulate = | { \$9 , \$8  };
+  assign \$10  = accumulate ? c_0 : 8'h00;
+  assign \$11  = a_0 * b_0;
+  assign \$12  = \$10  + \$11 ;
+  assign \$13  = accumulate ? c_1 : 8'h00;
+  assign \$14  = a_1 * b_1;
+  assign \$15  = \$13  + \$14 ;
+  assign \$16  = accumulate ? c_2 : 8'h00;
+  assign \$17  = a_2 * b_2;
+  assign \$18  = \$16  + \$17 ;
+  assign \$19  = accumulate ? c_3 : 8'h00;
+  assign \$20  = a_3 * b_3;
+  assign \$21  = \$19  + \$20 ;
+  assign \$22  = accumulate ? c_4 : 8'h00;
+  assign \$23  = matvec ? b_0 : b_4;
+  assign \$24  = a_4 * \$23 ;
+  assign \$25  = \$22  + \$24 ;
+  assign \$26  = accumulate ? c_5 : 8'h00;
+  assign \$27  = matvec ? b_1 : b_5;
+  assign \$28  = a_5 * \$27 ;
+  assign \$29  = \$26  + \$28 ;
+  assign \$30  = accumulate ? c_6 : 8'h00;
+  assign \$31  = matvec ? b_2 : b_6;
+  assign \$32  = a_6 * \$31 ;
+  assign \$33  = \$30  + \$32 ;
+  assign \$34  = accumulate ? c_7 : 8'h00;
+  assign \$35  = matvec ? b_3 : b_7;
+  assign \$36  = a_7 * \$35 ;
+  assign \$37  = \$34  + \$36 ;
+  assign \$38  = accumulate ? c_8 : 8'h00;
+  assign \$39  = matvec ? b_0 : b_8;
+  assign \$40  = a_8 * \$39 ;
+  assign \$41  = \$38  + \$40 ;
+  assign \$42  = accumulate ? c_9 : 8'h00;
+  assign \$43  = matvec ? b_1 : b_9;
+  assign \$44  = a_9 * \$43 ;
+  assign \$45  = \$42  + \$44 ;
+  assign \$46  = accumulate ? c_10 : 8'h00;
+  assign \$47  = matvec ? b_2 : b_10;
+  assign \$48  = a_10 * \$47 ;
+  assign \$49  = \$46  + \$48 ;
+  assign \$50  = accumulate ? c_11 : 8'h00;
+  assign \$51  = matvec ? b_3 : b_11;
+  assign \$52  = a_11 * \$51 ;
+  assign \$53  = \$50  + \$52 ;
+  assign \$54  = accumulate ? c_12 : 8'h00;
+  assign \$55  = matvec ? b_0 : b_12;
+  assign \$56  = a_12 * \$55 ;
+  assign \$57  = \$54  + \$56 ;
+  assign \$58  = accumulate ? c_13 : 8'h00;
+  assign \$59  = matvec ? b_1 : b_13;
+  assign \$60  = a_13 * \$59 ;
+  assign \$61  = \$58  + \$60 ;
+  assign \$62  = accumulate ? c_14 : 8'h00;
+  assign \$63  = matvec ? b_2 : b_14;
+  assign \$64  = a_14 * \$63 ;
+  assign \$65  = \$62  + \$64 ;
+  assign \$66  = accumulate ? c_15 : 8'h00;
+  assign \$67  = matvec ? b_3 : b_15;
+  assign \$68  = a_15 * \$67 ;
+  assign \$69  = \$66  + \$68 ;
+  assign \$70  = accumulate ? c_0 : 8'h00;
+  assign \$71  = a_0 * b_0;
+  assign \$72  = \$70  + \$71 ;
+  assign \$73  = a_1 * b_4;
+  assign \$74  = \$72  + \$73 ;
+  assign \$75  = a_2 * b_8;
+  assign \$76  = \$74  + \$75 ;
+  assign \$77  = a_3 * b_12;
+  assign \$78  = \$76  + \$77 ;
+  assign \$79  = accumulate ? c_1 : 8'h00;
+  assign \$80  = a_0 * b_1;
+  assign \$81  = \$79  + \$80 ;
+  assign \$82  = a_1 * b_5;
+  assign \$83  = \$81  + \$82 ;
+  assign \$84  = a_2 * b_9;
+  assign \$85  = \$83  + \$84 ;
+  assign \$86  = a_3 * b_13;
+  assign \$87  = \$85  + \$86 ;
+  assign \$88  = accumulate ? c_2 : 8'h00;
+  assign \$89  = a_0 * b_2;
+  assign \$90  = \$88  + \$89 ;
+  assign \$91  = a_1 * b_6;
+  assign \$92  = \$90  + \$91 ;
+  assign \$93  = a_2 * b_10;
+  assign \$94  = \$92  + \$93 ;
+  assign \$95  = a_3 * b_14;
+  assign \$96  = \$94  + \$95 ;
+  assign \$97  = accumulate ? c_3 : 8'h00;
+  assign \$98  = a_0 * b_3;
+  assign \$99  = \$97  + \$98 ;
+  assign \$100  = a_1 * b_7;
+  assign \$101  = \$99  + \$100 ;
+  assign \$102  = a_2 * b_11;
+  assign \$103  = \$101  + \$102 ;
+  assign \$104  = a_3 * b_15;
+  assign \$105  = \$103  + \$104 ;
+  assign \$106  = accumulate ? c_4 : 8'h00;
+  assign \$107  = a_4 * b_0;
+  assign \$108  = \$106  + \$107 ;
+  assign \$109  = a_5 * b_4;
+  assign \$110  = \$108  + \$109 ;
+  assign \$111  = a_6 * b_8;
+  assign \$112  = \$110  + \$111 ;
+  assign \$113  = a_7 * b_12;
+  assign \$114  = \$112  + \$113 ;
+  assign \$115  = accumulate ? c_5 : 8'h00;
+  assign \$116  = a_4 * b_1;
+  assign \$117  = \$115  + \$116 ;
+  assign \$118  = a_5 * b_5;
+  assign \$119  = \$117  + \$118 ;
+  assign \$120  = a_6 * b_9;
+  assign \$121  = \$119  + \$120 ;
+  assign \$122  = a_7 * b_13;
+  assign \$123  = \$121  + \$122 ;
+  assign \$124  = accumulate ? c_6 : 8'h00;
+  assign \$125  = a_4 * b_2;
+  assign \$126  = \$124  + \$125 ;
+  assign \$127  = a_5 * b_6;
+  assign \$128  = \$126  + \$127 ;
+  assign \$129  = a_6 * b_10;
+  assign \$130  = \$128  + \$129 ;
+  assign \$131  = a_7 * b_14;
+  assign \$132  = \$130  + \$131 ;
+  assign \$133  = accumulate ? c_7 : 8'h00;
+  assign \$134  = a_4 * b_3;
+  assign \$135  = \$133  + \$134 ;
+  assign \$136  = a_5 * b_7;
+  assign \$137  = \$135  + \$136 ;
+  assign \$138  = a_6 * b_11;
+  assign \$139  = \$137  + \$138 ;
+  assign \$140  = a_7 * b_15;
+  assign \$141  = \$139  + \$140 ;
+  assign \$142  = accumulate ? c_8 : 8'h00;
+  assign \$143  = a_8 * b_0;
+  assign \$144  = \$142  + \$143 ;
+  assign \$145  = a_9 * b_4;
+  assign \$146  = \$144  + \$145 ;
+  assign \$147  = a_10 * b_8;
+  assign \$148  = \$146  + \$147 ;
+  assign \$149  = a_11 * b_12;
+  assign \$150  = \$148  + \$149 ;
+  assign \$151  = accumulate ? c_9 : 8'h00;
+  assign \$152  = a_8 * b_1;
+  assign \$153  = \$151  + \$152 ;
+  assign \$154  = a_9 * b_5;
+  assign \$155  = \$153  + \$154 ;
+  assign \$156  = a_10 * b_9;
+  assign \$157  = \$155  + \$156 ;
+  assign \$158  = a_11 * b_13;
+  assign \$159  = \$157  + \$158 ;
+  assign \$160  = accumulate ? c_10 : 8'h00;
+  assign \$161  = a_8 * b_2;
+  assign \$162  = \$160  + \$161 ;
+  assign \$163  = a_9 * b_6;
+  assign \$164  = \$162  + \$163 ;
+  assign \$165  = a_10 * b_10;
+  assign \$166  = \$164  + \$165 ;
+  assign \$167  = a_11 * b_14;
+  assign \$168  = \$166  + \$167 ;
+  assign \$169  = accumulate ? c_11 : 8'h00;
+  assign \$170  = a_8 * b_3;
+  assign \$171  = \$169  + \$170 ;
+  assign \$172  = a_9 * b_7;
+  assign \$173  = \$171  + \$172 ;
+  assign \$174  = a_10 * b_11;
+  assign \$175  = \$173  + \$174 ;
+  assign \$176  = a_11 * b_15;
+  assign \$177  = \$175  + \$176 ;
+  assign \$178  = accumulate ? c_12 : 8'h00;
+  assign \$179  = a_12 * b_0;
+  assign \$180  = \$178  + \$179 ;
+  assign \$181  = a_13 * b_4;
+  assign \$182  = \$180  + \$181 ;
+  assign \$183  = a_14 * b_8;
+  assign \$184  = \$182  + \$183 ;
+  assign \$185  = a_15 * b_12;
+  assign \$186  = \$184  + \$185 ;
+  assign \$187  = accumulate ? c_13 : 8'h00;
+  assign \$188  = a_12 * b_1;
+  assign \$189  = \$187  + \$188 ;
+  assign \$190  = a_13 * b_5;
+  assign \$191  = \$189  + \$190 ;
+  assign \$192  = a_14 * b_9;
+  assign \$193  = \$191  + \$192 ;
+  assign \$194  = a_15 * b_13;
+  assign \$195  = \$193  + \$194 ;
+  assign \$196  = accumulate ? c_14 : 8'h00;
+  assign \$197  = a_12 * b_2;
+  assign \$198  = \$196  + \$197 ;
+  assign \$199  = a_13 * b_6;
+  assign \$200  = \$198  + \$199 ;
+  assign \$201  = a_14 * b_10;
+  assign \$202  = \$200  + \$201 ;
+  assign \$203  = a_15 * b_14;
+  assign \$204  = \$202  + \$203 ;
+  assign \$205  = accumulate ? c_15 : 8'h00;
+  assign \$206  = a_12 * b_3;
+  assign \$207  = \$205  + \$206 ;
+  assign \$208  = a_13 * b_7;
+  assign \$209  = \$207  + \$208 ;
+  assign \$210  = a_14 * b_11;
+  assign \$211  = \$209  + \$210 ;
+  assign \$212  = a_15 * b_15;
+  assign \$213  = \$211  + \$212 ;
+  assign \$214  = compute_op == 4'hf;
+  assign \$215  = uio_in[0] ? c_0 : 8'h00;
+  assign bank_0 = uio_in[1] ? \$215  : a_0;
+  assign \$216  = uio_in[0] ? c_1 : 8'h00;
+  assign \$217  = uio_in[0] ? a_4 : a_1;
+  assign bank_1 = uio_in[1] ? \$216  : \$217 ;
+  assign \$218  = uio_in[0] ? c_2 : 8'h00;
+  assign \$219  = uio_in[0] ? a_8 : a_2;
+  assign bank_2 = uio_in[1] ? \$218  : \$219 ;
+  assign \$220  = uio_in[0] ? c_3 : 8'h00;
+  assign \$221  = uio_in[0] ? a_12 : a_3;
+  assign bank_3 = uio_in[1] ? \$220  : \$221 ;
+  assign \$222  = uio_in[0] ? c_4 : 8'h00;
+  assign \$223  = uio_in[0] ? a_1 : a_4;
+  assign bank_4 = uio_in[1] ? \$222  : \$223 ;
+  assign \$224  = uio_in[0] ? c_5 : 8'h00;
+  assign bank_5 = uio_in[1] ? \$224  : a_5;
+  assign \$225  = uio_in[0] ? c_6 : 8'h00;
+  assign \$226  = uio_in[0] ? a_9 : a_6;
+  assign bank_6 = uio_in[1] ? \$225  : \$226 ;
+  assign \$227  = uio_in[0] ? c_7 : 8'h00;
+  assign \$228  = uio_in[0] ? a_13 : a_7;
+  assign bank_7 = uio_in[1] ? \$227  : \$228 ;
+  assign \$229  = uio_in[0] ? c_8 : 8'h00;
+  assign \$230  = uio_in[0] ? a_2 : a_8;
+  assign bank_8 = uio_in[1] ? \$229  : \$230 ;
+  assign \$231  = uio_in[0] ? c_9 : 8'h00;
+  assign \$232  = uio_in[0] ? a_6 : a_9;
+  assign bank_9 = uio_in[1] ? \$231  : \$232 ;
+  assign \$233  = uio_in[0] ? c_10 : 8'h00;
+  assign bank_10 = uio_in[1] ? \$233  : a_10;
+  assign \$234  = uio_in[0] ? c_11 : 8'h00;
+  assign \$235  = uio_in[0] ? a_14 : a_11;
+  assign bank_11 = uio_in[1] ? \$234  : \$235 ;
+  assign \$236  = uio_in[0] ? c_12 : 8'h00;
+  assign \$237  = uio_in[0] ? a_3 : a_12;
+  assign bank_12 = uio_in[1] ? \$236  : \$237 ;
+  assign \$238  = uio_in[0] ? c_13 : 8'h00;
+  assign \$239  = uio_in[0] ? a_7 : a_13;
+  assign bank_13 = uio_in[1] ? \$238  : \$239 ;
+  assign \$240  = uio_in[0] ? c_14 : 8'h00;
+  assign \$241  = uio_in[0] ? a_11 : a_14;
+  assign bank_14 = uio_in[1] ? \$240  : \$241 ;
+  assign \$242  = uio_in[0] ? c_15 : 8'h00;
+  assign bank_15 = uio_in[1] ? \$242  : a_15;
+  assign \$243  = 1'h0 + a_0;
+  assign \$244  = \$243  + a_1;
+  assign \$245  = \$244  + a_2;
+  assign \$246  = \$245  + a_3;
+  assign \$247  = \$246  + a_4;
+  assign \$248  = \$247  + a_5;
+  assign \$249  = \$248  + a_6;
+  assign \$250  = \$249  + a_7;
+  assign \$251  = \$250  + a_8;
+  assign \$252  = \$251  + a_9;
+  assign \$253  = \$252  + a_10;
+  assign \$254  = \$253  + a_11;
+  assign \$255  = \$254  + a_12;
+  assign \$256  = \$255  + a_13;
+  assign \$257  = \$256  + a_14;
+  assign \$258  = \$257  + a_15;
+  assign rst = ~ rst_n;
+  assign \$259  = mp + 1'h1;
+  assign \$261  = mp + 1'h1;
+  assign \$263  = mp + 1'h1;
+  assign \$265  = mp + 2'h2;
+  assign \$266  = mp + 1'h1;
+  assign \$267  = mp + 2'h2;
+  assign \$268  = ! mp[7:4];
+  assign \$269  = mp[7:4] == 1'h1;
+  assign \$270  = mp[7:4] == 2'h2;
+  assign \$271  = mp[7:4] == 2'h3;
+  assign \$272  = bank_op ? bank_0 : \$12 [7:0];
+  assign \$273  = bank_op ? bank_1 : \$15 [7:0];
+  assign \$274  = bank_op ? bank_2 : \$18 [7:0];
+  assign \$275  = bank_op ? bank_3 : \$21 [7:0];
+  assign \$276  = bank_op ? bank_4 : \$25 [7:0];
+  assign \$277  = bank_op ? bank_5 : \$29 [7:0];
+  assign \$278  = bank_op ? bank_6 : \$33 [7:0];
+  assign \$279  = bank_op ? bank_7 : \$37 [7:0];
+  assign \$280  = bank_op ? bank_8 : \$41 [7:0];
+  assign \$281  = bank_op ? bank_9 : \$45 [7:0];
+  assign \$282  = bank_op ? bank_10 : \$49 [7:0];
+  assign \$283  = bank_op ? bank_11 : \$53 [7:0];
+  assign \$284  = bank_op ? bank_12 : \$57 [7:0];
+  assign \$285  = bank_op ? bank_13 : \$61 [7:0];
+  assign \$286  = bank_op ? bank_14 : \$65 [7:0];
+  assign \$287  = bank_op ? bank_15 : \$69 [7:0];
+  assign \$288  = 1'h0 + \$12 [7:0];
+  assign \$289  = \$288  + \$15 [7:0];
+  assign \$290  = \$289  + \$18 [7:0];
+  assign \$291  = \$290  + \$21 [7:0];
+  assign \$292  = mp + 1'h1;
+  assign \$293  = 1'h0 + \$12 [7:0];
+  assign \$294  = \$293  + \$15 [7:0];
+  assign \$295  = \$294  + \$18 [7:0];
+  assign \$296  = \$295  + \$21 [7:0];
+  assign \$297  = 1'h0 + \$25 [7:0];
+  assign \$298  = \$297  + \$29 [7:0];
+  assign \$299  = \$298  + \$33 [7:0];
+  assign \$300  = \$299  + \$37 [7:0];
+  assign \$301  = 1'h0 + \$41 [7:0];
+  assign \$302  = \$301  + \$45 [7:0];
+  assign \$303  = \$302  + \$49 [7:0];
+  assign \$304  = \$303  + \$53 [7:0];
+  assign \$305  = 1'h0 + \$57 [7:0];
+  assign \$306  = \$305  + \$61 [7:0];
+  assign \$307  = \$306  + \$65 [7:0];
+  assign \$308  = \$307  + \$69 [7:0];
+  assign \$309  = 1'h0 + \$12 [7:0];
+  assign \$310  = \$309  + \$15 [7:0];
+  assign \$311  = \$310  + \$18 [7:0];
+  assign \$312  = \$311  + \$21 [7:0];
+  assign \$313  = 1'h0 + \$25 [7:0];
+  assign \$314  = \$313  + \$29 [7:0];
+  assign \$315  = \$314  + \$33 [7:0];
+  assign \$316  = \$315  + \$37 [7:0];
+  assign \$317  = 1'h0 + \$41 [7:0];
+  assign \$318  = \$317  + \$45 [7:0];
+  assign \$319  = \$318  + \$49 [7:0];
+  assign \$320  = \$319  + \$53 [7:0];
+  assign \$321  = 1'h0 + \$57 [7:0];
+  assign \$322  = \$321  + \$61 [7:0];
+  assign \$323  = \$322  + \$65 [7:0];
+  assign \$324  = \$323  + \$69 [7:0];
+  assign \$325  = ui_in[3:0] == 4'h8;
+  assign \$326  = \$325  ? 8'hff : 8'h00;
+  always @(posedge clk)
+    mp <= \$327 ;
+  always @(posedge clk)
+    m_0 <= \$328 ;
+  always @(posedge clk)
+    m_1 <= \$329 ;
+  always @(posedge clk)
+    m_2 <= \$330 ;
+  always @(posedge clk)
+    m_3 <= \$331 ;
+  always @(posedge clk)
+    m_4 <= \$332 ;
+  always @(posedge clk)
+    m_5 <= \$333 ;
+  always @(posedge clk)
+    m_6 <= \$334 ;
+  always @(posedge clk)
+    m_7 <= \$335 ;
+  always @(posedge clk)
+    m_8 <= \$336 ;
+  always @(posedge clk)
+    m_9 <= \$337 ;
+  always @(posedge clk)
+    m_10 <= \$338 ;
+  always @(posedge clk)
+    m_11 <= \$339 ;
+  always @(posedge clk)
+    m_12 <= \$340 ;
+  always @(posedge clk)
+    m_13 <= \$341 ;
+  always @(posedge clk)
+    m_14 <= \$342 ;
+  always @(posedge clk)
+    m_15 <= \$343 ;
+  always @(posedge clk)
+    m_16 <= \$344 ;
+  always @(posedge clk)
+    m_17 <= \$345 ;
+  always @(posedge clk)
+    m_18 <= \$346 ;
+  always @(posedge clk)
+    m_19 <= \$347 ;
+  always @(posedge clk)
+    m_20 <= \$348 ;
+  always @(posedge clk)
+    m_21 <= \$349 ;
+  always @(posedge clk)
+    m_22 <= \$350 ;
+  always @(posedge clk)
+    m_23 <= \$351 ;
+  always @(posedge clk)
+    m_24 <= \$352 ;
+  always @(posedge clk)
+    m_25 <= \$353 ;
+  always @(posedge clk)
+    m_26 <= \$354 ;
+  always @(posedge clk)
+    m_27 <= \$355 ;
+  always @(posedge clk)
+    m_28 <= \$356 ;
+  always @(posedge clk)
+    m_29 <= \$357 ;
+  always @(posedge clk)
+    m_30 <= \$358 ;
+  always @(posedge clk)
+    m_31 <= \$359 ;
+  always @(posedge clk)
+    m_32 <= \$360 ;
+  always @(posedge clk)
+    m_33 <= \$361 ;
+  always @(posedge clk)
+    m_34 <= \$362 ;
+  always @(posedge clk)
+    m_35 <= \$363 ;
+  always @(posedge clk)
+    m_36 <= \$364 ;
+  always @(posedge clk)
+    m_37 <= \$365 ;
+  always @(posedge clk)
+    m_38 <= \$366 ;
+  always @(posedge clk)
+    m_39 <= \$367 ;
+  always @(posedge clk)
+    m_40 <= \$368 ;
+  always @(posedge clk)
+    m_41 <= \$369 ;
+  always @(posedge clk)
+    m_42 <= \$370 ;
+  always @(posedge clk)
+    m_43 <= \$371 ;
+  always @(posedge clk)
+    m_44 <= \$372 ;
+  always @(posedge clk)
+    m_45 <= \$373 ;
+  always @(posedge clk)
+    m_46 <= \$374 ;
+  always @(posedge clk)
+    m_47 <= \$375 ;
+  always @(posedge clk)
+    m_48 <= \$376 ;
+  always @(posedge clk)
+    m_49 <= \$377 ;
+  always @(posedge clk)
+    m_50 <= \$378 ;
+  always @(posedge clk)
+    m_51 <= \$379 ;
+  always @(posedge clk)
+    m_52 <= \$380 ;
+  always @(posedge clk)
+    m_53 <= \$381 ;
+  always @(posedge clk)
+    m_54 <= \$382 ;
+  always @(posedge clk)
+    m_55 <= \$383 ;
+  always @(posedge clk)
+    m_56 <= \$384 ;
+  always @(posedge clk)
+    m_57 <= \$385 ;
+  always @(posedge clk)
+    m_58 <= \$386 ;
+  always @(posedge clk)
+    m_59 <= \$387 ;
+  always @(posedge clk)
+    m_60 <= \$388 ;
+  always @(posedge clk)
+    m_61 <= \$389 ;
+  always @(posedge clk)
+    m_62 <= \$390 ;
+  always @(posedge clk)
+    m_63 <= \$391 ;
+  always @(posedge clk)
+    uo_out <= \$392 ;
+  always @(posedge clk)
+    uio_out <= \$393 ;
+  always @(posedge clk)
+    uio_oe <= \$394 ;
+  assign \$auto$rtlil.cc:2739:Not$2  = ~ mp[4];
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (ui_in[6:4])
+      3'h0:
+          \$6  = 4'h4;
+      3'h1:
+          \$6  = 4'h6;
+      3'h2:
+          \$6  = 4'ha;
+      3'h3:
+          \$6  = 4'hb;
+      3'h4:
+          \$6  = 4'hc;
+      3'h5:
+          \$6  = 4'hd;
+      3'h6:
+          \$6  = 4'h0;
+      3'h7:
+          \$6  = 4'h0;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_0 = m_0;
+      2'h1:
+          a_0 = m_16;
+      2'h2:
+          a_0 = m_32;
+      2'h3:
+          a_0 = m_48;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_0 = m_0;
+      2'h1:
+          b_0 = m_16;
+      2'h2:
+          b_0 = m_32;
+      2'h3:
+          b_0 = m_48;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_0 = m_0;
+      2'h1:
+          c_0 = m_16;
+      2'h2:
+          c_0 = m_32;
+      2'h3:
+          c_0 = m_48;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_1 = m_1;
+      2'h1:
+          a_1 = m_17;
+      2'h2:
+          a_1 = m_33;
+      2'h3:
+          a_1 = m_49;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_1 = m_1;
+      2'h1:
+          b_1 = m_17;
+      2'h2:
+          b_1 = m_33;
+      2'h3:
+          b_1 = m_49;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_1 = m_1;
+      2'h1:
+          c_1 = m_17;
+      2'h2:
+          c_1 = m_33;
+      2'h3:
+          c_1 = m_49;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_2 = m_2;
+      2'h1:
+          a_2 = m_18;
+      2'h2:
+          a_2 = m_34;
+      2'h3:
+          a_2 = m_50;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_2 = m_2;
+      2'h1:
+          b_2 = m_18;
+      2'h2:
+          b_2 = m_34;
+      2'h3:
+          b_2 = m_50;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_2 = m_2;
+      2'h1:
+          c_2 = m_18;
+      2'h2:
+          c_2 = m_34;
+      2'h3:
+          c_2 = m_50;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_3 = m_3;
+      2'h1:
+          a_3 = m_19;
+      2'h2:
+          a_3 = m_35;
+      2'h3:
+          a_3 = m_51;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_3 = m_3;
+      2'h1:
+          b_3 = m_19;
+      2'h2:
+          b_3 = m_35;
+      2'h3:
+          b_3 = m_51;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_3 = m_3;
+      2'h1:
+          c_3 = m_19;
+      2'h2:
+          c_3 = m_35;
+      2'h3:
+          c_3 = m_51;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_4 = m_4;
+      2'h1:
+          a_4 = m_20;
+      2'h2:
+          a_4 = m_36;
+      2'h3:
+          a_4 = m_52;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_4 = m_4;
+      2'h1:
+          b_4 = m_20;
+      2'h2:
+          b_4 = m_36;
+      2'h3:
+          b_4 = m_52;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_4 = m_4;
+      2'h1:
+          c_4 = m_20;
+      2'h2:
+          c_4 = m_36;
+      2'h3:
+          c_4 = m_52;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_5 = m_5;
+      2'h1:
+          a_5 = m_21;
+      2'h2:
+          a_5 = m_37;
+      2'h3:
+          a_5 = m_53;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_5 = m_5;
+      2'h1:
+          b_5 = m_21;
+      2'h2:
+          b_5 = m_37;
+      2'h3:
+          b_5 = m_53;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_5 = m_5;
+      2'h1:
+          c_5 = m_21;
+      2'h2:
+          c_5 = m_37;
+      2'h3:
+          c_5 = m_53;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_6 = m_6;
+      2'h1:
+          a_6 = m_22;
+      2'h2:
+          a_6 = m_38;
+      2'h3:
+          a_6 = m_54;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_6 = m_6;
+      2'h1:
+          b_6 = m_22;
+      2'h2:
+          b_6 = m_38;
+      2'h3:
+          b_6 = m_54;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_6 = m_6;
+      2'h1:
+          c_6 = m_22;
+      2'h2:
+          c_6 = m_38;
+      2'h3:
+          c_6 = m_54;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_7 = m_7;
+      2'h1:
+          a_7 = m_23;
+      2'h2:
+          a_7 = m_39;
+      2'h3:
+          a_7 = m_55;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_7 = m_7;
+      2'h1:
+          b_7 = m_23;
+      2'h2:
+          b_7 = m_39;
+      2'h3:
+          b_7 = m_55;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_7 = m_7;
+      2'h1:
+          c_7 = m_23;
+      2'h2:
+          c_7 = m_39;
+      2'h3:
+          c_7 = m_55;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_8 = m_8;
+      2'h1:
+          a_8 = m_24;
+      2'h2:
+          a_8 = m_40;
+      2'h3:
+          a_8 = m_56;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_8 = m_8;
+      2'h1:
+          b_8 = m_24;
+      2'h2:
+          b_8 = m_40;
+      2'h3:
+          b_8 = m_56;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_8 = m_8;
+      2'h1:
+          c_8 = m_24;
+      2'h2:
+          c_8 = m_40;
+      2'h3:
+          c_8 = m_56;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_9 = m_9;
+      2'h1:
+          a_9 = m_25;
+      2'h2:
+          a_9 = m_41;
+      2'h3:
+          a_9 = m_57;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_9 = m_9;
+      2'h1:
+          b_9 = m_25;
+      2'h2:
+          b_9 = m_41;
+      2'h3:
+          b_9 = m_57;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_9 = m_9;
+      2'h1:
+          c_9 = m_25;
+      2'h2:
+          c_9 = m_41;
+      2'h3:
+          c_9 = m_57;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_10 = m_10;
+      2'h1:
+          a_10 = m_26;
+      2'h2:
+          a_10 = m_42;
+      2'h3:
+          a_10 = m_58;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_10 = m_10;
+      2'h1:
+          b_10 = m_26;
+      2'h2:
+          b_10 = m_42;
+      2'h3:
+          b_10 = m_58;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_10 = m_10;
+      2'h1:
+          c_10 = m_26;
+      2'h2:
+          c_10 = m_42;
+      2'h3:
+          c_10 = m_58;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_11 = m_11;
+      2'h1:
+          a_11 = m_27;
+      2'h2:
+          a_11 = m_43;
+      2'h3:
+          a_11 = m_59;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_11 = m_11;
+      2'h1:
+          b_11 = m_27;
+      2'h2:
+          b_11 = m_43;
+      2'h3:
+          b_11 = m_59;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_11 = m_11;
+      2'h1:
+          c_11 = m_27;
+      2'h2:
+          c_11 = m_43;
+      2'h3:
+          c_11 = m_59;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_12 = m_12;
+      2'h1:
+          a_12 = m_28;
+      2'h2:
+          a_12 = m_44;
+      2'h3:
+          a_12 = m_60;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_12 = m_12;
+      2'h1:
+          b_12 = m_28;
+      2'h2:
+          b_12 = m_44;
+      2'h3:
+          b_12 = m_60;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_12 = m_12;
+      2'h1:
+          c_12 = m_28;
+      2'h2:
+          c_12 = m_44;
+      2'h3:
+          c_12 = m_60;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_13 = m_13;
+      2'h1:
+          a_13 = m_29;
+      2'h2:
+          a_13 = m_45;
+      2'h3:
+          a_13 = m_61;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_13 = m_13;
+      2'h1:
+          b_13 = m_29;
+      2'h2:
+          b_13 = m_45;
+      2'h3:
+          b_13 = m_61;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_13 = m_13;
+      2'h1:
+          c_13 = m_29;
+      2'h2:
+          c_13 = m_45;
+      2'h3:
+          c_13 = m_61;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_14 = m_14;
+      2'h1:
+          a_14 = m_30;
+      2'h2:
+          a_14 = m_46;
+      2'h3:
+          a_14 = m_62;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_14 = m_14;
+      2'h1:
+          b_14 = m_30;
+      2'h2:
+          b_14 = m_46;
+      2'h3:
+          b_14 = m_62;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_14 = m_14;
+      2'h1:
+          c_14 = m_30;
+      2'h2:
+          c_14 = m_46;
+      2'h3:
+          c_14 = m_62;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_A)
+      2'h0:
+          a_15 = m_15;
+      2'h1:
+          a_15 = m_31;
+      2'h2:
+          a_15 = m_47;
+      2'h3:
+          a_15 = m_63;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_B)
+      2'h0:
+          b_15 = m_15;
+      2'h1:
+          b_15 = m_31;
+      2'h2:
+          b_15 = m_47;
+      2'h3:
+          b_15 = m_63;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    (* full_case = 32'd1 *)
+    casez (sel_C)
+      2'h0:
+          c_15 = m_15;
+      2'h1:
+          c_15 = m_31;
+      2'h2:
+          c_15 = m_47;
+      2'h3:
+          c_15 = m_63;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$260  = 8'h00;
+    casez (mp)
+      8'h00:
+          \$260  = m_0;
+      8'h01:
+          \$260  = m_1;
+      8'h02:
+          \$260  = m_2;
+      8'h03:
+          \$260  = m_3;
+      8'h04:
+          \$260  = m_4;
+      8'h05:
+          \$260  = m_5;
+      8'h06:
+          \$260  = m_6;
+      8'h07:
+          \$260  = m_7;
+      8'h08:
+          \$260  = m_8;
+      8'h09:
+          \$260  = m_9;
+      8'h0a:
+          \$260  = m_10;
+      8'h0b:
+          \$260  = m_11;
+      8'h0c:
+          \$260  = m_12;
+      8'h0d:
+          \$260  = m_13;
+      8'h0e:
+          \$260  = m_14;
+      8'h0f:
+          \$260  = m_15;
+      8'h10:
+          \$260  = m_16;
+      8'h11:
+          \$260  = m_17;
+      8'h12:
+          \$260  = m_18;
+      8'h13:
+          \$260  = m_19;
+      8'h14:
+          \$260  = m_20;
+      8'h15:
+          \$260  = m_21;
+      8'h16:
+          \$260  = m_22;
+      8'h17:
+          \$260  = m_23;
+      8'h18:
+          \$260  = m_24;
+      8'h19:
+          \$260  = m_25;
+      8'h1a:
+          \$260  = m_26;
+      8'h1b:
+          \$260  = m_27;
+      8'h1c:
+          \$260  = m_28;
+      8'h1d:
+          \$260  = m_29;
+      8'h1e:
+          \$260  = m_30;
+      8'h1f:
+          \$260  = m_31;
+      8'h20:
+          \$260  = m_32;
+      8'h21:
+          \$260  = m_33;
+      8'h22:
+          \$260  = m_34;
+      8'h23:
+          \$260  = m_35;
+      8'h24:
+          \$260  = m_36;
+      8'h25:
+          \$260  = m_37;
+      8'h26:
+          \$260  = m_38;
+      8'h27:
+          \$260  = m_39;
+      8'h28:
+          \$260  = m_40;
+      8'h29:
+          \$260  = m_41;
+      8'h2a:
+          \$260  = m_42;
+      8'h2b:
+          \$260  = m_43;
+      8'h2c:
+          \$260  = m_44;
+      8'h2d:
+          \$260  = m_45;
+      8'h2e:
+          \$260  = m_46;
+      8'h2f:
+          \$260  = m_47;
+      8'h30:
+          \$260  = m_48;
+      8'h31:
+          \$260  = m_49;
+      8'h32:
+          \$260  = m_50;
+      8'h33:
+          \$260  = m_51;
+      8'h34:
+          \$260  = m_52;
+      8'h35:
+          \$260  = m_53;
+      8'h36:
+          \$260  = m_54;
+      8'h37:
+          \$260  = m_55;
+      8'h38:
+          \$260  = m_56;
+      8'h39:
+          \$260  = m_57;
+      8'h3a:
+          \$260  = m_58;
+      8'h3b:
+          \$260  = m_59;
+      8'h3c:
+          \$260  = m_60;
+      8'h3d:
+          \$260  = m_61;
+      8'h3e:
+          \$260  = m_62;
+      8'h3f:
+          \$260  = m_63;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$262  = 8'h00;
+    casez (mp)
+      8'h00:
+          \$262  = m_0;
+      8'h01:
+          \$262  = m_1;
+      8'h02:
+          \$262  = m_2;
+      8'h03:
+          \$262  = m_3;
+      8'h04:
+          \$262  = m_4;
+      8'h05:
+          \$262  = m_5;
+      8'h06:
+          \$262  = m_6;
+      8'h07:
+          \$262  = m_7;
+      8'h08:
+          \$262  = m_8;
+      8'h09:
+          \$262  = m_9;
+      8'h0a:
+          \$262  = m_10;
+      8'h0b:
+          \$262  = m_11;
+      8'h0c:
+          \$262  = m_12;
+      8'h0d:
+          \$262  = m_13;
+      8'h0e:
+          \$262  = m_14;
+      8'h0f:
+          \$262  = m_15;
+      8'h10:
+          \$262  = m_16;
+      8'h11:
+          \$262  = m_17;
+      8'h12:
+          \$262  = m_18;
+      8'h13:
+          \$262  = m_19;
+      8'h14:
+          \$262  = m_20;
+      8'h15:
+          \$262  = m_21;
+      8'h16:
+          \$262  = m_22;
+      8'h17:
+          \$262  = m_23;
+      8'h18:
+          \$262  = m_24;
+      8'h19:
+          \$262  = m_25;
+      8'h1a:
+          \$262  = m_26;
+      8'h1b:
+          \$262  = m_27;
+      8'h1c:
+          \$262  = m_28;
+      8'h1d:
+          \$262  = m_29;
+      8'h1e:
+          \$262  = m_30;
+      8'h1f:
+          \$262  = m_31;
+      8'h20:
+          \$262  = m_32;
+      8'h21:
+          \$262  = m_33;
+      8'h22:
+          \$262  = m_34;
+      8'h23:
+          \$262  = m_35;
+      8'h24:
+          \$262  = m_36;
+      8'h25:
+          \$262  = m_37;
+      8'h26:
+          \$262  = m_38;
+      8'h27:
+          \$262  = m_39;
+      8'h28:
+          \$262  = m_40;
+      8'h29:
+          \$262  = m_41;
+      8'h2a:
+          \$262  = m_42;
+      8'h2b:
+          \$262  = m_43;
+      8'h2c:
+          \$262  = m_44;
+      8'h2d:
+          \$262  = m_45;
+      8'h2e:
+          \$262  = m_46;
+      8'h2f:
+          \$262  = m_47;
+      8'h30:
+          \$262  = m_48;
+      8'h31:
+          \$262  = m_49;
+      8'h32:
+          \$262  = m_50;
+      8'h33:
+          \$262  = m_51;
+      8'h34:
+          \$262  = m_52;
+      8'h35:
+          \$262  = m_53;
+      8'h36:
+          \$262  = m_54;
+      8'h37:
+          \$262  = m_55;
+      8'h38:
+          \$262  = m_56;
+      8'h39:
+          \$262  = m_57;
+      8'h3a:
+          \$262  = m_58;
+      8'h3b:
+          \$262  = m_59;
+      8'h3c:
+          \$262  = m_60;
+      8'h3d:
+          \$262  = m_61;
+      8'h3e:
+          \$262  = m_62;
+      8'h3f:
+          \$262  = m_63;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$264  = 8'h00;
+    casez (\$263 )
+      9'h000:
+          \$264  = m_0;
+      9'h001:
+          \$264  = m_1;
+      9'h002:
+          \$264  = m_2;
+      9'h003:
+          \$264  = m_3;
+      9'h004:
+          \$264  = m_4;
+      9'h005:
+          \$264  = m_5;
+      9'h006:
+          \$264  = m_6;
+      9'h007:
+          \$264  = m_7;
+      9'h008:
+          \$264  = m_8;
+      9'h009:
+          \$264  = m_9;
+      9'h00a:
+          \$264  = m_10;
+      9'h00b:
+          \$264  = m_11;
+      9'h00c:
+          \$264  = m_12;
+      9'h00d:
+          \$264  = m_13;
+      9'h00e:
+          \$264  = m_14;
+      9'h00f:
+          \$264  = m_15;
+      9'h010:
+          \$264  = m_16;
+      9'h011:
+          \$264  = m_17;
+      9'h012:
+          \$264  = m_18;
+      9'h013:
+          \$264  = m_19;
+      9'h014:
+          \$264  = m_20;
+      9'h015:
+          \$264  = m_21;
+      9'h016:
+          \$264  = m_22;
+      9'h017:
+          \$264  = m_23;
+      9'h018:
+          \$264  = m_24;
+      9'h019:
+          \$264  = m_25;
+      9'h01a:
+          \$264  = m_26;
+      9'h01b:
+          \$264  = m_27;
+      9'h01c:
+          \$264  = m_28;
+      9'h01d:
+          \$264  = m_29;
+      9'h01e:
+          \$264  = m_30;
+      9'h01f:
+          \$264  = m_31;
+      9'h020:
+          \$264  = m_32;
+      9'h021:
+          \$264  = m_33;
+      9'h022:
+          \$264  = m_34;
+      9'h023:
+          \$264  = m_35;
+      9'h024:
+          \$264  = m_36;
+      9'h025:
+          \$264  = m_37;
+      9'h026:
+          \$264  = m_38;
+      9'h027:
+          \$264  = m_39;
+      9'h028:
+          \$264  = m_40;
+      9'h029:
+          \$264  = m_41;
+      9'h02a:
+          \$264  = m_42;
+      9'h02b:
+          \$264  = m_43;
+      9'h02c:
+          \$264  = m_44;
+      9'h02d:
+          \$264  = m_45;
+      9'h02e:
+          \$264  = m_46;
+      9'h02f:
+          \$264  = m_47;
+      9'h030:
+          \$264  = m_48;
+      9'h031:
+          \$264  = m_49;
+      9'h032:
+          \$264  = m_50;
+      9'h033:
+          \$264  = m_51;
+      9'h034:
+          \$264  = m_52;
+      9'h035:
+          \$264  = m_53;
+      9'h036:
+          \$264  = m_54;
+      9'h037:
+          \$264  = m_55;
+      9'h038:
+          \$264  = m_56;
+      9'h039:
+          \$264  = m_57;
+      9'h03a:
+          \$264  = m_58;
+      9'h03b:
+          \$264  = m_59;
+      9'h03c:
+          \$264  = m_60;
+      9'h03d:
+          \$264  = m_61;
+      9'h03e:
+          \$264  = m_62;
+      9'h03f:
+          \$264  = m_63;
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    total = 8'h00;
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          /* empty */;
+      4'h6, 4'ha:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'hc:
+          /* empty */;
+      4'hd:
+          /* empty */;
+      4'h7:
+          total = \$258 [7:0];
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$327  = mp;
+    casez (ui_in[3:0])
+      4'h1:
+          \$327  = uio_in;
+      4'h2:
+          \$327  = \$259 [7:0];
+      4'h3:
+          \$327  = \$261 [7:0];
+      4'h8:
+          \$327  = \$265 [7:0];
+      4'h9:
+          \$327  = \$267 [7:0];
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          /* empty */;
+      4'h6, 4'ha:
+          /* empty */;
+      4'h5:
+          \$327  = \$292 [7:0];
+    endcase
+    if (rst) begin
+      \$327  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$328  = m_0;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                \$328  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                \$328  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                \$328  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$328  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$328  = \$272 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$328  = \$78 [7:0];
+          endcase
+      4'h5:
+          casez (sel_C)
+            2'h0:
+                \$328  = \$291 [7:0];
+          endcase
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                \$328  = \$296 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                \$328  = \$312 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$328  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$329  = m_1;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                \$329  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                \$329  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                \$329  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$329  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$329  = \$273 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$329  = \$87 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                \$329  = \$300 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                \$329  = \$316 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$329  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$330  = m_2;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                \$330  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                \$330  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                \$330  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$330  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$330  = \$274 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$330  = \$96 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                \$330  = \$304 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                \$330  = \$320 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$330  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$331  = m_3;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                \$331  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                \$331  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                \$331  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$331  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$331  = \$275 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$331  = \$105 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                \$331  = \$308 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                \$331  = \$324 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$331  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$332  = m_4;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                \$332  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                \$332  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                \$332  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$332  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$332  = \$276 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$332  = \$114 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$332  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$333  = m_5;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                \$333  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                \$333  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                \$333  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$333  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$333  = \$277 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$333  = \$123 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$333  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$334  = m_6;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                \$334  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                \$334  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                \$334  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$334  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$334  = \$278 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$334  = \$132 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$334  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$335  = m_7;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                \$335  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                \$335  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                \$335  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$335  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$335  = \$279 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$335  = \$141 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$335  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$336  = m_8;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                \$336  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                \$336  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                \$336  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$336  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$336  = \$280 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$336  = \$150 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$336  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$337  = m_9;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                \$337  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                \$337  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                \$337  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$337  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$337  = \$281 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$337  = \$159 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$337  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$338  = m_10;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                \$338  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                \$338  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                \$338  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$338  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$338  = \$282 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$338  = \$168 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$338  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$339  = m_11;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                \$339  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                \$339  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                \$339  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$339  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$339  = \$283 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$339  = \$177 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$339  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$340  = m_12;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                \$340  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                \$340  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                \$340  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$340  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$340  = \$284 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$340  = \$186 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$340  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$341  = m_13;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                \$341  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                \$341  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                \$341  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$341  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$341  = \$285 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$341  = \$195 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$341  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$342  = m_14;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                \$342  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                \$342  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                \$342  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$342  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$342  = \$286 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$342  = \$204 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$342  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$343  = m_15;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                \$343  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                \$343  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                \$343  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$268 ) begin
+            \$343  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                \$343  = \$287 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                \$343  = \$213 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$343  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$344  = m_16;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                \$344  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                \$344  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                \$344  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$344  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$344  = \$272 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$344  = \$78 [7:0];
+          endcase
+      4'h5:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$344  = \$291 [7:0];
+          endcase
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$344  = \$296 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$344  = \$312 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$344  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$345  = m_17;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                \$345  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                \$345  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                \$345  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$345  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$345  = \$273 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$345  = \$87 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$345  = \$300 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$345  = \$316 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$345  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$346  = m_18;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                \$346  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                \$346  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                \$346  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$346  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$346  = \$274 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$346  = \$96 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$346  = \$304 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$346  = \$320 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$346  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$347  = m_19;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                \$347  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                \$347  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                \$347  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$347  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$347  = \$275 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$347  = \$105 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$347  = \$308 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$347  = \$324 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$347  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$348  = m_20;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                \$348  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                \$348  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                \$348  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$348  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$348  = \$276 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$348  = \$114 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$348  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$349  = m_21;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                \$349  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                \$349  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                \$349  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$349  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$349  = \$277 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$349  = \$123 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$349  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$350  = m_22;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                \$350  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                \$350  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                \$350  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$350  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$350  = \$278 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$350  = \$132 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$350  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$351  = m_23;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                \$351  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                \$351  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                \$351  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$351  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$351  = \$279 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$351  = \$141 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$351  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$352  = m_24;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                \$352  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                \$352  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                \$352  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$352  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$352  = \$280 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$352  = \$150 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$352  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$353  = m_25;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                \$353  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                \$353  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                \$353  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$353  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$353  = \$281 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$353  = \$159 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$353  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$354  = m_26;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                \$354  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                \$354  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                \$354  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$354  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$354  = \$282 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$354  = \$168 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$354  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$355  = m_27;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                \$355  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                \$355  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                \$355  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$355  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$355  = \$283 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$355  = \$177 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$355  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$356  = m_28;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                \$356  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                \$356  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                \$356  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$356  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$356  = \$284 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$356  = \$186 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$356  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$357  = m_29;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                \$357  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                \$357  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                \$357  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$357  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$357  = \$285 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$357  = \$195 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$357  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$358  = m_30;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                \$358  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                \$358  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                \$358  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$358  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$358  = \$286 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$358  = \$204 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$358  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$359  = m_31;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                \$359  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                \$359  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                \$359  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$269 ) begin
+            \$359  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$359  = \$287 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                \$359  = \$213 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$359  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$360  = m_32;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                \$360  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                \$360  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                \$360  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$360  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$360  = \$272 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$360  = \$78 [7:0];
+          endcase
+      4'h5:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$360  = \$291 [7:0];
+          endcase
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$360  = \$296 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$360  = \$312 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$360  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$361  = m_33;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                \$361  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                \$361  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                \$361  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$361  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$361  = \$273 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$361  = \$87 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$361  = \$300 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$361  = \$316 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$361  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$362  = m_34;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                \$362  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                \$362  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                \$362  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$362  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$362  = \$274 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$362  = \$96 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$362  = \$304 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$362  = \$320 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$362  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$363  = m_35;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                \$363  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                \$363  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                \$363  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$363  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$363  = \$275 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$363  = \$105 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$363  = \$308 [7:0];
+          endcase
+      4'hd:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$363  = \$324 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$363  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$364  = m_36;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                \$364  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                \$364  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                \$364  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$364  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$364  = \$276 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$364  = \$114 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$364  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$365  = m_37;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                \$365  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                \$365  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                \$365  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$365  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$365  = \$277 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$365  = \$123 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$365  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$366  = m_38;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                \$366  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                \$366  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                \$366  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$366  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$366  = \$278 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$366  = \$132 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$366  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$367  = m_39;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                \$367  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                \$367  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                \$367  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$367  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$367  = \$279 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$367  = \$141 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$367  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$368  = m_40;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                \$368  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                \$368  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                \$368  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$368  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$368  = \$280 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$368  = \$150 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$368  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$369  = m_41;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                \$369  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                \$369  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                \$369  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$369  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$369  = \$281 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$369  = \$159 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$369  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$370  = m_42;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                \$370  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                \$370  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                \$370  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$370  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$370  = \$282 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$370  = \$168 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$370  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$371  = m_43;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                \$371  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                \$371  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                \$371  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$371  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$371  = \$283 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$371  = \$177 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$371  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$372  = m_44;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                \$372  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                \$372  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                \$372  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$372  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$372  = \$284 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$372  = \$186 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$372  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$373  = m_45;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                \$373  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                \$373  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                \$373  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$373  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$373  = \$285 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$373  = \$195 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$373  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$374  = m_46;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                \$374  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                \$374  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                \$374  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$374  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$374  = \$286 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$374  = \$204 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$374  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$375  = m_47;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                \$375  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                \$375  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                \$375  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$270 ) begin
+            \$375  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$375  = \$287 ;
+          endcase
+      4'h6, 4'ha:
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                \$375  = \$213 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$375  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$376  = m_48;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                \$376  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                \$376  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                \$376  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$376  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$376  = \$272 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$376  = \$78 [7:0];
+          endcase
+      4'h5:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$376  = \$291 [7:0];
+          endcase
+      4'hc:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$376  = \$296 [7:0];
+          endcase
+      4'hd:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$376  = \$312 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$376  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$377  = m_49;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                \$377  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                \$377  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                \$377  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$377  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$377  = \$273 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$377  = \$87 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$377  = \$300 [7:0];
+          endcase
+      4'hd:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$377  = \$316 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$377  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$378  = m_50;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                \$378  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                \$378  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                \$378  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$378  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$378  = \$274 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$378  = \$96 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$378  = \$304 [7:0];
+          endcase
+      4'hd:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$378  = \$320 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$378  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$379  = m_51;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                \$379  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                \$379  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                \$379  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$379  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$379  = \$275 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$379  = \$105 [7:0];
+          endcase
+      4'h5:
+          /* empty */;
+      4'hc:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$379  = \$308 [7:0];
+          endcase
+      4'hd:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$379  = \$324 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$379  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$380  = m_52;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                \$380  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                \$380  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                \$380  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$380  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$380  = \$276 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$380  = \$114 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$380  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$381  = m_53;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                \$381  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                \$381  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                \$381  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$381  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$381  = \$277 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$381  = \$123 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$381  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$382  = m_54;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                \$382  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                \$382  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                /* empty */;
+            9'h036:
+                \$382  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$382  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$382  = \$278 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$382  = \$132 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$382  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$383  = m_55;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                \$383  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                \$383  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                /* empty */;
+            9'h036:
+                /* empty */;
+            9'h037:
+                \$383  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$383  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$383  = \$279 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$383  = \$141 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$383  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$384  = m_56;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                \$384  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                \$384  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                /* empty */;
+            9'h036:
+                /* empty */;
+            9'h037:
+                /* empty */;
+            9'h038:
+                \$384  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$384  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$384  = \$280 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$384  = \$150 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$384  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$385  = m_57;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                \$385  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                \$385  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                /* empty */;
+            9'h036:
+                /* empty */;
+            9'h037:
+                /* empty */;
+            9'h038:
+                /* empty */;
+            9'h039:
+                \$385  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$385  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$385  = \$281 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$385  = \$159 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$385  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$386  = m_58;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                \$386  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                \$386  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                /* empty */;
+            9'h036:
+                /* empty */;
+            9'h037:
+                /* empty */;
+            9'h038:
+                /* empty */;
+            9'h039:
+                /* empty */;
+            9'h03a:
+                \$386  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$386  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$386  = \$282 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$386  = \$168 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$386  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$387  = m_59;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                /* empty */;
+            8'h3b:
+                \$387  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                /* empty */;
+            8'h3b:
+                \$387  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                /* empty */;
+            9'h036:
+                /* empty */;
+            9'h037:
+                /* empty */;
+            9'h038:
+                /* empty */;
+            9'h039:
+                /* empty */;
+            9'h03a:
+                /* empty */;
+            9'h03b:
+                \$387  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$387  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$387  = \$283 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$387  = \$177 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$387  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$388  = m_60;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                /* empty */;
+            8'h3b:
+                /* empty */;
+            8'h3c:
+                \$388  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                /* empty */;
+            8'h3b:
+                /* empty */;
+            8'h3c:
+                \$388  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                /* empty */;
+            9'h036:
+                /* empty */;
+            9'h037:
+                /* empty */;
+            9'h038:
+                /* empty */;
+            9'h039:
+                /* empty */;
+            9'h03a:
+                /* empty */;
+            9'h03b:
+                /* empty */;
+            9'h03c:
+                \$388  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$388  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$388  = \$284 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$388  = \$186 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$388  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$389  = m_61;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                /* empty */;
+            8'h3b:
+                /* empty */;
+            8'h3c:
+                /* empty */;
+            8'h3d:
+                \$389  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                /* empty */;
+            8'h3b:
+                /* empty */;
+            8'h3c:
+                /* empty */;
+            8'h3d:
+                \$389  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                /* empty */;
+            9'h036:
+                /* empty */;
+            9'h037:
+                /* empty */;
+            9'h038:
+                /* empty */;
+            9'h039:
+                /* empty */;
+            9'h03a:
+                /* empty */;
+            9'h03b:
+                /* empty */;
+            9'h03c:
+                /* empty */;
+            9'h03d:
+                \$389  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$389  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$389  = \$285 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$389  = \$195 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$389  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$390  = m_62;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                /* empty */;
+            8'h3b:
+                /* empty */;
+            8'h3c:
+                /* empty */;
+            8'h3d:
+                /* empty */;
+            8'h3e:
+                \$390  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                /* empty */;
+            8'h3b:
+                /* empty */;
+            8'h3c:
+                /* empty */;
+            8'h3d:
+                /* empty */;
+            8'h3e:
+                \$390  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                /* empty */;
+            9'h036:
+                /* empty */;
+            9'h037:
+                /* empty */;
+            9'h038:
+                /* empty */;
+            9'h039:
+                /* empty */;
+            9'h03a:
+                /* empty */;
+            9'h03b:
+                /* empty */;
+            9'h03c:
+                /* empty */;
+            9'h03d:
+                /* empty */;
+            9'h03e:
+                \$390  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$390  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$390  = \$286 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$390  = \$204 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$390  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$391  = m_63;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                /* empty */;
+            8'h3b:
+                /* empty */;
+            8'h3c:
+                /* empty */;
+            8'h3d:
+                /* empty */;
+            8'h3e:
+                /* empty */;
+            8'h3f:
+                \$391  = uio_in;
+          endcase
+      4'h3:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+        begin
+          casez (mp)
+            8'h00:
+                /* empty */;
+            8'h01:
+                /* empty */;
+            8'h02:
+                /* empty */;
+            8'h03:
+                /* empty */;
+            8'h04:
+                /* empty */;
+            8'h05:
+                /* empty */;
+            8'h06:
+                /* empty */;
+            8'h07:
+                /* empty */;
+            8'h08:
+                /* empty */;
+            8'h09:
+                /* empty */;
+            8'h0a:
+                /* empty */;
+            8'h0b:
+                /* empty */;
+            8'h0c:
+                /* empty */;
+            8'h0d:
+                /* empty */;
+            8'h0e:
+                /* empty */;
+            8'h0f:
+                /* empty */;
+            8'h10:
+                /* empty */;
+            8'h11:
+                /* empty */;
+            8'h12:
+                /* empty */;
+            8'h13:
+                /* empty */;
+            8'h14:
+                /* empty */;
+            8'h15:
+                /* empty */;
+            8'h16:
+                /* empty */;
+            8'h17:
+                /* empty */;
+            8'h18:
+                /* empty */;
+            8'h19:
+                /* empty */;
+            8'h1a:
+                /* empty */;
+            8'h1b:
+                /* empty */;
+            8'h1c:
+                /* empty */;
+            8'h1d:
+                /* empty */;
+            8'h1e:
+                /* empty */;
+            8'h1f:
+                /* empty */;
+            8'h20:
+                /* empty */;
+            8'h21:
+                /* empty */;
+            8'h22:
+                /* empty */;
+            8'h23:
+                /* empty */;
+            8'h24:
+                /* empty */;
+            8'h25:
+                /* empty */;
+            8'h26:
+                /* empty */;
+            8'h27:
+                /* empty */;
+            8'h28:
+                /* empty */;
+            8'h29:
+                /* empty */;
+            8'h2a:
+                /* empty */;
+            8'h2b:
+                /* empty */;
+            8'h2c:
+                /* empty */;
+            8'h2d:
+                /* empty */;
+            8'h2e:
+                /* empty */;
+            8'h2f:
+                /* empty */;
+            8'h30:
+                /* empty */;
+            8'h31:
+                /* empty */;
+            8'h32:
+                /* empty */;
+            8'h33:
+                /* empty */;
+            8'h34:
+                /* empty */;
+            8'h35:
+                /* empty */;
+            8'h36:
+                /* empty */;
+            8'h37:
+                /* empty */;
+            8'h38:
+                /* empty */;
+            8'h39:
+                /* empty */;
+            8'h3a:
+                /* empty */;
+            8'h3b:
+                /* empty */;
+            8'h3c:
+                /* empty */;
+            8'h3d:
+                /* empty */;
+            8'h3e:
+                /* empty */;
+            8'h3f:
+                \$391  = { 4'h0, uio_in[3:0] };
+          endcase
+          casez (\$266 )
+            9'h000:
+                /* empty */;
+            9'h001:
+                /* empty */;
+            9'h002:
+                /* empty */;
+            9'h003:
+                /* empty */;
+            9'h004:
+                /* empty */;
+            9'h005:
+                /* empty */;
+            9'h006:
+                /* empty */;
+            9'h007:
+                /* empty */;
+            9'h008:
+                /* empty */;
+            9'h009:
+                /* empty */;
+            9'h00a:
+                /* empty */;
+            9'h00b:
+                /* empty */;
+            9'h00c:
+                /* empty */;
+            9'h00d:
+                /* empty */;
+            9'h00e:
+                /* empty */;
+            9'h00f:
+                /* empty */;
+            9'h010:
+                /* empty */;
+            9'h011:
+                /* empty */;
+            9'h012:
+                /* empty */;
+            9'h013:
+                /* empty */;
+            9'h014:
+                /* empty */;
+            9'h015:
+                /* empty */;
+            9'h016:
+                /* empty */;
+            9'h017:
+                /* empty */;
+            9'h018:
+                /* empty */;
+            9'h019:
+                /* empty */;
+            9'h01a:
+                /* empty */;
+            9'h01b:
+                /* empty */;
+            9'h01c:
+                /* empty */;
+            9'h01d:
+                /* empty */;
+            9'h01e:
+                /* empty */;
+            9'h01f:
+                /* empty */;
+            9'h020:
+                /* empty */;
+            9'h021:
+                /* empty */;
+            9'h022:
+                /* empty */;
+            9'h023:
+                /* empty */;
+            9'h024:
+                /* empty */;
+            9'h025:
+                /* empty */;
+            9'h026:
+                /* empty */;
+            9'h027:
+                /* empty */;
+            9'h028:
+                /* empty */;
+            9'h029:
+                /* empty */;
+            9'h02a:
+                /* empty */;
+            9'h02b:
+                /* empty */;
+            9'h02c:
+                /* empty */;
+            9'h02d:
+                /* empty */;
+            9'h02e:
+                /* empty */;
+            9'h02f:
+                /* empty */;
+            9'h030:
+                /* empty */;
+            9'h031:
+                /* empty */;
+            9'h032:
+                /* empty */;
+            9'h033:
+                /* empty */;
+            9'h034:
+                /* empty */;
+            9'h035:
+                /* empty */;
+            9'h036:
+                /* empty */;
+            9'h037:
+                /* empty */;
+            9'h038:
+                /* empty */;
+            9'h039:
+                /* empty */;
+            9'h03a:
+                /* empty */;
+            9'h03b:
+                /* empty */;
+            9'h03c:
+                /* empty */;
+            9'h03d:
+                /* empty */;
+            9'h03e:
+                /* empty */;
+            9'h03f:
+                \$391  = { 4'h0, uio_in[7:4] };
+          endcase
+        end
+      4'he:
+          if (\$271 ) begin
+            \$391  = uio_in;
+          end
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$391  = \$287 ;
+          endcase
+      4'h6, 4'ha:
+          (* full_case = 32'd1 *)
+          casez (sel_C)
+            2'h0:
+                /* empty */;
+            2'h1:
+                /* empty */;
+            2'h2:
+                /* empty */;
+            2'h3:
+                \$391  = \$213 [7:0];
+          endcase
+    endcase
+    if (rst) begin
+      \$391  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$392  = uo_out;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          \$392  = \$260 ;
+      4'h8:
+          \$392  = \$262 ;
+    endcase
+    casez (compute_op)
+      4'h4, 4'hb, 4'hf:
+          /* empty */;
+      4'h6, 4'ha:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'hc:
+          /* empty */;
+      4'hd:
+          /* empty */;
+      4'h7:
+          \$392  = total;
+    endcase
+    if (rst) begin
+      \$392  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$393  = uio_out;
+    casez (ui_in[3:0])
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h8:
+          \$393  = \$264 ;
+    endcase
+    if (rst) begin
+      \$393  = 8'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
+    \$394  = \$326 ;
+    if (rst) begin
+      \$394  = 8'h00;
+    end
+  end
+  assign p_0 = \$12 [7:0];
+  assign p_1 = \$15 [7:0];
+  assign p_2 = \$18 [7:0];
+  assign p_3 = \$21 [7:0];
+  assign p_4 = \$25 [7:0];
+  assign p_5 = \$29 [7:0];
+  assign p_6 = \$33 [7:0];
+  assign p_7 = \$37 [7:0];
+  assign p_8 = \$41 [7:0];
+  assign p_9 = \$45 [7:0];
+  assign p_10 = \$49 [7:0];
+  assign p_11 = \$53 [7:0];
+  assign p_12 = \$57 [7:0];
+  assign p_13 = \$61 [7:0];
+  assign p_14 = \$65 [7:0];
+  assign p_15 = \$69 [7:0];
+  assign mm_0 = \$78 [7:0];
+  assign mm_1 = \$87 [7:0];
+  assign mm_2 = \$96 [7:0];
+  assign mm_3 = \$105 [7:0];
+  assign mm_4 = \$114 [7:0];
+  assign mm_5 = \$123 [7:0];
+  assign mm_6 = \$132 [7:0];
+  assign mm_7 = \$141 [7:0];
+  assign mm_8 = \$150 [7:0];
+  assign mm_9 = \$159 [7:0];
+  assign mm_10 = \$168 [7:0];
+  assign mm_11 = \$177 [7:0];
+  assign mm_12 = \$186 [7:0];
+  assign mm_13 = \$195 [7:0];
+  assign mm_14 = \$204 [7:0];
+  assign mm_15 = \$213 [7:0];
+  assign \clk$178  = clk;
+  assign \$4 [1] = mp[5];
+  assign \$4 [0] = \$auto$rtlil.cc:2739:Not$2 ;
+  assign matvec = \$7 ;
+  assign bank_op = \$214 ;
+endmodule
@@ -6,40 +6,231 @@ from amaranth.lib.crc import Algorithm
 from amaranth.lib import wiring
 from amaranth.lib.wiring import In, Out
 from enum import Enum, IntEnum
+from functools import lru_cache
+from isa import *
+import gencache
+import isa
+import numpy as np
 import tabulate
 
-def int2list(i, width=2):
-    res= [int(x) for x in bin(i)[2:]]
-    while len(res)<width:
-        res.insert(0,0)
-    return res
-
-def list2int(l):
-    return int("".join(str(x) for x in l), 2)
-
-class op(IntEnum):
-    # CLEARMP = 1 # reset mp to 0
-    NOOP = 0 # do nothing
-    SETMP = 1 # set mp to X
-    WRITE = 2 # write to memory at mp, increment mp
-    READ = 3 # read from memory at mp, increment mp
-    MMUL = 4 # element-wise multiply of matrix at A and B, store in C
-    DOT = 5 # dot product of matrix at A and B, store in C
-    MATMUL = 6 # matrix multiplication of matrix at A and B, store in C
-    SUM = 7 # sum of matrix at A, store in C
-    # ADD = 9 # add matrix at A to scalar, store in C
-    # SUB = 10 # subtract matrix at A from scalar, store in C
-    # PROD = 12 # product of matrix at A, store in C
-    # MAX = 13 # max of matrix at A, store in C
-    # MIN = 14 # min of matrix at A, store in C
+# Configuration: n x n matrices, `banks` banks of n*n words of acc_width bits.
+# The uio_in operand of a compute op holds the A, B and C bank fields from the top bit down.
+# Words wider than 8 bits come out one byte at a time, READ/SUM pick the byte with the low bits
+# of uio_in. READ2 has no byte select (the chip drives uio inside a burst), it reads the low
+# bytes. The default is the 4x4, 4 bank, 8 bit tpu of info.yaml.
+# matmul_cycles picks the MATMUL engine at generation time: 1 is the n**3 multiplier array,
+# n computes one row of C per cycle with n*n MACs, n*n one element per cycle with n MACs.
+# A multi-cycle MATMUL latches its banks in the cycle it is issued and writes a row/element in
+# each of the next matmul_cycles cycles, the chip drives busy on uio[0] until the last one is written. Instructions
+# issued meanwhile run as usual, so they must not need uio_in[0] (compute on other banks,
+# READ/READ2 of other banks, NOOP), must not write A, B or C, and C is only complete once busy
+# drops. A MATMUL/MATMUL_ACC issued while busy restarts the engine.
+
+def byte_bits(acc_width):
+    return (-(-acc_width // 8) - 1).bit_length()
+
+def word_dtype(acc_width):
+    # numpy dtype holding a memory word
+    return np.dtype(f"uint{8 << byte_bits(acc_width)}")
+
+def check_config(n, banks, acc_width, matmul_cycles=1):
+    assert matmul_cycles in (1, n, n*n), f"a {n}x{n} MATMUL takes 1, {n} or {n*n} cycles, not {matmul_cycles}"
+    assert n >= 1 and banks in (2, 4), f"unsupported {n}x{n} tiles with {banks} banks"
+    assert banks*n*n <= 256, f"{banks} banks of {n}x{n} don't fit in the 8 bit mp"
+    assert acc_width >= 8 and 3*bank_bits(banks) + byte_bits(acc_width) <= 8, \
+        f"bank fields and byte select don't fit in uio_in with {acc_width} bit words"
+
+@lru_cache
+def bank_tables(n=4, banks=4):
+    # base address of bank A, B and C for every uio_in byte
+    w = bank_bits(banks)
+    return [[((i >> (8 - f*w)) & (banks - 1))*n*n for i in range(256)] for f in (1, 2, 3)]
+
+# Dual issue: with 4 banks of a power of two size, ui_in[7] = 1 runs the compute op
+# DUAL_OPS[ui_in[6:4]] in the same cycle as a host op (NOOP, SETMP, WRITE, READ, READ2, WRITE2,
+# FILL) in ui_in[3:0], so a tile streams in or out while another one is multiplied. uio_in carries the
+# host op's data, the compute op's banks follow from the bank mp points into: the banks are
+# paired {0, 1} {2, 3}, B is the other bank of mp's pair, A and C are the first and second bank
+# of the other pair (dual_banks). Host data ping-pongs between the banks of a pair while A and C
+# stay put. A compute op in the lower nibble is dropped, DOT/SUM are never dual issued because
+# they use mp/uo_out themselves. The upper nibble has its own op codes so that the only decoding
+# in front of the bank muxes is ui_in[7] & ~(ui_in[6] & ui_in[5]).
+# pyTpu(strict=True) asserts these rules (check):
+# - the host op must not write A, B or C, nor read C (READ2/WRITE2 on the last word of a bank)
+# - while the MATMUL engine is busy no op may need uio_in[0] (SETMP, WRITE, WRITE2, FILL, BANK,
+#   a byte selected READ/SUM), write its A, B or C, read its C, or issue another MATMUL
+BANK_A, BANK_B, BANK_C = bank_tables()
+
+def dual_banks(mp, n=4, banks=4):
+    # base address of bank A, B and C of the op in the upper nibble, mp's bank is the two bits
+    # of mp above the word offset (so mp past the end wraps around)
+    k = (mp // (n*n)) & 3
+    return [(~k & 2)*n*n, (k ^ 1)*n*n, (~k & 2 | 1)*n*n]
+
+def dual_issue(n, banks):
+    # whether the upper nibble is decoded
+    return banks == 4 and n*n & (n*n - 1) == 0
+
+def op_accesses(current_op, index_A, index_B, index_C, mp, n=4, banks=4, arg=0):
+    # (addresses read, addresses written) by one op on the banks at index_A/B/C, following tpu.elaborate
+    a, b, c = index_A, index_B, index_C
+    size, end = n*n, banks*n*n
+    match current_op:
+        case op.FILL:
+            return [], list(range(mp - mp % size, mp - mp % size + size)) if mp < end else []
+        case op.BANK:
+            match arg & 3:
+                case bankfn.COPY | bankfn.TRANSPOSE:
+                    return list(range(a, a+size)), list(range(c, c+size))
+                case bankfn.ZERO:
+                    return [], list(range(c, c+size))
+                case _:
+                    return [], []
+        case op.WRITE:
+            return [], [mp] if mp < end else []
+        case op.READ:
+            return [mp] if mp < end else [], []
+        case op.WRITE2:
+            return [], [address for address in (mp, mp+1) if address < end]
+        case op.READ2:
+            return [address for address in (mp, mp+1) if address < end], []
+        case op.MMUL | op.MATMUL:
+            return list(range(a, a+size)) + list(range(b, b+size)), list(range(c, c+size))
+        case op.MMUL_ACC | op.MATMUL_ACC:
+            return list(range(a, a+size)) + list(range(b, b+size)) + list(range(c, c+size)), list(range(c, c+size))
+        case op.DOT:
+            return list(range(a, a+n)) + list(range(b, b+n)), [c]
+        case op.MATVEC:
+            return list(range(a, a+size)) + list(range(b, b+n)), list(range(c, c+n))
+        case op.ROWDOT:
+            return list(range(a, a+size)) + list(range(b, b+size)), list(range(c, c+n))
+        case op.SUM:
+            return list(range(a, a+size)), []
+    return [], []
+
+UIO_DATA_OPS = frozenset(int(o) for o in (op.SETMP, op.WRITE, op.WRITE2, op.FILL))
+UIO_BANK_OPS = frozenset(int(o) for o in COMPUTE_OPS)
+
+def uses_uio(current_op, dual=op.NOOP, select=0):
+    # whether an instruction reads uio_in: host data, the bank fields of a compute op in
+    # ui_in[3:0] (dropped next to a dual issued op, whose banks follow from mp) or a byte
+    # select, select is the number of byte select bits of the configuration
+    current_op = int(current_op) # decode table entries are numpy ints, slow to compare with op
+    if current_op in UIO_DATA_OPS:
+        return True
+    if current_op in UIO_BANK_OPS:
+        return int(dual) == op.NOOP
+    return bool(select) and current_op == op.READ
 
 class pyTpu:
-    def __init__(self) -> None:
-        self.memory = [0]*(4*16)
+    # strict: assert the dual issue and MATMUL engine rules (check) on every instruction,
+    # without it pyTpu does whatever tpu.elaborate does with a program that breaks them.
+    # ops: the build profile (op_set), strict asserts every op executed is in it, otherwise
+    # the others are NOOPs like on a chip generated without them
+    def __init__(self, n=4, banks=4, acc_width=8, matmul_cycles=1, strict=True, ops=None) -> None:
+        check_config(n, banks, acc_width, matmul_cycles)
+        self.ops = op_set(ops)
+        self.n = n
+        self.banks = banks
+        self.acc_width = acc_width
+        self.matmul_cycles = matmul_cycles
+        self.strict = strict
+        self.hooks = [] # (pre, post) instrumentation callbacks, see add_hook
+        self.engine = None # [A, B, C, accumulate, step] of the multi-cycle MATMUL in flight
+        self.size = banks*n*n
+        self.mask = (1 << acc_width) - 1
+        self.select = (1 << byte_bits(acc_width)) - 1 # uio_in bits picking the output byte
+        self.bank_A, self.bank_B, self.bank_C = bank_tables(n, banks)
+        self.memory = [0]*self.size
         self.mp = 0
         self.input = [0]*8 # 4 bits for operation
         self.input2 = [0]*8 # memory address or scalar
         self.output = 0
+        self.uio_out = 0 # second byte of READ2
+        self.uio_oe = 0 # 0xff for the cycle after a READ2, the host must not drive uio then
+                        # 0x01 while a multi-cycle MATMUL is busy
+
+    @property
+    def busy(self):
+        return self.engine is not None
+
+    def engine_step(self):
+        # the (address, value) writes of the next row or element of the MATMUL in flight,
+        # computed from the memory before the clock edge like everything else
+        index_A, index_B, index_C, accumulate, step = self.engine
+        n, per = self.n, self.n*self.n // self.matmul_cycles
+        writes = []
+        for o in range(step*per, (step + 1)*per):
+            i, j = divmod(o, n)
+            result = self.memory[index_C + o] if accumulate else 0
+            for k in range(n):
+                result += self.memory[index_A + i*n + k] * self.memory[index_B + k*n + j]
+            writes.append((index_C + o, result & self.mask))
+        self.engine[4] += 1
+        if self.engine[4] == self.matmul_cycles:
+            self.engine = None
+        return writes
+
+    # Backdoor: whole banks and the full state, without spending instructions on them.
+    # A snapshot is {"config", "memory", "mp", "output", "uio_out", "uio_oe", "engine"}, engine is
+    # None or {"a", "b", "c": bank, "accumulate", "step": next step}, the same dict restores
+    # into backdoor.SimBackdoor and backdoor.CocotbBackdoor
+    @property
+    def config(self):
+        return (self.n, self.banks, self.acc_width, self.matmul_cycles)
+
+    def load_bank(self, bank, tile):
+        # tile: n x n (or n*n) words
+        size = self.n*self.n
+        assert 0 <= bank < self.banks, f"no bank {bank}"
+        self.memory[bank*size:(bank + 1)*size] = [int(v) & self.mask for v in np.asarray(tile).reshape(size).tolist()]
+
+    def dump_bank(self, bank):
+        size = self.n*self.n
+        assert 0 <= bank < self.banks, f"no bank {bank}"
+        return np.array(self.memory[bank*size:(bank + 1)*size], dtype=word_dtype(self.acc_width)).reshape(self.n, self.n)
+
+    def snapshot(self):
+        engine = None
+        if self.engine:
+            A, B, C, accumulate, step = self.engine
+            size = self.n*self.n
+            engine = {"a": A // size, "b": B // size, "c": C // size, "accumulate": accumulate, "step": step}
+        return {"config": self.config, "memory": np.array(self.memory, dtype=word_dtype(self.acc_width)),
+                "mp": self.mp, "output": self.output, "uio_out": self.uio_out, "uio_oe": self.uio_oe,
+                "engine": engine}
+
+    def restore(self, state):
+        assert tuple(state["config"]) == self.config, f"snapshot of {tuple(state['config'])} on {self.config}"
+        self.memory = [int(v) for v in np.asarray(state["memory"]).tolist()]
+        self.mp, self.output, self.uio_out, self.uio_oe = (int(state[k]) for k in ("mp", "output", "uio_out", "uio_oe"))
+        engine, size = state["engine"], self.n*self.n
+        self.engine = [engine["a"]*size, engine["b"]*size, engine["c"]*size, bool(engine["accumulate"]),
+                       engine["step"]] if engine else None
+
+    # Instrumentation: pre(tpu_, current_op, arg, dual) is called before every instruction and
+    # post(...) after it, with the op and dual op decoded from ui_in (instrument.Counters).
+    # Nothing checks for hooks per instruction: the first add_hook shadows execute with
+    # hooked_execute on this instance only, and run stops inlining SETMP/WRITE/READ so every
+    # instruction reaches the hooks
+    def add_hook(self, pre=None, post=None):
+        self.hooks.append((pre, post))
+        self.execute = self.hooked_execute
+        return self.hooks[-1]
+
+    def remove_hook(self, hook):
+        self.hooks.remove(hook)
+        if not self.hooks:
+            del self.execute
+
+    def hooked_execute(self, current_op, arg, dual=op.NOOP):
+        for pre, _ in self.hooks:
+            if pre:
+                pre(self, current_op, arg, dual)
+        type(self).execute(self, current_op, arg, dual)
+        for _, post in self.hooks:
+            if post:
+                post(self, current_op, arg, dual)
 
     def __repr__(self) -> str:
         headers = ["adress start", "adress stop", "Value"]
@@ -56,56 +247,359 @@ class pyTpu:
 
     def step(self):
         # handle input
-        current_op = list2int(self.input[0:4]) 
+        ui_in = list2int(self.input)
         # convert binary representation to enum
-        current_op = op(current_op)
+        self.execute(op(OP_TABLE[ui_in]), list2int(self.input2), op(DUAL_TABLE[ui_in]))
+
+    def check(self, current_op, arg, dual, index_A, index_B, index_C):
+        # the rules in the dual issue and matmul_cycles comments, on the state before the clock edge
+        n, banks, mp = self.n, self.banks, self.mp
+        compute_op = dual if dual != op.NOOP else current_op
+        host_reads, host_writes = op_accesses(current_op, 0, 0, 0, mp, n, banks) if dual != op.NOOP else ([], [])
+        reads, writes = op_accesses(compute_op, index_A, index_B, index_C, mp, n, banks, arg)
+        if dual != op.NOOP:
+            assert not set(host_writes) & set(reads + writes) and not set(host_reads) & set(writes), \
+                f"{current_op.name} at mp {mp} touches the banks of the dual issued {dual.name}"
+        if self.uio_oe == 0xff:
+            assert not uses_uio(current_op, dual, self.select), \
+                f"{current_op.name} needs uio_in in the cycle after a READ2, when the chip drives uio"
+        if self.engine:
+            A, B, C, _, _ = self.engine
+            engine_C = set(range(C, C + n*n))
+            engine_banks = set(range(A, A + n*n)) | set(range(B, B + n*n)) | engine_C
+            assert current_op not in (op.SETMP, op.WRITE, op.WRITE2, op.FILL, op.BANK) and \
+                not (self.select and current_op in (op.READ, op.SUM)), \
+                f"{current_op.name} needs uio_in[0] while the MATMUL engine drives busy on it"
+            assert compute_op not in (op.MATMUL, op.MATMUL_ACC), f"{compute_op.name} while the MATMUL engine is busy"
+            assert not set(host_writes + writes) & engine_banks and not set(host_reads + reads) & engine_C, \
+                f"{compute_op.name if compute_op != op.NOOP else current_op.name} touches the banks of the busy MATMUL engine"
+
+    def execute(self, current_op, arg, dual=op.NOOP):
+        # dual: the op in ui_in[4:8] (DUAL_TABLE), it replaces a compute op in the lower nibble
+        if not dual_issue(self.n, self.banks):
+            dual = op.NOOP
+        if dual != op.NOOP:
+            current_op = op.NOOP if current_op in COMPUTE_OPS else current_op
+            index_A, index_B, index_C = dual_banks(self.mp, self.n, self.banks)
+        else:
+            index_A = self.bank_A[arg]
+            index_B = self.bank_B[arg]
+            index_C = self.bank_C[arg]
+        if self.strict:
+            assert current_op in self.ops and dual in self.ops, \
+                f"{(current_op if current_op not in self.ops else dual).name} is not in this build"
+            self.check(current_op, arg, dual, index_A, index_B, index_C)
+        current_op = current_op if current_op in self.ops else op.NOOP
+        dual = dual if dual in self.ops else op.NOOP
+        # results are acc_width bits, mp and output are 8 bits wide like the registers in tpu.elaborate
+        engine_writes = []
+        if self.matmul_cycles > 1 and {op.MATMUL, op.MATMUL_ACC} & self.ops: # a build without MATMUL has no engine
+            if self.engine:
+                engine_writes = self.engine_step()
+            if current_op in (op.MATMUL, op.MATMUL_ACC) or dual in (op.MATMUL, op.MATMUL_ACC):
+                # the engine starts computing in the next cycle, this one latches the banks
+                accumulate = op.MATMUL_ACC in (current_op, dual)
+                self.engine = [index_A, index_B, index_C, accumulate, 0]
+                current_op = op.NOOP if current_op in COMPUTE_OPS else current_op
+                dual = op.NOOP
+            if current_op != op.READ2:
+                self.uio_out = int(self.busy)
+        self.uio_oe = 0xff if current_op == op.READ2 else int(self.busy)
+        if dual == op.NOOP:
+            self.execute_op(current_op, arg, index_A, index_B, index_C)
+        else:
+            # both ops read the memory before the clock edge, the compute op wins where they both write
+            before = self.memory[:]
+            self.execute_op(current_op, arg, index_A, index_B, index_C)
+            memory, self.memory = self.memory, before
+            self.execute_op(dual, arg, index_A, index_B, index_C)
+            for address in op_accesses(dual, index_A, index_B, index_C, self.mp, self.n, self.banks)[1]:
+                memory[address] = self.memory[address]
+            self.memory = memory
+        # the engine writes last, like its statements after the op Switches in tpu.elaborate
+        for address, value in engine_writes:
+            self.memory[address] = value
+
+    def execute_op(self, current_op, arg, index_A, index_B, index_C):
+        n, size, mask = self.n, self.n*self.n, self.mask
+        shift = 8*(arg & self.select)
         match current_op:
             case op.SETMP:
-                self.mp = list2int(self.input2)
+                self.mp = arg
             case op.WRITE:
-                self.memory[self.mp] = list2int(self.input2)
-                self.mp += 1
+                if self.mp < self.size: # out of range writes are dropped
+                    self.memory[self.mp] = arg
+                self.mp = (self.mp + 1) & 0xff
             case op.READ:
-                self.output = self.memory[self.mp]
-                self.mp += 1
+                self.output = (self.memory[self.mp] >> shift) & 0xff if self.mp < self.size else 0
+                self.mp = (self.mp + 1) & 0xff
+            case op.READ2:
+                # mp+1 is not wrapped, at mp = 255 it is out of range like at the end of memory,
+                # no byte select, the low bytes
+                self.output = self.memory[self.mp] & 0xff if self.mp < self.size else 0
+                self.uio_out = self.memory[self.mp + 1] & 0xff if self.mp + 1 < self.size else 0
+                self.mp = (self.mp + 2) & 0xff
+            case op.WRITE2:
+                if self.mp < self.size:
+                    self.memory[self.mp] = arg & 0x0f
+                if self.mp + 1 < self.size:
+                    self.memory[self.mp + 1] = arg >> 4
+                self.mp = (self.mp + 2) & 0xff
             case op.MMUL:
-                index_A = list2int(self.input2[0:2])*16
-                index_B = list2int(self.input2[2:4])*16
-                index_C = list2int(self.input2[4:6])*16
-                for i in range(4):
-                    for j in range(4):
-                        self.memory[index_C + i*4 + j] = self.memory[index_A + i*4 + j] * self.memory[index_B + i*4 + j]
-                
+                # operands are read before C is written, C may alias A or B like in tpu.elaborate
+                A = self.memory[index_A:index_A+size]
+                B = self.memory[index_B:index_B+size]
+                for i in range(size):
+                    self.memory[index_C + i] = (A[i] * B[i]) & mask
+
             case op.DOT:
-                index_A = list2int(self.input2[0:2])*16
-                index_B = list2int(self.input2[2:4])*16
-                index_C = list2int(self.input2[4:6])*16
-                self.output = 0
-                for i in range(4):
-                    self.output += self.memory[index_A + i] * self.memory[index_B + i]
-                self.memory[index_C] = self.output
-                self.mp += 1
+                result = 0
+                for i in range(n):
+                    result += self.memory[index_A + i] * self.memory[index_B + i]
+                self.memory[index_C] = result & mask
+                self.mp = (self.mp + 1) & 0xff
             case op.MATMUL:
-                index_A = list2int(self.input2[0:2])*16
-                index_B = list2int(self.input2[2:4])*16
-                index_C = list2int(self.input2[4:6])*16
-                for i in range(4):
-                    for j in range(4):
-                        self.output = 0
-                        for k in range(4):
-                            self.output += self.memory[index_A + i*4 + k] * self.memory[index_B + k*4 + j]
-                        self.memory[index_C + i*4 + j] = self.output
-                self.mp += 1
+                A = self.memory[index_A:index_A+size]
+                B = self.memory[index_B:index_B+size]
+                for i in range(n):
+                    for j in range(n):
+                        result = 0
+                        for k in range(n):
+                            result += A[i*n + k] * B[k*n + j]
+                        self.memory[index_C + i*n + j] = result & mask
+            case op.MATMUL_ACC:
+                A = self.memory[index_A:index_A+size]
+                B = self.memory[index_B:index_B+size]
+                C = self.memory[index_C:index_C+size]
+                for i in range(n):
+                    for j in range(n):
+                        result = C[i*n + j]
+                        for k in range(n):
+                            result += A[i*n + k] * B[k*n + j]
+                        self.memory[index_C + i*n + j] = result & mask
+            case op.MMUL_ACC:
+                A = self.memory[index_A:index_A+size]
+                B = self.memory[index_B:index_B+size]
+                C = self.memory[index_C:index_C+size]
+                for i in range(size):
+                    self.memory[index_C + i] = (C[i] + A[i] * B[i]) & mask
+            case op.MATVEC:
+                A = self.memory[index_A:index_A+size]
+                B = self.memory[index_B:index_B+n]
+                for i in range(n):
+                    self.memory[index_C + i] = sum(A[i*n + k] * B[k] for k in range(n)) & mask
+            case op.ROWDOT:
+                A = self.memory[index_A:index_A+size]
+                B = self.memory[index_B:index_B+size]
+                for i in range(n):
+                    self.memory[index_C + i] = sum(A[i*n + k] * B[i*n + k] for k in range(n)) & mask
             case op.SUM:
-                index_A = list2int(self.input2[0:2])*16
-                self.output=0
-                for i in range(16):
-                    self.output+= self.memory[index_A+i]
+                self.output = ((sum(self.memory[index_A:index_A+size]) & mask) >> shift) & 0xff
+            case op.FILL:
+                if self.mp < self.size:
+                    start = self.mp - self.mp % size
+                    self.memory[start:start+size] = [arg]*size
+            case op.BANK:
+                A = self.memory[index_A:index_A+size]
+                match arg & 3:
+                    case bankfn.COPY:
+                        self.memory[index_C:index_C+size] = A
+                    case bankfn.TRANSPOSE:
+                        self.memory[index_C:index_C+size] = [A[j*n + i] for i in range(n) for j in range(n)]
+                    case bankfn.ZERO:
+                        self.memory[index_C:index_C+size] = [0]*size
             case _:
                 pass
 
+    def run(self, program):
+        # program: packed (ui_in, uio_in) byte pairs as bytes or a uint8 array,
+        # returns the output after every READ and SUM, uo_out then uio_out for READ2
+        if isinstance(program, (bytes, bytearray, memoryview)):
+            program = np.frombuffer(program, dtype=np.uint8)
+        program = np.asarray(program, dtype=np.uint8).reshape(-1, 2)
+        ops = OP_TABLE[program[:, 0]].tolist()
+        if len(self.ops) < len(op):
+            enabled = np.isin(OP_TABLE[program[:, 0]], list(self.ops))
+            assert not self.strict or enabled.all(), \
+                f"{op(OP_TABLE[program[np.argmin(enabled), 0]]).name} is not in this build"
+            ops = [o if e else op.NOOP for o, e in zip(ops, enabled.tolist())]
+        # without dual issue the upper nibble is ignored, a SUM with bit 7 set still outputs
+        duals = DUAL_TABLE[program[:, 0]].tolist() if dual_issue(self.n, self.banks) else [op.NOOP]*len(program)
+        args = program[:, 1].tolist()
+        outputs = []
+        memory = self.memory
+        size = self.size
+        # a multi-cycle MATMUL engine steps on every instruction, hooks see every instruction
+        inline = self.matmul_cycles == 1 and not self.hooks
+        # SETMP/WRITE/READ are inlined, everything else (and anything dual issued or right after a
+        # READ2, which check() has to see) goes through execute()
+        for current_op, arg, dual in zip(ops, args, duals):
+            if dual or self.uio_oe:
+                self.execute(op(current_op), arg, op(dual))
+                # a SUM under a dual issued op is dropped
+                if current_op == op.READ or (current_op == op.SUM and not dual):
+                    outputs.append(self.output)
+                elif current_op == op.READ2:
+                    outputs.append(self.output)
+                    outputs.append(self.uio_out)
+                continue
+            if inline and current_op == op.WRITE:
+                if self.mp < size:
+                    memory[self.mp] = arg
+                self.mp = (self.mp + 1) & 0xff
+            elif inline and current_op == op.READ:
+                self.output = (memory[self.mp] >> 8*(arg & self.select)) & 0xff if self.mp < size else 0
+                self.mp = (self.mp + 1) & 0xff
+                outputs.append(self.output)
+            elif inline and current_op == op.SETMP:
+                self.mp = arg
+            else:
+                self.execute(op(current_op), arg)
+                if current_op in (op.READ, op.SUM):
+                    outputs.append(self.output)
+                elif current_op == op.READ2:
+                    outputs.append(self.output)
+                    outputs.append(self.uio_out)
+                continue
+            self.uio_oe = 0
+        return np.array(outputs, dtype=np.uint8)
+
+class npTpu:
+    # batched numpy model of n independent default (4x4, 4 banks, 8 bit) tpus, bit-exact with tpu.elaborate:
+    # 8-bit results, 8-bit mp, out of range mp reads 0 and drops writes. Dual issue isn't modelled,
+    # ui_in[4:8] is ignored
+    def __init__(self, n=1) -> None:
+        self.n = n
+        self.memory = np.zeros((n, 4, 4, 4), dtype=np.uint8) # instance, bank, row, col
+        self.mp = np.zeros(n, dtype=np.uint8)
+        self.output = np.zeros(n, dtype=np.uint8)
+        self.uio_out = np.zeros(n, dtype=np.uint8)
+        self.uio_oe = np.zeros(n, dtype=np.uint8)
+
+    def step(self, ui_in, uio_in):
+        # ui_in, uio_in: one byte per instance (or a scalar broadcast to all of them)
+        ui_in = np.broadcast_to(np.asarray(ui_in, dtype=np.uint8), (self.n,))
+        uio_in = np.broadcast_to(np.asarray(uio_in, dtype=np.uint8), (self.n,))
+        current_op = ui_in & 0x0f
+        index_A = uio_in >> 6
+        index_B = (uio_in >> 4) & 3
+        index_C = (uio_in >> 2) & 3
+        flat = self.memory.reshape(self.n, 64)
+        # every case reads the state before the clock edge, like the sync domain
+        mp = self.mp.copy()
+        output = self.output.copy()
+
+        sel = np.flatnonzero(current_op == op.SETMP)
+        mp[sel] = uio_in[sel]
+
+        sel = np.flatnonzero(current_op == op.WRITE)
+        inside = sel[self.mp[sel] < 64]
+        flat[inside, self.mp[inside]] = uio_in[inside]
+        mp[sel] += 1
+
+        sel = np.flatnonzero(current_op == op.READ)
+        inside = self.mp[sel] < 64
+        output[sel] = np.where(inside, flat[sel, np.minimum(self.mp[sel], 63)], 0)
+        mp[sel] += 1
+
+        # the second address of READ2/WRITE2 is mp+1 without wrapping
+        sel = np.flatnonzero(current_op == op.READ2)
+        first = self.mp[sel].astype(np.int16)
+        output[sel] = np.where(first < 64, flat[sel, np.minimum(first, 63)], 0)
+        self.uio_out[sel] = np.where(first + 1 < 64, flat[sel, np.minimum(first + 1, 63)], 0)
+        mp[sel] += 2
+        self.uio_oe = np.where(current_op == op.READ2, 0xff, 0).astype(np.uint8)
+
+        sel = np.flatnonzero(current_op == op.WRITE2)
+        first = self.mp[sel].astype(np.int16)
+        flat[sel[first < 64], first[first < 64]] = uio_in[sel[first < 64]] & 0x0f
+        flat[sel[first + 1 < 64], first[first + 1 < 64] + 1] = uio_in[sel[first + 1 < 64]] >> 4
+        mp[sel] += 2
+
+        sel = np.flatnonzero(current_op == op.MMUL)
+        if sel.size:
+            A = self.memory[sel, index_A[sel]]
+            B = self.memory[sel, index_B[sel]]
+            self.memory[sel, index_C[sel]] = A * B
+
+        sel = np.flatnonzero(current_op == op.DOT)
+        if sel.size:
+            A = self.memory[sel, index_A[sel], 0]
+            B = self.memory[sel, index_B[sel], 0]
+            self.memory[sel, index_C[sel], 0, 0] = np.einsum("ik,ik->i", A, B)
+            mp[sel] += 1
+
+        sel = np.flatnonzero(current_op == op.MATMUL)
+        if sel.size:
+            A = self.memory[sel, index_A[sel]]
+            B = self.memory[sel, index_B[sel]]
+            self.memory[sel, index_C[sel]] = np.matmul(A, B)
+
+        sel = np.flatnonzero(current_op == op.MATMUL_ACC)
+        if sel.size:
+            A = self.memory[sel, index_A[sel]]
+            B = self.memory[sel, index_B[sel]]
+            self.memory[sel, index_C[sel]] += np.matmul(A, B)
+
+        sel = np.flatnonzero(current_op == op.MMUL_ACC)
+        if sel.size:
+            A = self.memory[sel, index_A[sel]]
+            B = self.memory[sel, index_B[sel]]
+            self.memory[sel, index_C[sel]] += A * B
+
+        sel = np.flatnonzero(current_op == op.MATVEC)
+        if sel.size:
+            A = self.memory[sel, index_A[sel]]
+            B = self.memory[sel, index_B[sel], 0]
+            self.memory[sel, index_C[sel], 0] = np.einsum("nik,nk->ni", A, B)
+
+        sel = np.flatnonzero(current_op == op.ROWDOT)
+        if sel.size:
+            A = self.memory[sel, index_A[sel]]
+            B = self.memory[sel, index_B[sel]]
+            self.memory[sel, index_C[sel], 0] = np.einsum("nik,nik->ni", A, B)
+
+        sel = np.flatnonzero(current_op == op.SUM)
+        if sel.size:
+            output[sel] = self.memory[sel, index_A[sel]].sum(axis=(1, 2), dtype=np.uint8)
+
+        sel = np.flatnonzero(current_op == op.FILL)
+        sel = sel[self.mp[sel] < 64]
+        self.memory[sel, self.mp[sel] >> 4] = uio_in[sel, None, None]
+
+        sel = np.flatnonzero(current_op == op.BANK)
+        if sel.size:
+            A = self.memory[sel, index_A[sel]]
+            function = uio_in[sel] & 3
+            C = self.memory[sel, index_C[sel]]
+            C = np.where((function == bankfn.COPY)[:, None, None], A, C)
+            C = np.where((function == bankfn.TRANSPOSE)[:, None, None], A.transpose(0, 2, 1), C)
+            C = np.where((function == bankfn.ZERO)[:, None, None], 0, C)
+            self.memory[sel, index_C[sel]] = C
+
+        self.mp = mp
+        self.output = output
+
+    def run(self, ui_in, uio_in):
+        # ui_in, uio_in: (steps, n) arrays, returns the output of every instance after every step
+        ui_in = np.asarray(ui_in, dtype=np.uint8)
+        uio_in = np.asarray(uio_in, dtype=np.uint8)
+        outputs = np.zeros((len(ui_in), self.n), dtype=np.uint8)
+        for t in range(len(ui_in)):
+            self.step(ui_in[t], uio_in[t])
+            outputs[t] = self.output
+        return outputs
+
 class tpu(wiring.Component):
-    def __init__(self) -> None:
+    # ops: build profile (op_set, PROFILES), the datapath of every other op is left out and
+    # its opcode does nothing, like an unused one
+    def __init__(self, n=4, banks=4, acc_width=8, matmul_cycles=1, ops=None) -> None:
+        check_config(n, banks, acc_width, matmul_cycles)
+        self.ops = op_set(ops)
+        self.n = n
+        self.banks = banks
+        self.acc_width = acc_width
+        self.matmul_cycles = matmul_cycles
         
         self.input = Signal(unsigned(8), name="ui_in")
         self.input2 = Signal(unsigned(8), name="uio_in")
@@ -117,65 +611,250 @@ class tpu(wiring.Component):
         self.clk = Signal()
         self.rst_n = Signal()
 
-        self.memory = Array(Signal(unsigned(8), name=f"m_{i}") for i in range(4*16))
+        self.memory = Array(Signal(unsigned(acc_width), name=f"m_{i}") for i in range(banks*n*n))
         self.mp = Signal(unsigned(8))
-        
-        self.index_A = Signal(unsigned(8))
-        self.index_B = Signal(unsigned(8))
-        self.index_C = Signal(unsigned(8))
 
-    
+        # compute ops only ever address whole banks, so every word offset inside a bank is a
+        # lane across the banks and an operand word is a banks:1 mux on the bank select
+        self.lanes = [Array(self.memory[bank*n*n + offset] for bank in range(banks)) for offset in range(n*n)]
+        self.sel_A = Signal(bank_bits(banks))
+        self.sel_B = Signal(bank_bits(banks))
+        self.sel_C = Signal(bank_bits(banks))
+        self.A = [Signal(unsigned(acc_width), name=f"a_{i}") for i in range(n*n)]
+        self.B = [Signal(unsigned(acc_width), name=f"b_{i}") for i in range(n*n)]
+        self.C = [Signal(unsigned(acc_width), name=f"c_{i}") for i in range(n*n)]
+
+        # op of the compute datapath, the lower nibble or a dual issued upper nibble
+        self.compute_op = Signal(4)
+        self.dual = Signal()
+
+        # multi-cycle MATMUL engine state
+        self.busy = Signal()
+        self.step = Signal(range(matmul_cycles))
+        self.engine_sel = Signal(3*bank_bits(banks)) # A, B, C fields of the MATMUL in flight
+        self.engine_acc = Signal()
+
+    def decoded(self, *ops):
+        # compute_op is one of the enabled ops among ops, constant 0 when none is enabled
+        return Cat(self.compute_op == o.value for o in ops if o in self.ops).any()
+
+    def byte(self, word):
+        # the byte of a word picked by the low bits of uio_in
+        select = byte_bits(self.acc_width)
+        if not select:
+            return word[0:8]
+        padded = Cat(word, Const(0, 8*(1 << select) - len(word)))
+        return padded.word_select(self.input2[0:select], 8)
+
     def elaborate(self, platform):
         m = Module()
+        n = self.n
+        w = bank_bits(self.banks)
         
         # tmp = Signal(unsigned(8))
 
-        m.d.comb += self.index_A.eq(self.input2[6:8] * 16)
-        m.d.comb += self.index_B.eq(self.input2[4:6] * 16)
-        m.d.comb += self.index_C.eq(self.input2[2:4] * 16)       
+        if dual_issue(n, self.banks):
+            # the upper nibble op computes on the banks paired with mp's (dual_banks)
+            m.d.comb += self.dual.eq(self.input[7] & ~(self.input[6] & self.input[5]))
+            offset = (n*n - 1).bit_length()
+            k = self.mp[offset:offset+2]
+            m.d.comb += self.sel_A.eq(Mux(self.dual, Cat(0, ~k[1]), self.input2[8-w:8]))
+            m.d.comb += self.sel_B.eq(Mux(self.dual, k ^ 1, self.input2[8-2*w:8-w]))
+            m.d.comb += self.sel_C.eq(Mux(self.dual, Cat(1, ~k[1]), self.input2[8-3*w:8-2*w]))
+        else:
+            m.d.comb += self.sel_A.eq(self.input2[8-w:8])
+            m.d.comb += self.sel_B.eq(self.input2[8-2*w:8-w])
+            m.d.comb += self.sel_C.eq(self.input2[8-3*w:8-2*w])
+        dual_op = Array(Const(o.value, 4) for o in DUAL_OPS + (op.NOOP,)*(8 - len(DUAL_OPS)))[self.input[4:7]]
+        m.d.comb += self.compute_op.eq(Mux(self.dual, dual_op, self.input[0:4]))
+        for i in range(n*n):
+            m.d.comb += self.A[i].eq(self.lanes[i][self.sel_A])
+            m.d.comb += self.B[i].eq(self.lanes[i][self.sel_B])
+            m.d.comb += self.C[i].eq(self.lanes[i][self.sel_C])
+
+        # n*n element-wise products for MMUL/MMUL_ACC/DOT/ROWDOT, and MATVEC with row 0 of B
+        # muxed in under every row of A. The _ACC ops add C inside the same adder tree instead of behind it
+        # Every datapath is only built when one of its ops is in self.ops
+        enabled = lambda *ops: [o.value for o in ops if o in self.ops]
+        matvec = Signal()
+        accumulate = Signal()
+        m.d.comb += matvec.eq(self.decoded(op.MATVEC))
+        m.d.comb += accumulate.eq(self.decoded(op.MATMUL_ACC, op.MMUL_ACC))
+        if enabled(op.MMUL, op.MMUL_ACC, op.DOT, op.MATVEC, op.ROWDOT):
+            products = [Signal(unsigned(self.acc_width), name=f"p_{i}") for i in range(n*n)]
+            for i in range(n*n):
+                b = Mux(matvec, self.B[i % n], self.B[i]) if i >= n and op.MATVEC in self.ops else self.B[i]
+                m.d.comb += products[i].eq(Mux(accumulate, self.C[i], 0) + self.A[i] * b)
+            rows = [sum(products[i*n + k] for k in range(n)) for i in range(n)]
+
+        if self.matmul_cycles == 1 and enabled(op.MATMUL, op.MATMUL_ACC):
+            # n**3 multipliers, every element of C in one cycle
+            matmul = [Signal(unsigned(self.acc_width), name=f"mm_{i}") for i in range(n*n)]
+            for i in range(n):
+                for j in range(n):
+                    temp = Mux(accumulate, self.C[i*n + j], 0)
+                    for k in range(n):
+                        temp += self.A[i*n + k] * self.B[k*n + j]
+                    m.d.comb += matmul[i*n + j].eq(temp)
+
+        # BANK: A, A transposed, 0 or C itself for function 3, written through the MMUL write port
+        bank_op = Signal()
+        m.d.comb += bank_op.eq(self.decoded(op.BANK))
+        if op.BANK in self.ops:
+            moved = [Signal(unsigned(self.acc_width), name=f"bank_{i}") for i in range(n*n)]
+            for i in range(n*n):
+                j = (i % n)*n + i // n
+                transposed = Mux(self.input2[0], self.A[j], self.A[i]) if i != j else self.A[i]
+                m.d.comb += moved[i].eq(Mux(self.input2[1], Mux(self.input2[0], self.C[i], 0), transposed))
+
+        def compute_cases():
+            if enabled(op.MMUL, op.MMUL_ACC, op.BANK):
+                with m.Case(*enabled(op.MMUL, op.MMUL_ACC, op.BANK)):
+                    for i in range(n*n):
+                        if not enabled(op.MMUL, op.MMUL_ACC):
+                            result = moved[i]
+                        elif op.BANK not in self.ops:
+                            result = products[i]
+                        else:
+                            result = Mux(bank_op, moved[i], products[i])
+                        m.d.sync += self.lanes[i][self.sel_C].eq(result)
+            if enabled(op.MATMUL, op.MATMUL_ACC):
+                with m.Case(*enabled(op.MATMUL, op.MATMUL_ACC)):
+                    if self.matmul_cycles == 1:
+                        for i in range(n*n):
+                            m.d.sync += self.lanes[i][self.sel_C].eq(matmul[i])
+            if enabled(op.DOT):
+                with m.Case(op.DOT.value):
+                    m.d.sync += self.lanes[0][self.sel_C].eq(rows[0])
+                    m.d.sync += self.mp.eq(self.mp + 1)
+            if enabled(op.MATVEC):
+                with m.Case(op.MATVEC.value):
+                    for i in range(n):
+                        m.d.sync += self.lanes[i][self.sel_C].eq(rows[i])
+            if enabled(op.ROWDOT):
+                with m.Case(op.ROWDOT.value):
+                    for i in range(n):
+                        m.d.sync += self.lanes[i][self.sel_C].eq(rows[i])
+            if enabled(op.SUM):
+                with m.Case(op.SUM.value):
+                    total = Signal(unsigned(self.acc_width))
+                    m.d.comb += total.eq(sum(self.A))
+                    m.d.sync += self.output.eq(self.byte(total))
 
         # m.d.sync+= self.mp.eq(self.input2*(self.input[0:4]==Const(op.SETMP.value)))
         # m.d.comb += tmp.eq(self.mp)
         with m.Switch(self.input[0:4]):
-            with m.Case(op.SETMP.value):
-                m.d.sync += self.mp.eq(self.input2)
-            with m.Case(op.WRITE.value):
-                m.d.sync += self.memory[self.mp].eq(self.input2)
-                m.d.sync += self.mp.eq(self.mp + 1)
-                # m.d.sync += self.memory[tmp].eq(self.input2)
-                # m.d.sync += self.mp.eq(self.mp + 1)
-            with m.Case(op.READ.value):
-                m.d.sync += self.output.eq(self.memory[self.mp])
-                m.d.sync += self.mp.eq(self.mp + 1)
-                # m.d.sync += self.output.eq(self.memory[tmp])
-                # m.d.sync += self.mp.eq(self.mp + 1)
-            with m.Case(op.MMUL.value):
-                for i in range(4):
-                    for j in range(4):
-                        m.d.sync += self.memory[self.index_C + i*4 + j].eq(self.memory[self.index_A + i*4 + j] * self.memory[self.index_B + i*4 + j])
-            with m.Case(op.MATMUL.value):
-                for i in range(4):
-                    for j in range(4):
-                        temp = 0
-                        for k in range(4):
-                            temp += self.memory[self.index_A + i*4 + k] * self.memory[self.index_B + k*4 + j]
-                        m.d.sync += self.memory[self.index_C + i*4 + j].eq(temp)
-            with m.Case(op.DOT.value):
-                temp = 0
-                for i in range(4):
-                    temp += self.memory[self.index_A + i] * self.memory[self.index_B + i]
-                m.d.sync += self.memory[self.index_C].eq(temp)
-                m.d.sync += self.mp.eq(self.mp + 1)
-            with m.Case(op.SUM.value):
-                temp = 0
-                for i in range(16):
-                    temp += self.memory[self.index_A + i]
-                m.d.sync += self.output.eq(temp)
+            if enabled(op.SETMP):
+                with m.Case(op.SETMP.value):
+                    m.d.sync += self.mp.eq(self.input2)
+            if enabled(op.WRITE):
+                with m.Case(op.WRITE.value):
+                    m.d.sync += self.memory[self.mp].eq(self.input2)
+                    m.d.sync += self.mp.eq(self.mp + 1)
+                    # m.d.sync += self.memory[tmp].eq(self.input2)
+                    # m.d.sync += self.mp.eq(self.mp + 1)
+            if enabled(op.READ):
+                with m.Case(op.READ.value):
+                    m.d.sync += self.output.eq(self.byte(self.memory[self.mp]))
+                    m.d.sync += self.mp.eq(self.mp + 1)
+                    # m.d.sync += self.output.eq(self.memory[tmp])
+                    # m.d.sync += self.mp.eq(self.mp + 1)
+            if enabled(op.READ2):
+                with m.Case(op.READ2.value):
+                    # no byte select, uio_in is what the chip drives in a burst
+                    m.d.sync += self.output.eq(self.memory[self.mp][0:8])
+                    m.d.sync += self.uio_out.eq(self.memory[self.mp + 1][0:8])
+                    m.d.sync += self.mp.eq(self.mp + 2)
+            if enabled(op.WRITE2):
+                with m.Case(op.WRITE2.value):
+                    m.d.sync += self.memory[self.mp].eq(self.input2[0:4])
+                    m.d.sync += self.memory[self.mp + 1].eq(self.input2[4:8])
+                    m.d.sync += self.mp.eq(self.mp + 2)
+            if enabled(op.FILL):
+                with m.Case(op.FILL.value):
+                    # every word of mp's bank, nothing when mp is past the end of memory
+                    for bank in range(self.banks):
+                        if n*n & (n*n - 1) == 0:
+                            hit = self.mp[(n*n - 1).bit_length():] == bank
+                        else:
+                            hit = (self.mp >= bank*n*n) & (self.mp < (bank + 1)*n*n)
+                        with m.If(hit):
+                            for i in range(n*n):
+                                m.d.sync += self.memory[bank*n*n + i].eq(self.input2)
+            if not dual_issue(n, self.banks):
+                # one Switch keeps the memory write muxes one level deep
+                compute_cases()
             with m.Default():
                 pass
+        if dual_issue(n, self.banks):
+            # after the host ops, so a dual issued op wins when both write the same word
+            with m.Switch(self.compute_op):
+                compute_cases()
+
+        busy_next = Const(0)
+        read2 = self.input[0:4] == op.READ2.value if op.READ2 in self.ops else Const(0)
+        if self.matmul_cycles > 1 and enabled(op.MATMUL, op.MATMUL_ACC):
+            # after the op Switches, so the engine wins when both write the same word
+            busy_next = self.elaborate_engine(m)
+            with m.If(~read2):
+                m.d.sync += self.uio_out.eq(busy_next)
+        # the chip only drives uio for the cycle after a READ2, and uio[0] while the MATMUL engine is busy
+        m.d.sync += self.uio_oe.eq(Mux(read2, 0xff, busy_next))
         return m
 
-    def generate(self):
+    def elaborate_engine(self, m):
+        # multi-cycle MATMUL: n*n // matmul_cycles elements of C per step, each an n term MAC.
+        # Issuing the MATMUL only latches its bank fields, the steps run from those registers in
+        # the following cycles, which keeps ui_in/uio_in decoding out of the MAC paths.
+        # Returns busy after the clock edge
+        n, w, cycles = self.n, bank_bits(self.banks), self.matmul_cycles
+        per = n*n // cycles
+        start = Signal()
+        m.d.comb += start.eq(self.decoded(op.MATMUL, op.MATMUL_ACC))
+        sel_A = self.engine_sel[2*w:3*w]
+        sel_B = self.engine_sel[w:2*w]
+        sel_C = self.engine_sel[0:w]
+
+        def pick(values):
+            # the value of the current step, a mux only where it changes from step to step
+            if all(value is values[0] for value in values):
+                return values[0]
+            return Array(values)[self.step]
+
+        A = [self.lanes[i][sel_A] for i in range(n*n)]
+        B = [self.lanes[i][sel_B] for i in range(n*n)]
+        C = [self.lanes[i][sel_C] for i in range(n*n)]
+        results = []
+        for t in range(per):
+            # output t of every step is element s*per + t of C
+            elements = [divmod(s*per + t, n) for s in range(cycles)]
+            temp = Mux(self.engine_acc, pick([C[i*n + j] for i, j in elements]), 0)
+            for k in range(n):
+                temp += pick([A[i*n + k] for i, j in elements]) * pick([B[k*n + j] for i, j in elements])
+            result = Signal(unsigned(self.acc_width), name=f"mac_{t}")
+            m.d.comb += result.eq(temp)
+            results.append(result)
+
+        for s in range(cycles):
+            with m.If(self.busy & (self.step == s)):
+                for t in range(per):
+                    m.d.sync += self.lanes[s*per + t][sel_C].eq(results[t])
+
+        busy_next = Signal()
+        m.d.comb += busy_next.eq(start | (self.busy & (self.step != cycles - 1)))
+        m.d.sync += self.busy.eq(busy_next)
+        with m.If(start):
+            m.d.sync += [
+                self.step.eq(0),
+                self.engine_sel.eq(Cat(self.sel_C, self.sel_B, self.sel_A)),
+                self.engine_acc.eq(self.decoded(op.MATMUL_ACC)),
+            ]
+        with m.Elif(self.busy):
+            m.d.sync += self.step.eq(self.step + 1)
+        return busy_next
+
+    def convert(self, rtl=False):
+        # Verilog (RTLIL with rtl) of the top module, bytes
         m = self.elaborate(None)
          # clock and reset
         cd_sync = ClockDomain("sync")
@@ -184,25 +863,53 @@ class tpu(wiring.Component):
             ClockSignal("sync").eq(self.clk),
             ResetSignal("sync").eq(~self.rst_n),
         ]
-        m.d.comb += [
-            self.uio_out.eq(0xff),
-            self.uio_oe.eq(0x00),
-        ]
+        ports = [self.input, self.output, self.input2, self.uio_out, self.uio_oe, self.ena, self.clk, self.rst_n]
         # convert the module to verilog
-        with open("top_tpu.v", "w") as f:
-            f.write(verilog.convert(m, 
-                                    name="tt_um_COLVERTYETY_top",
-                                    emit_src=False, strip_internal_attrs=True,
-                                    ports=[self.input, self.output, self.input2, self.uio_out, self.uio_oe, self.ena, self.clk, self.rst_n]
-                                    ))
-
-def test():
+        if rtl:
+            return rtlil.convert(m, name="tt_um_COLVERTYETY_top", emit_src=False, ports=ports).encode()
+        return verilog.convert(m, 
+                               name="tt_um_COLVERTYETY_top",
+                               emit_src=False, strip_internal_attrs=True,
+                               ports=ports
+                               ).encode()
+
+    def generate(self, path="top_tpu.v", cache=True):
+        # Verilog, or RTLIL for a .il path, of this design, path is only rewritten when it changes.
+        # The design is already built, so it is always converted, with cache the output also
+        # refreshes its gencache entry for generate_top. Returns True when path was written
+        rtl = path.endswith(".il")
+        text = self.convert(rtl)
+        if cache:
+            gencache.store(design_key((self.n, self.banks, self.acc_width, self.matmul_cycles), self.ops, rtl), text)
+        return gencache.write_if_changed(path, text)
+
+def design_key(config, ops=None, rtl=False):
+    # gencache key of the output of tpu(*config, ops=ops)
+    params = {"config": list(config), "ops": sorted(o.name for o in op_set(ops)), "rtlil": rtl}
+    return gencache.design_key([__file__, isa.__file__], params)
+
+def generate_top(path="top_tpu.v", config=CONFIG, ops=None, cache=True):
+    # tpu(*config, ops=ops).generate(path) through gencache: the output is looked up by the source
+    # of the design and the configuration, and the design is only built on a miss
+    rtl = path.endswith(".il")
+    key = design_key(config, ops, rtl)
+    text = gencache.lookup(key) if cache else None
+    if text is None:
+        text = tpu(*config, ops=ops).convert(rtl)
+        if cache:
+            gencache.store(key, text)
+    return gencache.write_if_changed(path, text)
+
+def test(vcd=None, verbose=False):
+    # vcd: path of a full VCD dump, verbose: tabulate the memory after every instruction
     dut = tpu()
     sim = Simulator(dut)
     sim.add_clock(1e-6)
 
     async def test_bench(ctx):
         def display():
+            if not verbose:
+                return
             headers = ["adress start", "adress stop", "Value"]
             table = []
             prev = int(ctx.get(dut.memory[0]))
@@ -329,7 +1036,10 @@ def test():
         
 
     sim.add_testbench(test_bench)
-    with sim.write_vcd("tpu.vcd"):
+    if vcd:
+        with sim.write_vcd(vcd):
+            sim.run()
+    else:
         sim.run()
 
     return True
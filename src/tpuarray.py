@@ -0,0 +1,319 @@
+from tpu import op, bankfn, pack_banks, pack_bankfn, CONFIG
+from gemm import GemmProgram
+from driver import TpuDriver, PyTpuBackend
+from bisect import bisect_right
+import asyncio
+import itertools
+import numpy as np
+
+# Lazy NumPy-like frontend. TpuArray expressions (a @ b, a * b, a.T, a.sum(), dot(a, b)) only
+# build a graph, evaluate() compiles every array it is asked for into one tile program:
+# - arrays are cut into n x n tiles, 1-D arrays are laid out n words per row
+# - every tile op is one instruction (MATMUL then MATMUL_ACC over k, MMUL, BANK TRANSPOSE, SUM),
+#   its result stays in a bank, so (a*b).sum() is an MMUL and a SUM per tile with no readback
+# - the banks are a cache of tiles evicted with Belady's rule, input tiles are keyed by content
+#   so a resident tile is never loaded twice, constant tiles are one FILL, zero tiles skip their ops
+# - a computed tile evicted while still needed is read back (spilled) and written again when
+#   it is needed (reloaded), the program then runs in batches up to every reload
+# Values are mod 256 like the rest of the host side. Needs 4 banks: A, B and C of a MATMUL_ACC.
+
+class TpuArray:
+    ids = itertools.count()
+
+    def __init__(self, data=None, kind="data", args=(), shape=None) -> None:
+        self.id = next(TpuArray.ids)
+        self.kind = kind # data, matmul, mul, transpose or sum
+        self.args = args
+        self.data = None if data is None else (np.asarray(data) % 256).astype(np.uint8)
+        self.shape = self.data.shape if data is not None else shape
+        assert len(self.shape) <= 2, f"only vectors and matrices, not {self.shape}"
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __matmul__(self, other):
+        other = asarray(other)
+        assert self.ndim == 2 and other.ndim == 2 and self.shape[1] == other.shape[0], \
+            f"can't multiply {self.shape} by {other.shape}"
+        return TpuArray(kind="matmul", args=(self, other), shape=(self.shape[0], other.shape[1]))
+
+    def __mul__(self, other):
+        other = asarray(other)
+        assert self.shape == other.shape, f"element-wise product of {self.shape} and {other.shape}"
+        return TpuArray(kind="mul", args=(self, other), shape=self.shape)
+
+    @property
+    def T(self):
+        if self.ndim < 2:
+            return self
+        if self.data is not None:
+            return TpuArray(self.data.T)
+        return TpuArray(kind="transpose", args=(self,), shape=self.shape[::-1])
+
+    def sum(self):
+        return TpuArray(kind="sum", args=(self,), shape=())
+
+    def numpy(self, backend=None):
+        return evaluate(self, backend=backend)[0]
+
+    def __repr__(self) -> str:
+        return f"TpuArray({self.kind}, shape={self.shape})"
+
+def asarray(x):
+    return x if isinstance(x, TpuArray) else TpuArray(x)
+
+def dot(a, b):
+    # sum of the element-wise product, on chip an MMUL and a SUM per tile
+    return (asarray(a) * asarray(b)).sum()
+
+def matrix_shape(shape, n):
+    # the 2-D layout of an array on chip, n words per row for vectors
+    return shape if len(shape) == 2 else (-(-shape[0] // n), n)
+
+def tile_grid(x, n):
+    # (rows, cols, n, n) zero padded tiles of an array in its matrix_shape
+    rows, cols = matrix_shape(x.shape, n)
+    if x.ndim == 1:
+        x = np.concatenate([x, np.zeros(rows*n - len(x), dtype=np.uint8)]).reshape(rows, n)
+    padded = np.zeros((-(-rows // n)*n, -(-cols // n)*n), dtype=np.uint8)
+    padded[:rows, :cols] = x
+    return padded.reshape(padded.shape[0] // n, n, padded.shape[1] // n, n).swapaxes(1, 2)
+
+def untile(grid, shape, n):
+    # inverse of tile_grid
+    rows, cols = matrix_shape(shape, n)
+    x = grid.swapaxes(1, 2).reshape(grid.shape[0]*n, grid.shape[1]*n)[:rows, :cols]
+    return x if len(shape) == 2 else x.reshape(-1)[:shape[0]]
+
+class Reload:
+    # placeholder for the WRITEs of a spilled tile, filled in once blocks[block] has been read back
+    def __init__(self, bank, key, block) -> None:
+        self.bank = bank
+        self.key = key
+        self.block = block
+
+class ArrayProgram(GemmProgram):
+    # GemmProgram plus the element-wise, transpose and SUM tile ops, FILL for constant tiles and reloads.
+    # blocks: key of every chunk of outputs, n*n bytes for a tile, 1 for the SUM of a tile
+    def __init__(self, n, banks, matmul_cycles) -> None:
+        super().__init__(None, True, n, banks, matmul_cycles)
+
+    def load(self, bank, key, tile):
+        values = tile.flatten()
+        if (values == values[0]).all():
+            self.setmp(bank*self.n*self.n)
+            self.instructions.append((op.FILL, int(values[0])))
+            self.bank[bank] = key
+        else:
+            super().load(bank, key, tile)
+
+    def reload(self, bank, key):
+        # from the last readback of key, an accumulator may have been read back more than once
+        block = len(self.blocks) - 1 - self.blocks[::-1].index(key)
+        self.instructions.append(Reload(bank, key, block))
+        self.mp = None # depends on the data
+        self.bank[bank] = key
+
+    def tile_op(self, name, dst, a, b=0):
+        match name:
+            case "MATMUL" | "MATMUL_ACC":
+                self.matmul(a, b, dst, accumulate=name == "MATMUL_ACC")
+            case "MMUL":
+                self.instructions.append((op.MMUL, pack_banks(a, b, dst, self.banks)))
+            case "TRANSPOSE":
+                self.instructions.append((op.BANK, pack_bankfn(bankfn.TRANSPOSE, a, dst, self.banks)))
+            case "SUM":
+                self.instructions.append((op.SUM, pack_banks(a, banks=self.banks)))
+
+    def expand(self, reload, tile):
+        # the instructions of a reload, from an unknown mp
+        loader = ArrayProgram(self.n, self.banks, self.matmul_cycles)
+        loader.mp = None
+        loader.load(reload.bank, reload.key, tile)
+        return loader.instructions
+
+    async def run(self, driver, known=None):
+        # executes the program in batches that end before every reload of a tile not read back
+        # yet, returns {block key: n*n tile or SUM byte}
+        known = dict(known or {})
+        n = self.n
+        pending, cursor = [], 0
+
+        async def flush():
+            nonlocal pending, cursor
+            outputs = (await driver.run(pending)).tolist()
+            pending = []
+            while outputs:
+                key = self.blocks[cursor]
+                count = 1 if key[0] == "sum" else n*n
+                chunk, outputs = outputs[:count], outputs[count:]
+                known[key] = chunk[0] if key[0] == "sum" else np.array(chunk, dtype=np.uint8).reshape(n, n)
+                cursor += 1
+
+        for item in self.instructions:
+            if isinstance(item, Reload):
+                if cursor <= item.block:
+                    await flush()
+                pending += self.expand(item, known[item.key])
+            else:
+                pending.append(item)
+        await flush()
+        return known
+
+def graph(arrays):
+    # every node needed by arrays, operands first
+    order, seen = [], set()
+
+    def visit(node):
+        if node.id in seen:
+            return
+        seen.add(node.id)
+        for arg in node.args:
+            visit(arg)
+        order.append(node)
+
+    for array in arrays:
+        visit(array)
+    return order
+
+def lower(arrays, n):
+    # (tile ops, tile keys of every node, input tiles by key). A tile op is (name, dst, a, b),
+    # data tiles are keyed ("data", bytes), computed tiles ("tile", node id, i, j) and
+    # the SUM of a tile ("sum", node id, i, j)
+    ops, keys, data = [], {}, {}
+    zero = ("data", bytes(n*n))
+    data[zero] = np.zeros((n, n), dtype=np.uint8)
+    computed = {} # (kind, operand ids) -> node id, a repeated subexpression is computed once
+    for node in graph(arrays):
+        if node.kind != "data" and (node.kind, *(arg.id for arg in node.args)) in computed:
+            keys[node.id] = keys[computed[node.kind, *(arg.id for arg in node.args)]]
+            continue
+        computed[node.kind, *(arg.id for arg in node.args)] = node.id
+        if node.kind == "data":
+            grid = tile_grid(node.data, n)
+            keys[node.id] = [[("data", tile.tobytes()) for tile in row] for row in grid]
+            for row, key_row in zip(grid, keys[node.id]):
+                for tile, key in zip(row, key_row):
+                    data[key] = tile
+            continue
+        a = keys[node.args[0].id]
+        b = keys[node.args[1].id] if len(node.args) > 1 else None
+        match node.kind:
+            case "matmul":
+                grid = [[None]*len(b[0]) for _ in a]
+                for i in range(len(a)):
+                    for j in range(len(b[0])):
+                        key = ("tile", node.id, i, j)
+                        terms = [k for k in range(len(b)) if zero not in (a[i][k], b[k][j])]
+                        for n_term, k in enumerate(terms):
+                            ops.append(("MATMUL_ACC" if n_term else "MATMUL", key, a[i][k], b[k][j]))
+                        grid[i][j] = key if terms else zero
+            case "mul":
+                grid = [[zero if zero in (x, y) else ("tile", node.id, i, j) for j, (x, y) in enumerate(zip(row_a, row_b))]
+                        for i, (row_a, row_b) in enumerate(zip(a, b))]
+                ops += [("MMUL", grid[i][j], a[i][j], b[i][j]) for i in range(len(a)) for j in range(len(a[0]))
+                        if grid[i][j] != zero]
+            case "transpose":
+                grid = [[zero if a[j][i] == zero else ("tile", node.id, i, j) for j in range(len(a))] for i in range(len(a[0]))]
+                ops += [("TRANSPOSE", grid[i][j], a[j][i], None) for i in range(len(a[0])) for j in range(len(a))
+                        if grid[i][j] != zero]
+            case "sum":
+                grid = [[("sum", node.id, i, j) if key != zero else None for j, key in enumerate(row)] for i, row in enumerate(a)]
+                ops += [("SUM", grid[i][j], a[i][j], None) for i in range(len(a)) for j in range(len(a[0]))
+                        if grid[i][j] is not None]
+        keys[node.id] = grid
+    return ops, keys, data
+
+def compile_arrays(arrays, n=4, banks=4, matmul_cycles=1):
+    # (ArrayProgram, tile keys of every node, input tiles) computing every array
+    assert banks > 2, "TpuArray needs a bank for each of A, B and C"
+    ops, keys, data = lower(arrays, n)
+    outputs = {key for array in arrays if array.ndim for row in keys[array.id] for key in row if key[0] == "tile"}
+    uses = {}
+    for t, (name, dst, a, b) in enumerate(ops):
+        for key in (a, b, dst if name == "MATMUL_ACC" else None):
+            if key is not None:
+                uses.setdefault(key, []).append(t)
+    prog = ArrayProgram(n, banks, matmul_cycles)
+    host = set() # computed tiles read back, reloadable
+
+    def next_use(key, t):
+        # first op after t that reads key
+        if key is None: return -1
+        positions = uses.get(key, [])
+        n = bisect_right(positions, t)
+        return positions[n] if n < len(positions) else len(ops)
+
+    def free(key, t):
+        # evicting key costs no readback
+        return key is None or key[0] == "data" or key in host or (key not in outputs and next_use(key, t) == len(ops))
+
+    def victim(t, keep):
+        # empty banks first, then the bank needed furthest in the future, then one that needs no readback
+        candidates = [b for b in range(banks) if b not in keep]
+        bank = max(candidates, key=lambda b: (prog.bank[b] is None, next_use(prog.bank[b], t), free(prog.bank[b], t)))
+        evict(bank, t)
+        return bank
+
+    def evict(bank, t):
+        key = prog.bank[bank]
+        if not free(key, t):
+            prog.readback(bank, key)
+            host.add(key)
+        prog.bank[bank] = None
+
+    def resident(key, t, keep):
+        if key in prog.bank:
+            return prog.bank.index(key)
+        bank = victim(t - 1, keep)
+        if key[0] == "data":
+            prog.load(bank, key, data[key])
+        else:
+            assert key in host, f"{key} was never computed"
+            prog.reload(bank, key)
+        return bank
+
+    for t, (name, dst, a, b) in enumerate(ops):
+        keep = []
+        for key in (dst if name == "MATMUL_ACC" else None, a, b):
+            if key is not None:
+                keep.append(resident(key, t, keep))
+        if name == "SUM":
+            prog.tile_op(name, None, keep[0])
+            prog.blocks.append(dst)
+            continue
+        if name != "MATMUL_ACC":
+            # the result may overwrite an operand, every op reads before the clock edge,
+            # except a multi-cycle MATMUL which reads them while it writes C
+            engine = name == "MATMUL" and matmul_cycles > 1
+            keep = [victim(t, keep if engine else [])] + keep
+        prog.tile_op(name, *keep)
+        prog.bank[keep[0]] = dst
+        host.discard(dst) # an accumulator read back before this MATMUL_ACC is stale
+    t = len(ops)
+    for bank in range(banks):
+        evict(bank, t)
+    if not any(isinstance(item, Reload) for item in prog.instructions):
+        prog.fuse_dual()
+    prog.end_bursts()
+    return prog, keys, data
+
+async def evaluate_async(*arrays, driver):
+    config = driver.config
+    prog, keys, data = compile_arrays(arrays, config[0], config[1], config[3])
+    known = await prog.run(driver, data)
+    results = []
+    for array in arrays:
+        grid = keys[array.id]
+        if not array.ndim:
+            results.append(np.uint8(sum(int(known[key]) for row in grid for key in row if key is not None) % 256))
+        else:
+            results.append(untile(np.array([[known[key] for key in row] for row in grid]), array.shape, config[0]))
+    return results
+
+def evaluate(*arrays, backend=None):
+    # numpy arrays (np.uint8 for sums) of every array, computed by one program on backend
+    # (driver.PyTpuBackend() by default, driver.SimBackend() for the amaranth simulation)
+    driver = TpuDriver(backend or PyTpuBackend())
+    return asyncio.run(evaluate_async(*arrays, driver=driver))
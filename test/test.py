@@ -3,33 +3,16 @@
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import ClockCycles
-from enum import IntEnum
-
-def int2list(i, width=2):
-    res= [int(x) for x in bin(i)[2:]]
-    while len(res)<width:
-        res.insert(0,0)
-    return res
-
-def list2int(l):
-    return int("".join(str(x) for x in l), 2)
-
-class op(IntEnum):
-    # CLEARMP = 1 # reset mp to 0
-    NOOP = 0 # do nothing
-    SETMP = 1 # set mp to X
-    WRITE = 2 # write to memory at mp, increment mp
-    READ = 3 # read from memory at mp, increment mp
-    MMUL = 4 # element-wise multiply of matrix at A and B, store in C
-    DOT = 5 # dot product of matrix at A and B, store in C
-    MATMUL = 6 # matrix multiplication of matrix at A and B, store in C
-    SUM = 7 # sum of matrix at A, store in C
-    # ADD = 9 # add matrix at A to scalar, store in C
-    # SUB = 10 # subtract matrix at A from scalar, store in C
-    # PROD = 12 # product of matrix at A, store in C
-    # MAX = 13 # max of matrix at A, store in C
-    # MIN = 14 # min of matrix at A, store in C
+from cocotb.triggers import ClockCycles, FallingEdge
+import os
+import numpy as np
+from isa import op, encode, assemble, pack_program
+from tpu import pyTpu, CONFIG
+from driver import TpuDriver, CocotbBackend
+from backdoor import CocotbBackdoor
+from scoreboard import shard_args, run_shard
+
+GATES = os.environ.get("GATES") == "yes"
 
 @cocotb.test()
 async def test_WRITE_READ(dut):
@@ -90,6 +73,48 @@ async def test_WRITE_READ(dut):
         await ClockCycles(dut.clk, 1)
         assert dut.uo_out.value == 4 , f"Expected 4, got {dut.uo_out.value} at i={i+48}"
 
+# The compute tests load their operands and check their results through the backdoor
+# (backdoor.CocotbBackdoor) instead of 65 WRITE and 16 READ cycles each, test_WRITE_READ,
+# test_WRITE2_READ2, test_FILL_BANK and test_driver keep covering the I/O path. A gate level
+# netlist has no m_{i} registers, there they fall back to the front door
+async def load_banks(dut, tiles):
+    # banks 0..3 hold tiles, returns the backdoor and a pyTpu holding the same banks
+    model = pyTpu(*CONFIG)
+    for bank, tile in enumerate(tiles):
+        model.load_bank(bank, np.full((4, 4), tile))
+    await FallingEdge(dut.clk)
+    if GATES:
+        for inp in [(op.SETMP, 0)] + [(op.WRITE, int(v)) for v in model.memory]:
+            dut.ui_in.value = int(inp[0])
+            dut.uio_in.value = inp[1]
+            await ClockCycles(dut.clk, 1)
+        await FallingEdge(dut.clk)
+        return None, model
+    backdoor = CocotbBackdoor(dut)
+    backdoor.restore(model.snapshot())
+    return backdoor, model
+
+async def issue(dut, model, *instructions):
+    # runs instructions on the chip and the model, returns once the chip settled after the last one
+    for inp in instructions:
+        dut.ui_in.value = int(inp[0])
+        dut.uio_in.value = inp[1]
+        await ClockCycles(dut.clk, 1)
+    model.run(pack_program(instructions))
+    await FallingEdge(dut.clk)
+
+async def dump_bank(dut, backdoor, bank):
+    if backdoor:
+        return backdoor.dump_bank(bank)
+    values = []
+    for inp in [(op.SETMP, 16*bank)] + [(op.READ, 0)]*16:
+        dut.ui_in.value = int(inp[0])
+        dut.uio_in.value = inp[1]
+        await ClockCycles(dut.clk, 1)
+        await FallingEdge(dut.clk)
+        values.append(int(dut.uo_out.value))
+    return np.array(values[1:]).reshape(4, 4)
+
 @cocotb.test()
 async def test_MMUL(dut):
     dut._log.info("Start")
@@ -107,46 +132,162 @@ async def test_MMUL(dut):
     await ClockCycles(dut.clk, 10)
     dut.rst_n.value = 1
 
-    dut._log.info("Test WRITE and READ operations")
+    dut._log.info("Test MMUL")
+
+    backdoor, model = await load_banks(dut, [1, 2, 3, 4])
+    await issue(dut, model, encode("MMUL a=1 b=2 c=3"))
+    result = await dump_bank(dut, backdoor, 3)
+    assert (result == 6).all() , f"mmul doesn't return correct result"
+    assert (result == model.dump_bank(3)).all()
+
+@cocotb.test()
+async def test_DOT(dut):
+    dut._log.info("Start")
+
+    # Set the clock period to 10 us (100 KHz)
+    clock = Clock(dut.clk, 10, units="us")
+    cocotb.start_soon(clock.start())
+
+    # Reset
+    dut._log.info("Reset")
+    dut.ena.value = 1
+    dut.ui_in.value = 0
+    dut.uio_in.value = 0
+    dut.rst_n.value = 0
+    await ClockCycles(dut.clk, 10)
+    dut.rst_n.value = 1
+
+    dut._log.info("Test DOT")
+
+    backdoor, model = await load_banks(dut, [1, 2, 3, 4])
+    await issue(dut, model, encode("DOT a=3 b=1 c=2"))
+    result = await dump_bank(dut, backdoor, 2)
+    assert result[0, 0] == 32 , f"dot doesn't return correct result"
+    assert (result == model.dump_bank(2)).all()
+
+@cocotb.test()
+async def test_SUM(dut):
+    dut._log.info("Start")
+
+    # Set the clock period to 10 us (100 KHz)
+    clock = Clock(dut.clk, 10, units="us")
+    cocotb.start_soon(clock.start())
+
+    # Reset
+    dut._log.info("Reset")
+    dut.ena.value = 1
+    dut.ui_in.value = 0
+    dut.uio_in.value = 0
+    dut.rst_n.value = 0
+    await ClockCycles(dut.clk, 10)
+    dut.rst_n.value = 1
+
+    dut._log.info("Test SUM")
+
+    backdoor, model = await load_banks(dut, [1, 2, 3, 4])
+    await issue(dut, model, encode("SUM a=2 b=0 c=0"))
+    assert dut.uo_out.value == 3*16 , f"sum doesn't return correct result"
+    assert dut.uo_out.value == model.output
+
+@cocotb.test()
+async def test_MATMUL(dut):
+    dut._log.info("Start")
+
+    # Set the clock period to 10 us (100 KHz)
+    clock = Clock(dut.clk, 10, units="us")
+    cocotb.start_soon(clock.start())
+
+    # Reset
+    dut._log.info("Reset")
+    dut.ena.value = 1
+    dut.ui_in.value = 0
+    dut.uio_in.value = 0
+    dut.rst_n.value = 0
+    await ClockCycles(dut.clk, 10)
+    dut.rst_n.value = 1
+
+    dut._log.info("Test MATMUL")
+
+    backdoor, model = await load_banks(dut, [1, 2, 3, 4])
+    await issue(dut, model, encode("MATMUL a=3 b=1 c=0"))
+    result = await dump_bank(dut, backdoor, 0)
+    assert (result == 32).all() , f"matmul doesn't return correct result"
+    assert (result == model.dump_bank(0)).all()
+
+@cocotb.test()
+async def test_MATMUL_ACC(dut):
+    dut._log.info("Start")
+
+    # Set the clock period to 10 us (100 KHz)
+    clock = Clock(dut.clk, 10, units="us")
+    cocotb.start_soon(clock.start())
+
+    # Reset
+    dut._log.info("Reset")
+    dut.ena.value = 1
+    dut.ui_in.value = 0
+    dut.uio_in.value = 0
+    dut.rst_n.value = 0
+    await ClockCycles(dut.clk, 10)
+    dut.rst_n.value = 1
+
+    dut._log.info("Test MATMUL_ACC and MMUL_ACC operations")
+
+    # 4 + 1*2*4 in bank 3, then 12 + 3*2 in bank 3
+    backdoor, model = await load_banks(dut, [1, 2, 3, 4])
+    await issue(dut, model, encode("MATMUL_ACC a=0 b=1 c=3"))
+    result = await dump_bank(dut, backdoor, 3)
+    assert (result == 12).all() , f"matmul_acc doesn't return correct result"
+    assert (result == model.dump_bank(3)).all()
+    await issue(dut, model, encode("MMUL_ACC a=2 b=1 c=3"))
+    result = await dump_bank(dut, backdoor, 3)
+    assert (result == 18).all() , f"mmul_acc doesn't return correct result"
+    assert (result == model.dump_bank(3)).all()
+
+@cocotb.test()
+async def test_MATVEC_ROWDOT(dut):
+    dut._log.info("Start")
+
+    # Set the clock period to 10 us (100 KHz)
+    clock = Clock(dut.clk, 10, units="us")
+    cocotb.start_soon(clock.start())
+
+    # Reset
+    dut._log.info("Reset")
+    dut.ena.value = 1
+    dut.ui_in.value = 0
+    dut.uio_in.value = 0
+    dut.rst_n.value = 0
+    await ClockCycles(dut.clk, 10)
+    dut.rst_n.value = 1
 
+    dut._log.info("Test MATVEC and ROWDOT operations")
+
+    # bank 0 holds 0..15, bank 1 holds 1
     inputs = [(op.SETMP, 0)]
     for i in range(16):
-        inputs.append((op.WRITE, 1))
+        inputs.append((op.WRITE, i))
     for i in range(16):
-        inputs.append((op.WRITE, 2))
-    for i in range(16):
-        inputs.append((op.WRITE, 3))
-    for i in range(16):
-        inputs.append((op.WRITE, 4))
-    # await ClockCycles(dut.clk, 1)
+        inputs.append((op.WRITE, 1))
+    # bank 0 @ row 0 of bank 1 into row 0 of bank 2, row dots of bank 0 and itself into bank 3
+    inputs.append(encode("MATVEC a=0 b=1 c=2"))
+    inputs.append(encode("ROWDOT a=0 b=0 c=3"))
     for inp in inputs:
         dut.ui_in.value = int(inp[0])
         dut.uio_in.value = inp[1]
         await ClockCycles(dut.clk, 1)
-    
-    inp2 = []
-    inp2.extend(int2list(1))
-    inp2.extend(int2list(2))
-    inp2.extend(int2list(3))
-    inp2.extend(int2list(0))
-    mmul = (op.MMUL, list2int((inp2)))
-    dut.ui_in.value= int(mmul[0])
-    dut.uio_in.value = mmul[1]
-    await ClockCycles(dut.clk, 1)
-    dut.ui_in.value = int(op.SETMP)
-    dut.uio_in.value = 16*3
-    await ClockCycles(dut.clk, 1)
-    once = True
-    for i in range(16):
-        dut.ui_in.value = int(op.READ)
+    for bank, expected in [(2, [6, 22, 38, 54]), (3, [14, 126, 366 % 256, 734 % 256])]:
+        dut.ui_in.value = int(op.SETMP)
+        dut.uio_in.value = 16*bank
         await ClockCycles(dut.clk, 1)
-        if once:
+        for i in range(4):
+            dut.ui_in.value = int(op.READ)
             await ClockCycles(dut.clk, 1)
-            once = False
-        assert dut.uo_out.value == 6 , f"mmul doesn't return correct result"
+            await FallingEdge(dut.clk)
+            assert dut.uo_out.value == expected[i] , f"Expected {expected[i]}, got {dut.uo_out.value} at bank {bank} i={i}"
 
 @cocotb.test()
-async def test_DOT(dut):
+async def test_WRITE2_READ2(dut):
     dut._log.info("Start")
 
     # Set the clock period to 10 us (100 KHz)
@@ -162,44 +303,35 @@ async def test_DOT(dut):
     await ClockCycles(dut.clk, 10)
     dut.rst_n.value = 1
 
-    dut._log.info("Test WRITE and READ operations")
+    dut._log.info("Test WRITE2 and READ2 operations")
 
+    # two nibbles per cycle, low nibble first
     inputs = [(op.SETMP, 0)]
-    for i in range(16):
-        inputs.append((op.WRITE, 1))
-    for i in range(16):
-        inputs.append((op.WRITE, 2))
-    for i in range(16):
-        inputs.append((op.WRITE, 3))
-    for i in range(16):
-        inputs.append((op.WRITE, 4))
-    # await ClockCycles(dut.clk, 1)
+    for i in range(8):
+        inputs.append((op.WRITE2, (2*i) | ((2*i + 1) << 4)))
+    inputs.append((op.SETMP, 0))
     for inp in inputs:
         dut.ui_in.value = int(inp[0])
         dut.uio_in.value = inp[1]
         await ClockCycles(dut.clk, 1)
-    
-    inp2 = []
-    inp2.extend(int2list(3))
-    inp2.extend(int2list(1))
-    inp2.extend(int2list(2))
-    inp2.extend(int2list(0))
-    dot = (op.DOT, list2int((inp2)))
-    dut.ui_in.value= int(dot[0])
-    dut.uio_in.value = dot[1]
-    await ClockCycles(dut.clk, 1)
-    dut.ui_in.value = int(op.SETMP)
-    dut.uio_in.value = 16*2
+    assert dut.uio_oe.value == 0, "uio must stay an input outside READ2"
+    # two bytes per cycle on uo_out and uio_out, sampled once they settled
+    for i in range(8):
+        dut.ui_in.value = int(op.READ2)
+        dut.uio_in.value = 0
+        await ClockCycles(dut.clk, 1)
+        await FallingEdge(dut.clk)
+        assert dut.uo_out.value == 2*i , f"Expected {2*i}, got {dut.uo_out.value} at i={i}"
+        assert dut.uio_out.value == 2*i + 1 , f"Expected {2*i + 1}, got {dut.uio_out.value} at i={i}"
+        assert dut.uio_oe.value == 0xff, "uio must be driven after READ2"
+    # the chip releases uio after the burst
+    dut.ui_in.value = int(op.NOOP)
     await ClockCycles(dut.clk, 1)
-    once = True
-    dut.ui_in.value = int(op.READ)
-    await ClockCycles(dut.clk, 2)
-    assert dut.uo_out.value == 32 , f"dot doesn't return correct result"
-
-
+    await FallingEdge(dut.clk)
+    assert dut.uio_oe.value == 0, "uio must be released after READ2"
 
 @cocotb.test()
-async def test_SUM(dut):
+async def test_dual_issue(dut):
     dut._log.info("Start")
 
     # Set the clock period to 10 us (100 KHz)
@@ -215,42 +347,38 @@ async def test_SUM(dut):
     await ClockCycles(dut.clk, 10)
     dut.rst_n.value = 1
 
-    dut._log.info("Test WRITE and READ operations")
+    dut._log.info("Test a MATMUL dual issued with a WRITE")
 
-    inputs = [(op.SETMP, 0)]
+    # bank 1 holds 1, bank 2 holds 0..15
+    inputs = [(op.SETMP, 16)]
     for i in range(16):
         inputs.append((op.WRITE, 1))
     for i in range(16):
-        inputs.append((op.WRITE, 2))
-    for i in range(16):
-        inputs.append((op.WRITE, 3))
-    for i in range(16):
-        inputs.append((op.WRITE, 4))
-    # await ClockCycles(dut.clk, 1)
+        inputs.append((op.WRITE, i))
+    # mp in bank 0: the MATMUL in the upper nibble computes bank 2 @ bank 1 into bank 3 while 7 is written at 0
+    inputs.append((op.SETMP, 0))
+    inputs.append(encode("WRITE 7 | MATMUL"))
+    inputs.append((op.SETMP, 48))
     for inp in inputs:
         dut.ui_in.value = int(inp[0])
         dut.uio_in.value = inp[1]
         await ClockCycles(dut.clk, 1)
-    
-    inp2 = []
-    inp2.extend(int2list(2))
-    inp2.extend(int2list(0))
-    inp2.extend(int2list(0))
-    inp2.extend(int2list(0))
-    sum = (op.SUM, list2int((inp2)))
-    dut.ui_in.value= int(sum[0])
-    dut.uio_in.value = sum[1]
-    await ClockCycles(dut.clk, 2)
-    # dut.ui_in.value = int(op.SETMP)
-    # dut.uio_in.value = 16*2
-    # await ClockCycles(dut.clk, 1)
-    # once = True
-    # dut.ui_in.value = int(op.READ)
-    # await ClockCycles(dut.clk, 2)
-    assert dut.uo_out.value == 3*16 , f"sum doesn't return correct result"
+    for i in range(16):
+        dut.ui_in.value = int(op.READ)
+        await ClockCycles(dut.clk, 1)
+        await FallingEdge(dut.clk)
+        expected = [6, 22, 38, 54][i // 4]
+        assert dut.uo_out.value == expected , f"Expected {expected}, got {dut.uo_out.value} at i={i}"
+    dut.ui_in.value = int(op.SETMP)
+    dut.uio_in.value = 0
+    await ClockCycles(dut.clk, 1)
+    dut.ui_in.value = int(op.READ)
+    await ClockCycles(dut.clk, 1)
+    await FallingEdge(dut.clk)
+    assert dut.uo_out.value == 7 , f"the WRITE next to the MATMUL must land, got {dut.uo_out.value}"
 
 @cocotb.test()
-async def test_MATMUL(dut):
+async def test_FILL_BANK(dut):
     dut._log.info("Start")
 
     # Set the clock period to 10 us (100 KHz)
@@ -266,46 +394,30 @@ async def test_MATMUL(dut):
     await ClockCycles(dut.clk, 10)
     dut.rst_n.value = 1
 
-    dut._log.info("Test WRITE and READ operations")
+    dut._log.info("Test FILL, COPY, TRANSPOSE and ZERO")
 
-    inputs = [(op.SETMP, 0)]
+    # bank 1 filled with 3, bank 2 holds 0..15
+    inputs = [(op.SETMP, 20), (op.FILL, 3), (op.SETMP, 32)]
     for i in range(16):
-        inputs.append((op.WRITE, 1))
-    for i in range(16):
-        inputs.append((op.WRITE, 2))
-    for i in range(16):
-        inputs.append((op.WRITE, 3))
-    for i in range(16):
-        inputs.append((op.WRITE, 4))
-    # await ClockCycles(dut.clk, 1)
+        inputs.append((op.WRITE, i))
+    inputs.append(encode("BANK TRANSPOSE a=2 c=3"))
+    inputs.append(encode("BANK COPY a=1 c=0"))
+    inputs.append(encode("BANK ZERO a=0 c=1"))
+    inputs.append((op.SETMP, 0))
     for inp in inputs:
         dut.ui_in.value = int(inp[0])
         dut.uio_in.value = inp[1]
         await ClockCycles(dut.clk, 1)
-    
-    inp2 = []
-    inp2.extend(int2list(3))
-    inp2.extend(int2list(1))
-    inp2.extend(int2list(0))
-    inp2.extend(int2list(0))
-    matmul = (op.MATMUL, list2int((inp2)))
-    dut.ui_in.value= int(matmul[0])
-    dut.uio_in.value = matmul[1]
-    await ClockCycles(dut.clk, 1)
-    dut.ui_in.value = int(op.SETMP)
-    dut.uio_in.value = 0
-    await ClockCycles(dut.clk, 1)
-    once = True
-    for i in range(16):
+    # bank 0 is a copy of the filled bank 1, bank 1 is zeroed, bank 3 is bank 2 transposed
+    expected = [3]*16 + [0]*16 + list(range(16)) + [(i % 4)*4 + i // 4 for i in range(16)]
+    for i in range(64):
         dut.ui_in.value = int(op.READ)
         await ClockCycles(dut.clk, 1)
-        if once:
-            await ClockCycles(dut.clk, 1)
-            once = False
-        assert dut.uo_out.value == 32 , f"matmul doesn't return correct result"
+        await FallingEdge(dut.clk)
+        assert dut.uo_out.value == expected[i] , f"Expected {expected[i]}, got {dut.uo_out.value} at i={i}"
 
 @cocotb.test()
-async def test_full_random(dut):
+async def test_driver(dut):
     dut._log.info("Start")
 
     # Set the clock period to 10 us (100 KHz)
@@ -321,11 +433,37 @@ async def test_full_random(dut):
     await ClockCycles(dut.clk, 10)
     dut.rst_n.value = 1
 
-    dut._log.info("Test all possible ionputs")
+    dut._log.info("Test batches through TpuDriver")
 
-    for i in range(256):
-        for j in range(256):
-            dut.ui_in.value = i
-            dut.uio_in.value = j
-            await ClockCycles(dut.clk, 1)
-            assert dut.rst_n.value == 1 
\ No newline at end of file
+    driver = TpuDriver(CocotbBackend(dut))
+    load = await driver.submit(assemble("SETMP 0\nFILL 2\nSETMP 16\nFILL 3\nMATMUL a=0 b=1 c=2"))
+    outputs = await driver.run(assemble("SETMP 32\nREAD\nREAD2\nNOOP\nSUM a=2"))
+    assert load.done and len(load.outputs) == 0
+    assert list(outputs) == [24, 24, 24, 128], f"Expected [24, 24, 24, 128], got {list(outputs)}"
+    await driver.close()
+
+@cocotb.test()
+async def test_full_random(dut):
+    dut._log.info("Start")
+
+    # Set the clock period to 10 us (100 KHz)
+    clock = Clock(dut.clk, 10, units="us")
+    cocotb.start_soon(clock.start())
+
+    # Reset
+    dut._log.info("Reset")
+    dut.ena.value = 1
+    dut.ui_in.value = 0
+    dut.uio_in.value = 0
+    dut.rst_n.value = 0
+    await ClockCycles(dut.clk, 10)
+    dut.rst_n.value = 1
+
+    # all possible inputs by default, or a shard of scoreboard.regress
+    args = shard_args()
+    dut._log.info(f"Test the {args['stimulus']} stimulus, shard {args['shard']} of {args['shards']}, against pyTpu")
+    report = await run_shard(dut, args)
+    for f in report["first"]:
+        dut._log.error(f"cycle {f['cycle']}: {f['op']} ui_in=0x{f['ui_in']:02x} uio_in=0x{f['uio_in']:02x} "
+                       f"expected {f['expected']} got {f['got']}")
+    assert not report["mismatches"] , f"{report['mismatches']} of {report['cycles']} cycles don't match pyTpu"